@@ -0,0 +1,129 @@
+"""
+asyncio 복원 지연 시간 벤치마크
+이벤트 루프에서 JasoJamoDecoder.detokenize를 바로 호출하는 방식과
+AsyncJasoJamoDecoder(긴 입력은 작업자 풀로 넘김)를 요청 크기별 지연 시간 백분위수로 비교
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import AsyncJasoJamoDecoder, JasoJamoDecoder, tokenize
+
+SAMPLE_TEXT = "안녕하세요 반갑습니다 가요ㅋㅋㅋ 값을깎다 네ㅇㅋ Python으로 개발했어요! "
+
+PERCENTILES = (50, 90, 99, 100)
+
+
+def percentile(sorted_values, p: float) -> float:
+    """정렬된 값의 p 백분위수 (최근접 순위)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class BlockingDecoder:
+    """비교 기준: 이벤트 루프에서 동기 디코더를 그대로 호출"""
+
+    def __init__(self):
+        self._decoder = JasoJamoDecoder()
+
+    async def detokenize(self, tokens):
+        return self._decoder.detokenize(tokens)
+
+
+async def run_workload(decoder, small, large, requests: int, interval: float, large_every: int):
+    """일정 간격으로 요청을 보내고 요청 종류별 지연 시간(초) 목록 반환"""
+    latencies = {"small": [], "large": []}
+    loop = asyncio.get_running_loop()
+
+    async def handle(kind, tokens, arrival):
+        await decoder.detokenize(tokens)
+        latencies[kind].append(loop.time() - arrival)
+
+    tasks = []
+    start = loop.time()
+    for i in range(requests):
+        # 도착 예정 시각까지 대기 (루프가 막혀 늦게 깨어나도 예정 시각 기준으로 측정)
+        arrival = start + i * interval
+        delay = arrival - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if large_every and i % large_every == large_every // 2:
+            tasks.append(asyncio.ensure_future(handle("large", large, arrival)))
+        else:
+            tasks.append(asyncio.ensure_future(handle("small", small, arrival)))
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="asyncio 복원 지연 시간 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000, help="요청 수")
+    parser.add_argument("--interval-ms", type=float, default=1.0, help="요청 간격 (ms)")
+    parser.add_argument("--small-tokens", type=int, default=64, help="작은 요청 토큰 수")
+    parser.add_argument("--large-tokens", type=int, default=200000, help="큰 요청 토큰 수")
+    parser.add_argument("--large-every", type=int, default=200, help="큰 요청 빈도 (N개마다 1개)")
+    parser.add_argument(
+        "--inline-threshold", type=int, default=None, help="바로 복원할 최대 토큰 수"
+    )
+    parser.add_argument("--max-concurrency", type=int, default=None, help="작업자 풀 동시 실행 수")
+    args = parser.parse_args()
+
+    base = tokenize(SAMPLE_TEXT)
+    tokens = base * (max(args.large_tokens, args.small_tokens) // len(base) + 1)
+    small = tokens[: args.small_tokens]
+    large = tokens[: args.large_tokens]
+
+    options = {}
+    if args.inline_threshold is not None:
+        options["inline_threshold"] = args.inline_threshold
+    if args.max_concurrency is not None:
+        options["max_concurrency"] = args.max_concurrency
+
+    print("=" * 72)
+    print(
+        f"asyncio 복원 지연 시간 (요청 {args.requests:,}개, 간격 {args.interval_ms}ms, "
+        f"작은 요청 {len(small)} / 큰 요청 {len(large):,} 토큰)"
+    )
+    print("=" * 72)
+    header = "".join(f"{'p' + str(p) if p < 100 else 'max':>10}" for p in PERCENTILES)
+    print(f"{'방식':<22}{'요청':<8}{header}  (ms)")
+
+    for name, make in (
+        ("동기 호출 (블로킹)", BlockingDecoder),
+        ("AsyncJasoJamoDecoder", lambda: AsyncJasoJamoDecoder(**options)),
+    ):
+        decoder = make()
+        started = time.perf_counter()
+        latencies = asyncio.run(
+            run_workload(
+                decoder,
+                small,
+                large,
+                args.requests,
+                args.interval_ms / 1000,
+                args.large_every,
+            )
+        )
+        elapsed = time.perf_counter() - started
+        if hasattr(decoder, "close"):
+            decoder.close()
+        for kind in ("small", "large"):
+            values = sorted(latencies[kind])
+            if not values:
+                continue
+            cells = "".join(f"{percentile(values, p) * 1000:>10.2f}" for p in PERCENTILES)
+            print(f"{name:<22}{kind:<8}{cells}")
+        print(f"{'':<22}{'전체':<8}{elapsed:>10.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+배치 API 벤치마크
+문장마다 tokenize/detokenize를 호출하는 방식과 tokenize_batch/detokenize_batch 비교
+(문장당 토크나이저/디코더 생성 비용 측정)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import (
+    JasoJamoDecoder,
+    JasoJamoTokenizer,
+    detokenize,
+    detokenize_batch,
+    tokenize,
+    tokenize_batch,
+)
+
+SAMPLE_SENTENCES = [
+    "안녕하세요",
+    "감사합니다",
+    "가요ㅋㅋㅋ",
+    "네ㅇㅋ",
+    "한글 자소 분리와 복원",
+    "Python으로 개발했어요",
+    "값을깎다",
+    "ㅋㅋㅋ 재밌다",
+]
+
+
+def measure(func, repeat: int) -> float:
+    """최소 실행 시간 측정 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="배치 API 벤치마크")
+    parser.add_argument("--sentences", type=int, default=20000, help="문장 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    sentences = (SAMPLE_SENTENCES * (args.sentences // len(SAMPLE_SENTENCES) + 1))[: args.sentences]
+    token_lists = [tokenize(s) for s in sentences]
+    n = len(sentences)
+
+    # 객체 생성 비용
+    init_tok = measure(lambda: [JasoJamoTokenizer() for _ in range(n)], args.repeat)
+    init_dec = measure(lambda: [JasoJamoDecoder() for _ in range(n)], args.repeat)
+
+    # 문장별 호출 vs 배치
+    per_call_tok = measure(lambda: [tokenize(s) for s in sentences], args.repeat)
+    batch_tok = measure(lambda: list(tokenize_batch(sentences)), args.repeat)
+    per_call_dec = measure(lambda: [detokenize(t) for t in token_lists], args.repeat)
+    batch_dec = measure(lambda: list(detokenize_batch(token_lists)), args.repeat)
+
+    # 결과가 동일한지 확인
+    assert list(tokenize_batch(sentences)) == token_lists
+    assert list(detokenize_batch(token_lists)) == [detokenize(t) for t in token_lists]
+
+    print("=" * 60)
+    print(f"배치 API 벤치마크 (문장 수: {n:,}개)")
+    print("=" * 60)
+    print(f"{'항목':<28}{'전체 (ms)':>12}{'문장당 (us)':>14}")
+    rows = [
+        ("JasoJamoTokenizer() 생성", init_tok),
+        ("JasoJamoDecoder() 생성", init_dec),
+        ("tokenize (문장별 호출)", per_call_tok),
+        ("tokenize_batch", batch_tok),
+        ("detokenize (문장별 호출)", per_call_dec),
+        ("detokenize_batch", batch_dec),
+    ]
+    for name, elapsed in rows:
+        print(f"{name:<28}{elapsed * 1000:>12.3f}{elapsed / n * 1e6:>14.3f}")
+
+    print("-" * 60)
+    print(f"tokenize 문장당 절감: {(per_call_tok - batch_tok) / n * 1e6:.3f} us")
+    print(f"detokenize 문장당 절감: {(per_call_dec - batch_dec) / n * 1e6:.3f} us")
+
+
+if __name__ == "__main__":
+    main()
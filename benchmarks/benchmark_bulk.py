@@ -0,0 +1,71 @@
+"""
+일괄 처리(jaso_jamo.bulk) 병렬 확장성 벤치마크
+워커 수를 늘려가며 처리량과 병렬 효율(속도 향상 / 워커 수)을 측정
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import bulk
+
+SAMPLE_LINES = [
+    "안녕하세요 반갑습니다 오늘 날씨가 정말 좋네요",
+    "가요ㅋㅋㅋ 값을깎다 바다ㄱㄱ 네ㅇㅋ",
+    "Python으로 개발했어요! 한글 자소 분리와 복원",
+]
+
+
+def build_corpus(path: Path, megabytes: float) -> None:
+    """약 megabytes 크기의 말뭉치 파일 생성"""
+    block = ("\n".join(SAMPLE_LINES) + "\n").encode("utf-8")
+    count = int(megabytes * 1e6 // len(block)) + 1
+    with open(path, "wb") as f:
+        for _ in range(count):
+            f.write(block)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="일괄 처리 병렬 확장성 벤치마크")
+    parser.add_argument("--input", type=str, default=None, help="입력 파일 (기본값: 합성 말뭉치)")
+    parser.add_argument("--size-mb", type=float, default=50.0, help="합성 말뭉치 크기 (MB)")
+    parser.add_argument("--mode", choices=bulk.MODES, default=bulk.MODE_ROUNDTRIP, help="처리 모드")
+    parser.add_argument(
+        "--jobs",
+        type=str,
+        default=",".join(str(j) for j in sorted({1, 2, 4, os.cpu_count() or 1})),
+        help="측정할 워커 수 (쉼표 구분)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source = Path(args.input) if args.input else tmp / "corpus.txt"
+        if not args.input:
+            build_corpus(source, args.size_mb)
+
+        print("=" * 60)
+        print(f"일괄 처리 병렬 확장성 ({args.mode}, CPU {os.cpu_count()}개)")
+        print("=" * 60)
+        print(f"{'워커':>6}{'시간 (s)':>12}{'MB/s':>10}{'속도 향상':>12}{'효율':>10}")
+
+        base = None
+        for jobs in [int(j) for j in args.jobs.split(",")]:
+            report = bulk.run_bulk([source], tmp / "out.txt", mode=args.mode, jobs=jobs)
+            if base is None:
+                base = report.seconds
+            speedup = base / report.seconds
+            print(
+                f"{jobs:>6}{report.seconds:>12.2f}{report.mb_per_sec:>10.1f}"
+                f"{speedup:>11.2f}x{speedup / jobs:>10.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
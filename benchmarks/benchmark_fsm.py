@@ -0,0 +1,100 @@
+"""
+FSM 엔진 벤치마크
+5단계 Fallback 엔진(기본)과 단일 패스 FSM 엔진(use_fsm=True),
+NumPy 벡터화 엔진(use_numpy=True, numpy 설치 시)의 결과 일치 여부와 속도 비교
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, tokenize
+
+try:
+    import numpy  # noqa: F401
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+SAMPLE_TEXT = "안녕하세요 반갑습니다 Hello 가요ㅋㅋㅋ 값을깎다 바다ㄱㄱ 네ㅇㅋ "
+
+
+def load_report_corpus(report_dir: Path) -> list:
+    """report/*.md 에러 리포트의 원본 문장 수집"""
+    sentences = []
+    for path in sorted(report_dir.glob("*.md")):
+        content = path.read_text(encoding="utf-8")
+        sentences.extend(re.findall(r"\*\*원본\*\*\n```\n(.*?)\n```", content, re.S))
+    return sentences
+
+
+def measure(func, repeat: int) -> float:
+    """최소 실행 시간 측정 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="FSM 엔진 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument("--doc-tokens", type=int, default=200000, help="긴 문서 토큰 수")
+    args = parser.parse_args()
+
+    report_dir = Path(__file__).parent.parent / "report"
+    sentences = load_report_corpus(report_dir)
+    token_lists = [tokenize(s) for s in sentences]
+
+    unit = tokenize(SAMPLE_TEXT)
+    document = (unit * (args.doc_tokens // len(unit) + 1))[: args.doc_tokens]
+
+    print("=" * 60)
+    print("FSM 엔진 벤치마크")
+    print("=" * 60)
+
+    # 결과 일치 확인 (check_slang_mid 두 가지 모두)
+    for mid in (False, True):
+        stage = JasoJamoDecoder(check_slang_mid=mid)
+        engines = [JasoJamoDecoder(check_slang_mid=mid, use_fsm=True)]
+        if HAS_NUMPY:
+            engines.append(JasoJamoDecoder(check_slang_mid=mid, use_numpy=True))
+        for tokens in token_lists + [document]:
+            expected = stage.detokenize(tokens)
+            if any(engine.detokenize(tokens) != expected for engine in engines):
+                print(f"실패: 결과 불일치 (check_slang_mid={mid})")
+                sys.exit(1)
+    print(f"결과 일치: 리포트 문장 {len(token_lists):,}개 + 긴 문서 {len(document):,} 토큰")
+
+    stage = JasoJamoDecoder()
+    engines = [("FSM", JasoJamoDecoder(use_fsm=True))]
+    if HAS_NUMPY:
+        engines.append(("NumPy", JasoJamoDecoder(use_numpy=True)))
+    cases = [
+        ("리포트 문장", lambda d: [d.detokenize(t) for t in token_lists]),
+        ("긴 문서", lambda d: d.detokenize(document)),
+    ]
+
+    print("-" * 60)
+    print(f"{'입력':<16}{'엔진':<8}{'5단계 (ms)':>14}{'엔진 (ms)':>14}{'속도 향상':>12}")
+    for name, run in cases:
+        t_stage = measure(lambda: run(stage), args.repeat)
+        for engine_name, engine in engines:
+            t_engine = measure(lambda: run(engine), args.repeat)
+            print(
+                f"{name:<16}{engine_name:<8}{t_stage * 1000:>14.3f}"
+                f"{t_engine * 1000:>14.3f}{t_stage / t_engine:>11.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+인스턴스 메모리 벤치마크
+분리기/복원기/엔진 인스턴스 하나가 차지하는 바이트 수를 tracemalloc으로 측정
+(테넌트마다 슬랭 옵션이 다른 디코더를 여러 개 유지하는 경우의 메모리)
+같은 속성 값을 인스턴스 __dict__에 담은 사본(__slots__ 도입 전 구조)과 나란히 비교
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import (
+    JasoJamoDecoder,
+    JasoJamoEngine,
+    JasoJamoTokenizer,
+    StreamingJasoJamoDecoder,
+)
+from jaso_jamo.slang import SlangTrie
+from jaso_jamo.tables import DEFAULT_SPECIAL_SLANG
+
+# 원래 클래스 → __slots__ 없는 비교용 클래스
+_UNSLOTTED = {}
+
+
+def unslotted_copy(obj):
+    """__slots__ 도입 전 구조의 사본: 슬롯 속성 값을 인스턴스 __dict__에 담은 객체
+
+    패키지의 슬롯 객체(어절 캐시, 슬랭 사전 등)도 재귀적으로 바꾸고, 인스턴스끼리
+    공유하는 슬랭 트라이는 그대로 참조합니다.
+    """
+    cls = type(obj)
+    if isinstance(obj, SlangTrie) or not cls.__module__.startswith("jaso_jamo."):
+        return obj
+    names = [name for klass in cls.__mro__ for name in getattr(klass, "__slots__", ())]
+    if not names:
+        return obj
+    # 원래 클래스마다 따로 만들어 속성 이름이 같은 인스턴스끼리만 키를 공유하도록 함
+    unslotted = _UNSLOTTED.get(cls)
+    if unslotted is None:
+        unslotted = _UNSLOTTED[cls] = type(cls.__name__ + "Unslotted", (), {})
+    copy = unslotted()
+    for name in names:
+        if hasattr(obj, name):
+            setattr(copy, name, unslotted_copy(getattr(obj, name)))
+    return copy
+
+
+def memory_footprint(factory, count: int = 1000) -> float:
+    """factory()로 만든 인스턴스 하나당 평균 할당 바이트 (tracemalloc)
+
+    공유 테이블처럼 한 번만 만드는 객체가 측정에 섞이지 않도록 한 번 미리 생성하고,
+    count개를 동시에 살려 둔 상태의 할당량을 count로 나눕니다.
+    """
+    factory()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # 인스턴스를 담은 리스트 자체의 크기는 제외
+    return (after - before - sys.getsizeof(instances)) / count
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="인스턴스 메모리 벤치마크")
+    parser.add_argument("--count", type=int, default=1000, help="측정할 인스턴스 수")
+    parser.add_argument("--tenants", type=int, default=1000, help="테넌트 디코더 수")
+    parser.add_argument("--slang-variants", type=int, default=10, help="서로 다른 슬랭 옵션 수")
+    args = parser.parse_args()
+
+    # 기본 사전에 항목 하나씩을 더한 서로 다른 슬랭 목록
+    custom = [tuple(DEFAULT_SPECIAL_SLANG) + ("ㅋ" * (i + 3),) for i in range(args.slang_variants)]
+    cases = [
+        ("JasoJamoTokenizer()", JasoJamoTokenizer),
+        ("JasoJamoDecoder()", JasoJamoDecoder),
+        ("JasoJamoDecoder(check_slang_mid=True)", lambda: JasoJamoDecoder(check_slang_mid=True)),
+        ("JasoJamoDecoder(special_slang=...)", lambda: JasoJamoDecoder(special_slang=custom[0])),
+        ("StreamingJasoJamoDecoder()", StreamingJasoJamoDecoder),
+        ("JasoJamoEngine(warmup=False)", lambda: JasoJamoEngine(warmup=False)),
+    ]
+
+    print("=" * 72)
+    print(f"인스턴스 메모리 (인스턴스 {args.count:,}개 평균 바이트, tracemalloc)")
+    print("=" * 72)
+    print(f"{'인스턴스':<40}{'__dict__':>10}{'__slots__':>11}{'절감':>9}")
+    for name, factory in cases:
+        slotted = memory_footprint(factory, args.count)
+        unslotted = memory_footprint(lambda: unslotted_copy(factory()), args.count)
+        saved = 1 - slotted / unslotted if unslotted else 0.0
+        print(f"{name:<40}{unslotted:>10,.0f}{slotted:>11,.0f}{saved:>9.0%}")
+
+    # 테넌트마다 옵션이 다른 디코더 (슬랭 옵션 종류는 제한적)
+    def tenant_decoders():
+        return [
+            JasoJamoDecoder(
+                check_slang_mid=i % 2 == 1, special_slang=custom[i % len(custom)], use_fsm=True
+            )
+            for i in range(args.tenants)
+        ]
+
+    print("-" * 72)
+    print(f"테넌트 디코더 {args.tenants:,}개 (슬랭 {len(custom)}종, 공유 트라이 제외)")
+    for label, factory in (
+        ("__dict__", lambda: [unslotted_copy(d) for d in tenant_decoders()]),
+        ("__slots__", tenant_decoders),
+    ):
+        total = memory_footprint(factory, 1)
+        print(
+            f"  {label:<10}전체 {total / 1024:,.1f} KiB, "
+            f"디코더당 {total / args.tenants:,.0f} 바이트"
+        )
+
+
+if __name__ == "__main__":
+    main()
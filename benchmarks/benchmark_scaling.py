@@ -0,0 +1,77 @@
+"""
+detokenize 입력 크기 확장성 벤치마크
+입력 토큰 수를 늘려가며 토큰당 처리 시간이 일정한지(선형 확장) 확인
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, tokenize
+
+# 짧은 어절이 많은 입력 (단어 경계 탐색 횟수 최대화)
+UNIT_TEXT = "가요 네 한글 값을깎다 바다ㄱㄱ 가요ㅋㅋㅋ "
+
+
+def build_tokens(size: int) -> list:
+    """size개 토큰으로 구성된 입력 생성"""
+    unit = tokenize(UNIT_TEXT)
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="detokenize 확장성 벤치마크")
+    parser.add_argument(
+        "--sizes",
+        type=str,
+        default="10000,50000,100000,250000,500000,1000000",
+        help="측정할 토큰 수 (쉼표 구분)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=2.0,
+        help="최소 입력 대비 토큰당 시간 허용 배율 (초과 시 실패)",
+    )
+    args = parser.parse_args()
+
+    decoder = JasoJamoDecoder()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    print("=" * 60)
+    print("detokenize 확장성 벤치마크")
+    print("=" * 60)
+    print(f"{'토큰 수':>12}{'시간 (ms)':>14}{'토큰당 (ns)':>14}{'배율':>10}")
+
+    base = None
+    worst = 0.0
+    for size in sizes:
+        tokens = build_tokens(size)
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            decoder.detokenize(tokens)
+            best = min(best, time.perf_counter() - start)
+
+        per_token = best / size * 1e9
+        if base is None:
+            base = per_token
+        ratio = per_token / base
+        worst = max(worst, ratio)
+        print(f"{size:>12,}{best * 1000:>14.3f}{per_token:>14.1f}{ratio:>10.2f}")
+
+    print("-" * 60)
+    if worst > args.max_ratio:
+        print(f"실패: 토큰당 시간이 {worst:.2f}배 증가 (허용 {args.max_ratio:.2f}배)")
+        sys.exit(1)
+    print(f"선형 확장 확인: 최대 배율 {worst:.2f}배 (허용 {args.max_ratio:.2f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+시작 시간 벤치마크
+새 프로세스에서 import jaso_jamo 시간(-X importtime 누적값)과
+첫 tokenize / detokenize 호출 지연 시간을 측정하고, 기준값을 넘으면 실패로 종료
+(CLI 한 번 실행, 서버리스 콜드 스타트처럼 프로세스가 짧게 사는 경우의 비용)
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+
+ROOT = Path(__file__).parent.parent
+
+# import 후 로드되어 있으면 안 되는 무거운 모듈 (실제로 쓸 때만 가져옴)
+HEAVY_MODULES = ("asyncio", "concurrent.futures", "json", "pathlib", "numpy")
+
+# 새 프로세스에서 실행할 측정 코드 (결과는 JSON 한 줄)
+PROBE = """
+import sys, time
+t0 = time.perf_counter()
+import jaso_jamo
+t1 = time.perf_counter()
+from jaso_jamo import tables
+# 이전 버전(import 시 테이블 생성)과도 비교할 수 있도록 _TABLES가 없으면 생성된 것으로 봄
+tables_built = getattr(tables, "_TABLES", True) is not None
+heavy = [m for m in {heavy!r} if m in sys.modules]
+tokens = jaso_jamo.tokenize("안녕하세요 가요ㅋㅋㅋ")
+t2 = time.perf_counter()
+jaso_jamo.detokenize(tokens)
+t3 = time.perf_counter()
+jaso_jamo.detokenize(tokens)
+t4 = time.perf_counter()
+import json
+print(json.dumps({{
+    "import": t1 - t0,
+    "tokenize": t2 - t1,
+    "detokenize": t3 - t2,
+    "detokenize_warm": t4 - t3,
+    "tables_built": tables_built,
+    "heavy": heavy,
+}}))
+"""
+
+
+def _run_python(args, env):
+    result = subprocess.run(
+        [sys.executable] + args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=str(ROOT),
+        env=env,
+        check=True,
+    )
+    return result.stdout.decode("utf-8"), result.stderr.decode("utf-8")
+
+
+def importtime_ms(env) -> float:
+    """-X importtime 출력에서 jaso_jamo 패키지 누적 import 시간 (ms)"""
+    _, stderr = _run_python(["-X", "importtime", "-c", "import jaso_jamo"], env)
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "jaso_jamo":
+            return int(parts[1]) / 1000
+    raise RuntimeError("importtime 출력에서 jaso_jamo를 찾을 수 없습니다")
+
+
+def first_call(env) -> dict:
+    """새 프로세스에서 import / 첫 호출 시간 측정"""
+    stdout, _ = _run_python(["-c", PROBE.format(heavy=HEAVY_MODULES)], env)
+    return json.loads(stdout)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=7, help="새 프로세스 실행 횟수 (중앙값 사용)")
+    parser.add_argument(
+        "--max-import-ms", type=float, default=None, help="import 시간 기준값 (넘으면 실패)"
+    )
+    parser.add_argument(
+        "--max-first-call-ms",
+        type=float,
+        default=None,
+        help="첫 tokenize / detokenize 호출 시간 기준값 (넘으면 실패)",
+    )
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+    # .pyc 생성 비용이 첫 실행에만 섞이지 않도록 한 번 미리 실행
+    first_call(env)
+
+    import_times = [importtime_ms(env) for _ in range(args.runs)]
+    probes = [first_call(env) for _ in range(args.runs)]
+
+    def med_ms(key):
+        return median(p[key] for p in probes) * 1000
+
+    print("=" * 60)
+    print(f"시작 시간 벤치마크 (새 프로세스 {args.runs}회, 중앙값)")
+    print("=" * 60)
+    print(f"{'import jaso_jamo (-X importtime)':<36}{median(import_times):>12.2f} ms")
+    print(f"{'import jaso_jamo (perf_counter)':<36}{med_ms('import'):>12.2f} ms")
+    print(f"{'첫 tokenize':<36}{med_ms('tokenize'):>12.2f} ms")
+    print(f"{'첫 detokenize':<36}{med_ms('detokenize'):>12.2f} ms")
+    print(f"{'두 번째 detokenize':<36}{med_ms('detokenize_warm'):>12.2f} ms")
+
+    failures = []
+    if any(p["tables_built"] for p in probes):
+        failures.append("import 시 자모 테이블이 생성됨")
+    heavy = sorted({m for p in probes for m in p["heavy"]})
+    if heavy:
+        failures.append(f"import 시 무거운 모듈 로드: {', '.join(heavy)}")
+    if args.max_import_ms is not None and median(import_times) > args.max_import_ms:
+        failures.append(f"import 시간 {median(import_times):.2f}ms > {args.max_import_ms}ms")
+    if args.max_first_call_ms is not None:
+        for key in ("tokenize", "detokenize"):
+            if med_ms(key) > args.max_first_call_ms:
+                failures.append(f"첫 {key} {med_ms(key):.2f}ms > {args.max_first_call_ms}ms")
+
+    print("-" * 60)
+    if failures:
+        for failure in failures:
+            print(f"실패: {failure}")
+        sys.exit(1)
+    print("통과: import 시 테이블 생성 없음, 무거운 모듈 로드 없음")
+
+
+if __name__ == "__main__":
+    main()
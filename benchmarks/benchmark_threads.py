@@ -0,0 +1,131 @@
+"""
+멀티스레드 동시 복원 벤치마크
+요청마다 JasoJamoDecoder를 생성하는 방식과 JasoJamoEngine 하나를 공유하는 방식을
+ThreadPoolExecutor 스레드 수별로 비교 (처리량, 요청당 메모리 할당, 테이블 컴파일 횟수)
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, JasoJamoEngine, tokenize
+from jaso_jamo.fsm import compile_fsm
+from jaso_jamo.slang import _compile_slang
+
+SAMPLE_SENTENCES = [
+    "안녕하세요 반갑습니다",
+    "가요ㅋㅋㅋ네",
+    "네ㅇㅋ 바다ㄱㄱ",
+    "한글 자소 분리와 복원",
+    "Python으로 개발했어요!",
+    "값을깎다",
+]
+
+CUSTOM_SLANG = ("ㅇㅋ", "ㄹㅇ", "ㄱㄴㄷ")
+
+
+def per_request_decoder(job):
+    """요청마다 디코더 생성 (설정 객체를 매번 만듦)"""
+    tokens, mid, slang = job
+    if slang is None:
+        return JasoJamoDecoder(check_slang_mid=mid, use_fsm=True).detokenize(tokens)
+    return JasoJamoDecoder(check_slang_mid=mid, special_slang=slang, use_fsm=True).detokenize(
+        tokens
+    )
+
+
+def make_shared_engine_handler(engine):
+    """엔진 하나를 공유하고 요청 옵션은 인자로 전달"""
+
+    def handle(job):
+        tokens, mid, slang = job
+        return engine.detokenize(tokens, check_slang_mid=mid, special_slang=slang)
+
+    return handle
+
+
+def run(handler, jobs, threads: int) -> float:
+    """스레드 풀로 모든 요청 처리 시간 (초)"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for _ in pool.map(handler, jobs, chunksize=64):
+            pass
+    return time.perf_counter() - start
+
+
+def peak_per_request(handler, jobs) -> float:
+    """요청 하나를 처리하는 동안의 평균 최대 할당 바이트 (tracemalloc, 단일 스레드)"""
+    total = 0
+    for job in jobs:
+        tracemalloc.start()
+        handler(job)
+        total += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return total / len(jobs)
+
+
+def compile_count(handler, jobs) -> int:
+    """요청 처리 중 새로 컴파일된 FSM 정규식/슬랭 트라이 수"""
+    fsm_misses = compile_fsm.cache_info().misses
+    slang_misses = _compile_slang.cache_info().misses
+    for job in jobs:
+        handler(job)
+    return (
+        compile_fsm.cache_info().misses
+        - fsm_misses
+        + _compile_slang.cache_info().misses
+        - slang_misses
+    )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="멀티스레드 동시 복원 벤치마크")
+    parser.add_argument("--requests", type=int, default=20000, help="요청 수")
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 2, 4, 8], help="스레드 수 목록"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    token_lists = [tokenize(s) for s in SAMPLE_SENTENCES]
+    jobs = [
+        (token_lists[i % len(token_lists)], i % 2 == 1, CUSTOM_SLANG if i % 3 == 0 else None)
+        for i in range(args.requests)
+    ]
+    engine = JasoJamoEngine()
+    shared = make_shared_engine_handler(engine)
+
+    # 결과가 동일한지 확인
+    assert [shared(job) for job in jobs[:600]] == [per_request_decoder(job) for job in jobs[:600]]
+
+    print("=" * 64)
+    print(f"멀티스레드 동시 복원 벤치마크 (요청 수: {len(jobs):,}개)")
+    print("=" * 64)
+    print(f"{'스레드':>6}{'요청별 디코더 (req/s)':>24}{'공유 엔진 (req/s)':>22}{'배율':>10}")
+    for threads in args.threads:
+        per_request = min(run(per_request_decoder, jobs, threads) for _ in range(args.repeat))
+        engine_time = min(run(shared, jobs, threads) for _ in range(args.repeat))
+        print(
+            f"{threads:>6}{len(jobs) / per_request:>24,.0f}{len(jobs) / engine_time:>22,.0f}"
+            f"{per_request / engine_time:>10.2f}x"
+        )
+
+    print("-" * 64)
+    sample = jobs[:2000]
+    print(f"{'':<16}{'요청당 최대 할당 (B)':>22}{'추가 컴파일 (회)':>20}")
+    for name, handler in (("요청별 디코더", per_request_decoder), ("공유 엔진", shared)):
+        print(
+            f"{name:<16}{peak_per_request(handler, sample):>22,.0f}"
+            f"{compile_count(handler, sample):>20,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,6 @@ import sys
 import io
 import time
 import math
-import random
 import argparse
 from pathlib import Path
 from typing import List, Dict
@@ -21,6 +20,7 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from jaso_jamo import tokenize, detokenize
+from jaso_jamo.reader import sample_sentences
 from benchmarks.baseline_libraries import (
     UnicodedataDetokenizer,
     GreedyDetokenizer,
@@ -346,28 +346,17 @@ def load_test_cases(file_path: str, sample_size: int = 0) -> List[str]:
     Returns:
         테스트 케이스 리스트
     """
-    test_cases = []
-
     try:
         print(f"테스트 케이스 로드 중: {file_path}")
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # 텍스트를 문장 단위로 분리 (줄바꿈, 마침표, 느낌표, 물음표 기준)
-        import re
-
-        sentences = re.split(r"[\n.!?]+", content)
-
-        # 빈 문장 제거 및 공백 정리
-        test_cases = [s.strip() for s in sentences if s.strip()]
 
-        total_count = len(test_cases)
+        # 파일을 mmap으로 열어 문장 단위로 순회 (줄바꿈, 마침표, 느낌표, 물음표 기준)
+        # 샘플링 시 저장소 샘플링으로 표본만 메모리에 유지
+        test_cases, total_count = sample_sentences(file_path, sample_size)
         print(f"전체 문장 수: {total_count:,}개")
 
         # 샘플링
         if sample_size > 0 and sample_size < total_count:
             print(f"랜덤 샘플링: {sample_size:,}개")
-            test_cases = random.sample(test_cases, sample_size)
         elif sample_size > 0:
             print(
                 f"경고: 요청 샘플 수({sample_size:,})가 전체({total_count:,})보다 많습니다. 전체를 사용합니다."
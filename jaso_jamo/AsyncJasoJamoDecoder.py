@@ -0,0 +1,174 @@
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
+
+from .JasoJamoDecoder import JasoJamoDecoder
+from .tables import DEFAULT_SPECIAL_SLANG
+
+# asyncio / concurrent.futures는 import 비용이 커서(약 60ms) 실제로 사용할 때 가져옴
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+
+# 이벤트 루프에서 바로 복원할 최대 토큰 수 (5단계 엔진 기준 약 1ms)
+DEFAULT_INLINE_THRESHOLD = 2048
+
+# 동시에 작업자 스레드로 넘길 최대 요청 수
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class AsyncJasoJamoDecoder:
+    """asyncio용 자소 복원기
+
+    짧은 입력은 이벤트 루프에서 바로 복원하고, 긴 입력(최대 MAX_TOKENS)은 크기 제한
+    작업자 풀로 넘겨 이벤트 루프를 오래 막지 않습니다. 동시에 넘기는 요청 수는
+    세마포어로 제한하므로 큰 요청이 몰려도 작업 큐가 무한히 쌓이지 않습니다.
+
+    결과는 같은 옵션의 JasoJamoDecoder.detokenize와 동일합니다 (잘못된 입력은 ""를
+    반환하고, 문자열이 아닌 토큰은 TypeError를 발생). 작업자 스레드가 디코더 하나를
+    공유하므로 스레드 안전하지 않은 어절 캐시(cache_size)는 지원하지 않습니다.
+
+    Example:
+        >>> import asyncio
+        >>> decoder = AsyncJasoJamoDecoder()
+        >>> asyncio.run(decoder.detokenize(['ㅎ', 'ㅏ', 'ㄴ', 'ㄱ', 'ㅡ', 'ㄹ']))
+        '한글'
+    """
+
+    __slots__ = (
+        "_decoder",
+        "inline_threshold",
+        "max_concurrency",
+        "_executor",
+        "_own_executor",
+        "_semaphore",
+        "_semaphore_loop",
+    )
+
+    def __init__(
+        self,
+        check_slang_mid=False,
+        special_slang: Sequence[str] = DEFAULT_SPECIAL_SLANG,
+        use_fsm=False,
+        use_numpy=False,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        executor: Optional["Executor"] = None,
+    ):
+        """
+        Args:
+            check_slang_mid, special_slang, use_fsm, use_numpy: JasoJamoDecoder와 동일
+            inline_threshold (int): 이 토큰 수 이하 입력은 이벤트 루프에서 바로 복원
+            max_concurrency (int): 동시에 작업자 풀로 넘길 최대 요청 수 (1 이상)
+            executor: 작업자 풀 (기본값: max_concurrency개 스레드를 가진 전용 풀).
+                      직접 넘긴 풀은 close()에서 종료하지 않습니다.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency는 1 이상이어야 합니다: {max_concurrency}")
+        self._decoder = JasoJamoDecoder(
+            check_slang_mid=check_slang_mid,
+            special_slang=special_slang,
+            use_fsm=use_fsm,
+            use_numpy=use_numpy,
+        )
+        self.inline_threshold = inline_threshold
+        self.max_concurrency = max_concurrency
+        self._executor = executor
+        self._own_executor = executor is None
+        # 세마포어는 사용하는 이벤트 루프에 묶이므로 루프별로 생성
+        self._semaphore: Optional["asyncio.Semaphore"] = None
+        self._semaphore_loop = None
+
+    @property
+    def decoder(self) -> JasoJamoDecoder:
+        """내부 동기 디코더"""
+        return self._decoder
+
+    async def detokenize(self, tokens: List[str]) -> str:
+        """자소 토큰을 한글 텍스트로 복원 (긴 입력은 작업자 풀에서 실행)"""
+        if self._runs_inline(tokens):
+            return self._decoder.detokenize(tokens)
+        return await self._offload(tokens)
+
+    async def detokenize_many(self, token_lists: Iterable[List[str]]) -> List[str]:
+        """여러 자소 토큰 리스트를 복원 (입력 순서대로 결과 리스트 반환)
+
+        긴 입력은 작업자 풀에서 동시에 복원하고, 그동안 짧은 입력은 이벤트 루프에서
+        복원합니다. 짧은 입력을 연속으로 복원할 때도 inline_threshold 토큰마다
+        이벤트 루프에 제어를 넘깁니다.
+        """
+        import asyncio
+
+        results: List[str] = []
+        pending = []
+        inline_tokens = 0
+        try:
+            for tokens in token_lists:
+                if self._runs_inline(tokens):
+                    results.append(self._decoder.detokenize(tokens))
+                    inline_tokens += len(tokens) if isinstance(tokens, (list, tuple)) else 1
+                    if inline_tokens >= self.inline_threshold:
+                        inline_tokens = 0
+                        await asyncio.sleep(0)
+                else:
+                    pending.append((len(results), asyncio.ensure_future(self._offload(tokens))))
+                    results.append("")
+            for index, future in pending:
+                results[index] = await future
+        except BaseException:
+            for _, future in pending:
+                future.cancel()
+            raise
+        return results
+
+    def close(self) -> None:
+        """전용 작업자 풀 종료 (직접 넘긴 풀은 종료하지 않음, 진행 중인 복원이 끝날 때까지 대기)
+
+        동기 코드용입니다. 이벤트 루프 안에서는 루프를 막지 않는 aclose()를 사용하세요.
+        """
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def aclose(self) -> None:
+        """전용 작업자 풀 종료 (close와 같지만 종료 대기를 이벤트 루프 밖에서 수행)"""
+        if self._own_executor and self._executor is not None:
+            import asyncio
+
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def __aenter__(self) -> "AsyncJasoJamoDecoder":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _runs_inline(self, tokens) -> bool:
+        """이벤트 루프에서 바로 복원할 입력인지 (잘못된 입력도 바로 처리)"""
+        return not isinstance(tokens, (list, tuple)) or len(tokens) <= self.inline_threshold
+
+    async def _offload(self, tokens: List[str]) -> str:
+        """작업자 풀에서 복원 (동시 실행 수는 세마포어로 제한)"""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore(loop):
+            return await loop.run_in_executor(
+                self._get_executor(), self._decoder.detokenize, tokens
+            )
+
+    def _get_semaphore(self, loop) -> "asyncio.Semaphore":
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            import asyncio
+
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _get_executor(self) -> "Executor":
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="jaso-jamo"
+            )
+        return self._executor
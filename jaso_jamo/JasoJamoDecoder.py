@@ -1,5 +1,63 @@
-from typing import List
-from .JasoJamoTokenizer import JasoJamoTokenizer
+import re
+from typing import List, Sequence, Tuple
+from .JasoJamoTokenizer import JasoJamoTokenizer, ids_to_jaso
+from .cache import CacheInfo, LRUCache
+from .fsm import compile_fsm, fsm_detokenize, join_single_char_tokens
+from .slang import SlangLexicon, SlangTrie
+from .tables import (
+    DEFAULT_SPECIAL_SLANG,
+    JASO_CONSONANT,
+    JASO_NONE,
+    JASO_VOWEL,
+    LazyTable,
+    get_jamo_tables,
+)
+
+# 최대 선행 탐색 토큰 수 (1단계: t0~t4)
+_LOOKAHEAD = 5
+
+# 어절: 연속된 자소(0x3131-0x318E) 문자. 그 밖의 한 글자 토큰은 모두 어절 경계
+_WORD_PATTERN = re.compile("[ㄱ-ㆎ]+")
+
+# NumPy 엔진 최소 입력 길이 (이보다 짧으면 배열 생성 비용이 커서 FSM 엔진 사용)
+_NUMPY_MIN_TOKENS = 256
+
+# 공유 테이블 참조 (import 시에는 만들지 않고 최초 _classify 호출 시 _load_tables로 채움)
+# 음절 조합(_compose_cv/_compose_cvc)은 항상 _classify 이후에 호출됩니다.
+_CHO_BASE = None
+_JUNG_BASE = None
+_JONG_MAP = None
+_SYLLABLES = None
+_JASO_CLASS = None
+
+
+def _load_tables():
+    """공유 자모 테이블을 모듈 전역에 연결하고 문자 분류 테이블 반환"""
+    global _CHO_BASE, _JUNG_BASE, _JONG_MAP, _SYLLABLES, _JASO_CLASS
+    tables = get_jamo_tables()
+    _CHO_BASE = tables.CHO_BASE
+    _JUNG_BASE = tables.JUNG_BASE
+    _JONG_MAP = tables.JONG_MAP
+    _SYLLABLES = tables.SYLLABLES
+    _JASO_CLASS = tables.JASO_CLASS
+    return _JASO_CLASS
+
+
+def _compose_cv(cho: str, jung: str) -> str:
+    """초성+중성 음절 조합 (중성은 모음 분류가 확인된 토큰)"""
+    base = _CHO_BASE.get(cho)
+    if base is None:
+        # 초성으로 쓸 수 없는 자음(겹자음 등)은 조합하지 않고 그대로 유지
+        return cho + jung
+    return _SYLLABLES[base + _JUNG_BASE[jung]]
+
+
+def _compose_cvc(cho: str, jung: str, jong: str) -> str:
+    """초성+중성+종성 음절 조합 (종성으로 쓸 수 없는 자음은 종성 없음으로 처리)"""
+    base = _CHO_BASE.get(cho)
+    if base is None:
+        return cho + jung + jong
+    return _SYLLABLES[base + _JUNG_BASE[jung] + _JONG_MAP.get(jong, 0)]
 
 
 class JasoJamoDecoder:
@@ -22,25 +80,97 @@ class JasoJamoDecoder:
         '한글'
     """
 
-    def __init__(self, check_slang_mid=False):
+    # 인스턴스에는 설정값만 저장 (__dict__ 없음, 테이블과 슬랭 트라이는 인스턴스끼리 공유)
+    __slots__ = (
+        "_special_slang",
+        "_lexicon",
+        "_cache_trie",
+        "_check_slang_mid",
+        "use_fsm",
+        "use_numpy",
+        "_word_cache",
+    )
+
+    # DoS 방지: 최대 토큰 수
+    MAX_TOKENS = 1000000
+
+    # 유니코드 고정 테이블 (모든 인스턴스 공유, 처음 읽을 때 생성)
+    CHO = LazyTable("CHO_SET")
+    JUNG = LazyTable("JUNG_SET")
+    JONG = LazyTable("JONG_SET")  # 빈 종성 제외
+    CONSONANTS = LazyTable("CONSONANTS")  # 모든 자음
+
+    # 빠른 조회를 위한 딕셔너리
+    CHO_MAP = LazyTable("CHO_MAP")
+    JUNG_MAP = LazyTable("JUNG_MAP")
+    JONG_MAP = LazyTable("JONG_MAP")
+
+    def __init__(
+        self,
+        check_slang_mid=False,
+        special_slang: Sequence[str] = DEFAULT_SPECIAL_SLANG,
+        use_fsm=False,
+        use_numpy=False,
+        cache_size: int = 0,
+    ):
         """
         Args:
             check_slang_mid (bool): 문장 중간에 위치한 반복 자소 슬랭 처리 여부.
                                     True면 "바다ㄱㄱ네요"의 'ㄱㄱ'를 반복 자소 슬랭으로 처리.
                                     False면 오타(예: 학ㄴ교) 오탐지를 방지하기 위해 처리하지 않음 (기본값).
+            special_slang: 사전 반복 자소 슬랭 목록 (기본값: DEFAULT_SPECIAL_SLANG).
+                           SlangLexicon을 주면 사전 교체(reload/swap)가 디코더를 다시
+                           만들지 않고 다음 호출부터 반영됩니다.
+            use_fsm (bool): 단일 패스 상태 기계(FSM) 엔진 사용 여부.
+                            결과는 5단계 Fallback 엔진과 동일합니다.
+            use_numpy (bool): NumPy 벡터화 엔진 사용 여부 (numpy 필요).
+                              토큰 배열 전체를 이동 배열 비교로 한 번에 복원하며
+                              결과는 5단계 Fallback 엔진과 동일합니다.
+                              짧은 입력(256 토큰 미만)은 FSM 엔진으로 처리합니다.
+            cache_size (int): 어절 복원 결과 LRU 캐시 크기 (0이면 사용 안 함, 기본값).
+                              캐시를 쓰면 반복되는 어절은 5단계 복원을 건너뛰며
+                              결과는 캐시가 없을 때와 동일합니다. 스레드 안전하지 않습니다.
         """
-        self.tokenizer = JasoJamoTokenizer()
-        self.CHO = set(self.tokenizer.CHO)
-        self.JUNG = set(self.tokenizer.JUNG)
-        self.JONG = set(self.tokenizer.JONG[1:])  # 빈 종성 제외
-
-        # 빠른 조회를 위한 딕셔너리
-        self.CHO_MAP = {ch: i for i, ch in enumerate(self.tokenizer.CHO)}
-        self.JUNG_MAP = {ch: i for i, ch in enumerate(self.tokenizer.JUNG)}
-        self.JONG_MAP = {ch: i for i, ch in enumerate(self.tokenizer.JONG)}
-
-        self.CONSONANTS = self.JONG | self.CHO  # 모든 자음
+        if use_numpy:
+            # numpy 미설치 시 생성 시점에 ImportError
+            from . import vectorized  # noqa: F401
+
+        if special_slang is None:
+            special_slang = []
+        self._word_cache = LRUCache(cache_size) if cache_size else None
+        # 어절 캐시 내용이 어떤 슬랭 트라이 기준인지 (사전 교체 시 캐시 비움)
+        self._cache_trie = None
+        self.SPECIAL_SLANG = special_slang
         self.check_slang_mid = check_slang_mid
+        self.use_fsm = use_fsm
+        self.use_numpy = use_numpy
+
+    @property
+    def SPECIAL_SLANG(self) -> Sequence[str]:
+        """사전 반복 자소 슬랭 목록 (대입하면 슬랭 트라이를 다시 컴파일)"""
+        return self._special_slang
+
+    @SPECIAL_SLANG.setter
+    def SPECIAL_SLANG(self, special_slang: Sequence[str]) -> None:
+        self._special_slang = special_slang
+        if isinstance(special_slang, SlangLexicon):
+            # 공유 사전: 교체는 사전 쪽에서 일어나고 디코더는 호출마다 스냅샷을 읽음
+            self._lexicon = special_slang
+        else:
+            self._lexicon = SlangLexicon(special_slang)
+        # 캐시된 어절 복원 결과는 이전 슬랭 목록 기준이므로 비움
+        self.cache_clear()
+
+    @property
+    def check_slang_mid(self) -> bool:
+        """어절 중간 반복 자소 슬랭 처리 여부 (바꾸면 어절 캐시를 비움)"""
+        return self._check_slang_mid
+
+    @check_slang_mid.setter
+    def check_slang_mid(self, check_slang_mid: bool) -> None:
+        self._check_slang_mid = check_slang_mid
+        # 캐시된 어절 복원 결과는 이전 옵션 기준이므로 비움
+        self.cache_clear()
 
     def detokenize(self, tokens: List[str]) -> str:
         """자소 토큰을 한글 텍스트로 복원"""
@@ -51,73 +181,223 @@ class JasoJamoDecoder:
             return ""
 
         # DoS 방지: 최대 토큰 수 제한
-        MAX_TOKENS = 1000000
-        if len(tokens) > MAX_TOKENS:
-            tokens = tokens[:MAX_TOKENS]
+        if len(tokens) > self.MAX_TOKENS:
+            tokens = tokens[: self.MAX_TOKENS]
+
+        # 슬랭 사전 스냅샷: 호출 도중 사전이 교체되어도 이 호출은 같은 트라이 사용
+        slang = self._lexicon.trie
+
+        if self._word_cache is not None:
+            return self._detokenize_cached(tokens, slang)
+
+        return self._detokenize_with(tokens, slang, self.check_slang_mid)
+
+    def _detokenize_with(self, tokens: Sequence[str], slang: SlangTrie, check_slang_mid) -> str:
+        """검증을 마친 토큰을 주어진 옵션으로 복원 (인스턴스 속성을 바꾸지 않음)"""
+        if self.use_fsm or self.use_numpy:
+            # FSM/NumPy 엔진은 한 글자 토큰 입력만 처리 (여러 글자 토큰은 5단계 엔진 사용)
+            jaso = join_single_char_tokens(tokens)
+            if jaso is not None:
+                return self._detokenize_jaso(jaso, slang, check_slang_mid)
+
+        result, _ = self._decode(tokens, slang=slang, check_slang_mid=check_slang_mid)
+        return "".join(result)
+
+    def cache_info(self) -> CacheInfo:
+        """어절 캐시 통계 (hits, misses, maxsize, currsize). 캐시를 쓰지 않으면 모두 0"""
+        if self._word_cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._word_cache.info()
+
+    def cache_clear(self) -> None:
+        """어절 캐시 비우기"""
+        if self._word_cache is not None:
+            self._word_cache.clear()
+
+    def _detokenize_cached(self, tokens: List[str], slang: SlangTrie) -> str:
+        """어절 단위 캐시를 거쳐 복원
+
+        음절 조합은 어절 경계를 넘지 않으므로 어절마다 따로 복원해도 결과가 같습니다.
+        단, 2단계는 입력 끝(i + 4 == n)을 확인하므로 어절이 입력 끝에 있는지를
+        키에 포함합니다.
+        """
+        if slang is not self._cache_trie:
+            # 슬랭 사전이 교체됨: 이전 사전 기준 결과 폐기
+            self._word_cache.clear()
+            self._cache_trie = slang
+
+        jaso = join_single_char_tokens(tokens)
+        if jaso is not None:
+            # 한 글자 토큰: 자소 문자열에서 정규식으로 어절을 찾고 경계 문자는 그대로 둠
+            n = len(jaso)
+            cached_word = self._cached_word
+            return _WORD_PATTERN.sub(lambda m: cached_word(m.group(), m.end() == n, slang), jaso)
+
+        # 여러 글자 토큰이 섞인 경우: 토큰 튜플을 키로 사용
+        classes = self._classify(tokens)
+        n = len(tokens)
+        result = []
+        start = 0
+        while start <= n:
+            end = self._get_word_eos(tokens, start, classes)
+            if end > start:
+                result.append(self._cached_word(tuple(tokens[start:end]), end == n, slang))
+            if end < n:
+                # 경계 토큰 (한 글자 비자소)
+                result.append(tokens[end])
+            start = end + 1
+        return "".join(result)
+
+    def _cached_word(self, word, at_end: bool, slang: SlangTrie) -> str:
+        """어절(자소 문자열 또는 토큰 튜플) 복원 결과를 캐시에서 조회, 없으면 복원 후 저장"""
+        key = (word, at_end)
+        cache = self._word_cache
+        restored = cache.get(key)
+        if restored is None:
+            restored = self._decode_word(word, at_end, slang)
+            cache.put(key, restored)
+        return restored
+
+    def _decode_word(self, word: Sequence[str], at_end: bool, slang: SlangTrie) -> str:
+        """어절 하나 복원 (입력 끝이 아니면 뒤에 경계 토큰을 붙여 2단계 입력 끝 규칙을 막음)"""
+        if at_end:
+            result, _ = self._decode(list(word), slang=slang)
+            return "".join(result)
+        result, _ = self._decode(list(word) + [" "], slang=slang)
+        return "".join(result[:-1])
+
+    def decode_ids(self, ids) -> str:
+        """자소 정수 ID 배열을 한글 텍스트로 복원
+
+        JasoJamoTokenizer.encode의 역변환입니다. ID 배열을 자소 문자열로 한 번에
+        바꾼 뒤 FSM 엔진으로 복원하므로 토큰마다 문자열 객체를 만들지 않습니다.
+        결과는 같은 토큰에 대한 detokenize와 동일합니다.
+
+        Args:
+            ids: array("I"), numpy.uint32 배열 등 버퍼 또는 정수 iterable
+
+        Returns:
+            복원된 한글 텍스트
+
+        Example:
+            >>> decoder = JasoJamoDecoder()
+            >>> decoder.decode_ids([29, 30, 3, 0, 48, 8])
+            '한글'
+        """
+        jaso = ids_to_jaso(ids)
+        if not jaso:
+            return ""
+
+        # DoS 방지: 최대 토큰 수 제한
+        if len(jaso) > self.MAX_TOKENS:
+            jaso = jaso[: self.MAX_TOKENS]
+        return self._detokenize_jaso(jaso, self._lexicon.trie)
+
+    def _detokenize_jaso(self, jaso: str, slang: SlangTrie, check_slang_mid=None) -> str:
+        """한 글자 토큰을 이어 붙인 자소 문자열을 FSM(또는 NumPy) 엔진으로 복원"""
+        if check_slang_mid is None:
+            check_slang_mid = self.check_slang_mid
+        if self.use_numpy and len(jaso) >= _NUMPY_MIN_TOKENS:
+            from .vectorized import recompose_text
+
+            return recompose_text(jaso, slang, bool(check_slang_mid))
+        # 트라이는 생성 후 변경되지 않으므로 컴파일 캐시 키로 그대로 사용 (해시 O(1))
+        pattern = compile_fsm(slang, bool(check_slang_mid))
+        return fsm_detokenize(jaso, pattern)
+
+    def _decode(
+        self,
+        tokens: List[str],
+        final: bool = True,
+        slang: SlangTrie = None,
+        check_slang_mid=None,
+    ) -> Tuple[List[str], int]:
+        """5단계 Fallback 복원 본체
+
+        Args:
+            tokens: 자소 토큰 리스트
+            final: False이면 뒤에 올 토큰에 따라 결과가 달라질 수 있는 위치
+                   (경계가 보이지 않고 남은 토큰이 선행 탐색 창보다 짧은 자음)에서 멈춤
+            slang: 슬랭 트라이 스냅샷 (기본값: 현재 사전)
+            check_slang_mid: 어절 중간 반복 자소 슬랭 처리 여부 (기본값: 인스턴스 설정)
+
+        Returns:
+            (복원된 문자열 조각 리스트, 처리한 토큰 수)
+        """
+        # 토큰 위치별 문자 분류를 한 번만 계산하여 모든 단계에서 재사용
+        classes = self._classify(tokens)
+        # 음절 조합: 임시 리스트 없이 인덱스 → 음절 테이블 조회
+        compose_cv = _compose_cv
+        compose_cvc = _compose_cvc
+        if slang is None:
+            slang = self._lexicon.trie
+        match_slang = slang.match_window
+        if check_slang_mid is None:
+            check_slang_mid = self.check_slang_mid
 
         result = []
         i = 0
         n = len(tokens)
-        word_eos = self._get_word_eos(tokens, i)
+        # 단어 경계 커서: i가 경계를 지날 때만 앞으로 전진 (단일 순방향 탐색)
+        word_eos = self._get_word_eos(tokens, i, classes)
 
         while i < n:
-            # 현재 토큰이 자소가 아니면 바로 추가
-            if not self._is_jaso(tokens[i]):
-                result.append(tokens[i])
-                i += 1
-                continue
-
-            # [초음 종음]으로 시작하지 않으면 개별 토큰 (모음 단독 등)
-            if not self._is_consonant(tokens[i]):
+            # 현재 토큰이 자음이 아니면 바로 추가
+            # (비자소 토큰, [초음 종음]으로 시작하지 않는 모음 단독 등)
+            if classes[i] != JASO_CONSONANT:
                 result.append(tokens[i])
                 i += 1
                 continue
             
             if i > word_eos:
-                word_eos = self._get_word_eos(tokens, i)
+                word_eos = self._get_word_eos(tokens, i, classes)
+
+            # 스트리밍: 1단계는 t0~t4와 그 다음 토큰(어절 끝 여부)까지 봐야 결정됨
+            if not final and word_eos == n and n - i < _LOOKAHEAD + 1:
+                break
             
             # =================================================================
             # 1단계: 5개 패턴 확인 (반복 자소 슬랭 처리 + 안전장치)
             # =================================================================
             if i + 4 < word_eos:
-                t0, t1, t2, t3, t4 = tokens[i:i+5]
-
                 # [안전장치 1] 뒤따르는 3개 토큰(t2, t3, t4)이 모두 자음이고 자소여야 함
                 # 목적: "학교(ㅎㅏㄱㄱㅕ)" 같은 정상 단어를 반복 자소 슬랭으로 오판하는 것 방지
                 # 추가: "바다ㄱㄱ!가요" 같이 반복 자소 슬랭 뒤 비자소 문자가 있는 경우 반복 자소 슬랭으로 인식
-                if (self._is_consonant(t0) and self._is_vowel(t1) and 
-                    self._is_consonant(t2) and 
-                    self._is_consonant(t3) and 
-                    self._is_consonant(t4)):
+                if (classes[i + 1] == JASO_VOWEL and
+                    classes[i + 2] == JASO_CONSONANT and
+                    classes[i + 3] == JASO_CONSONANT and
+                    classes[i + 4] == JASO_CONSONANT):
                     
                     # [안전장치 2] 반복 자소 슬랭 처리 위치 결정 (연구 목적 옵션)
                     # check_slang_mid=False(기본): 문장/어절 끝에서만 반복 자소 슬랭 처리 (오타 방지)
                     # check_slang_mid=True: 중간 반복 자소 슬랭도 처리 (오타 위험 감수)
-                    check_slang_mid = self.check_slang_mid
-                    
                     # 자소5개 글자가 단어의 끝인지 확인
                     last_word = (i + 5 == word_eos)
 
                     if check_slang_mid or last_word:
+                        t2, t3, t4 = tokens[i + 2], tokens[i + 3], tokens[i + 4]
+
                         # 1. 반복 자음 우선 처리 (예: 가요ㅋㅋ)
                         if t2 == t3 == t4: # 3개 반복
-                            char = self._compose_jamos([t0, t1])
+                            char = compose_cv(tokens[i], tokens[i + 1])
                             result.append(char)
                             i += 2 # t0, t1 처리. t2부터 슬랭 시작
                             continue
                 
                         # 사전 반복 자소 슬랭은 유행어의 발전에 따라 달라 질 수 있다.
+                        # 사전은 트라이로 컴파일되어 있어 토큰 창(t2~t4, t3~t4)을 문자열로
+                        # 이어 붙이지 않고 바로 비교 (사전 크기와 무관)
                         # 2. 3글자 사전 반복 자소 슬랭 (예: 가ㄱㄴㄹ)
-                        if "".join(tokens[i+2 : i+5]) in self.tokenizer.SPECIAL_SLANG:
-                            char = self._compose_jamos([t0, t1])
+                        if match_slang(tokens, i + 2, i + 5):
+                            char = compose_cv(tokens[i], tokens[i + 1])
                             result.append(char)
                             i += 2 # t0, t1 처리. t2부터 반복 자소 슬랭 시작
                             continue
 
                         # 3. 자모자 + 2글자 사전 반복 자소 슬랭 (예: 각ㅁㅅ)
                         # t2를 종성으로 사용하고, t3부터 반복 자소 슬랭
-                        if "".join(tokens[i+3 : i+5]) in self.tokenizer.SPECIAL_SLANG:
-                            char = self._compose_jamos([t0, t1, t2])
+                        if match_slang(tokens, i + 3, i + 5):
+                            char = compose_cvc(tokens[i], tokens[i + 1], t2)
                             result.append(char)
                             i += 3 # t0, t1, t2 처리. t3부터 반복 자소 슬랭 시작
                             continue
@@ -129,8 +409,6 @@ class JasoJamoDecoder:
             # 2단계: 4개 패턴 확인 (선행 탐색 Lookahead - 표준 복원)
             # =================================================================
             if i + 3 < word_eos:
-                t0, t1, t2, t3 = tokens[i:i+4]
-                
                 # 자소4개 글자가 단어의 끝인지 확인
                 # 오타 복원 방지용 주석 처리
                 #last_word = (i + 4 == word_eos)
@@ -139,28 +417,28 @@ class JasoJamoDecoder:
                 # 2글자 반복 자소 슬랭은 문장의 끝만 확인
                 last_word = (i + 4 == n)
 
-                if self._is_consonant(t0) and self._is_vowel(t1) and self._is_consonant(t2):
+                if classes[i + 1] == JASO_VOWEL and classes[i + 2] == JASO_CONSONANT:
                     # 패턴: 자모자자 (t3가 자음 → t2는 종성)
                     # 오타 자동 복원 효과: 단어 중간에 자음이 끼어있을 때 종성으로 붙여버림
-                    if self._is_consonant(t3):
+                    if classes[i + 3] == JASO_CONSONANT:
                         # [안전장치] 반복 자음 (t2==t3)이면 반복 자소 슬랭 가능성이 있으므로 종성으로 붙이지 않음
                         # 예: "바다ㄱㄱ" → "바닥ㄱ"이 아니라 "바다" + "ㄱㄱ"으로 처리되도록
-                        if last_word and t2 == t3:
+                        if last_word and tokens[i + 2] == tokens[i + 3]:
                             # t2, t3가 같은 자음 → 2자모 조합만 수행하고 넘어감
-                            char = self._compose_jamos([t0, t1])
+                            char = compose_cv(tokens[i], tokens[i + 1])
                             result.append(char)
                             i += 2
                             continue
                         
                         # 일반적인 종성 처리 (t2 != t3)
-                        char = self._compose_jamos([t0, t1, t2])
+                        char = compose_cvc(tokens[i], tokens[i + 1], tokens[i + 2])
                         result.append(char)
                         i += 3
                         continue
                     
                     # 패턴: 자모자모 (t3가 모음 → t2는 다음 음절 초성)
-                    if self._is_vowel(t3):
-                        char = self._compose_jamos([t0, t1])
+                    if classes[i + 3] == JASO_VOWEL:
+                        char = compose_cv(tokens[i], tokens[i + 1])
                         result.append(char)
                         i += 2
                         continue
@@ -169,9 +447,8 @@ class JasoJamoDecoder:
             # 3단계: 3개 패턴 확인 (자모자 - 종성 조합)
             # =================================================================
             if i + 2 < word_eos:
-                t0, t1, t2 = tokens[i:i+3]
-                if self._is_consonant(t0) and self._is_vowel(t1) and self._is_consonant(t2):
-                    char = self._compose_jamos([t0, t1, t2])
+                if classes[i + 1] == JASO_VOWEL and classes[i + 2] == JASO_CONSONANT:
+                    char = compose_cvc(tokens[i], tokens[i + 1], tokens[i + 2])
                     result.append(char)
                     i += 3
                     continue
@@ -180,9 +457,8 @@ class JasoJamoDecoder:
             # 4단계: 2개 패턴 확인 (자모 - 초성+중성 조합)
             # =================================================================
             if i + 1 < word_eos:
-                t0, t1 = tokens[i:i+2]
-                if self._is_consonant(t0) and self._is_vowel(t1):
-                    char = self._compose_jamos([t0, t1])
+                if classes[i + 1] == JASO_VOWEL:
+                    char = compose_cv(tokens[i], tokens[i + 1])
                     result.append(char)
                     i += 2
                     continue
@@ -191,55 +467,29 @@ class JasoJamoDecoder:
             result.append(tokens[i])
             i += 1
 
-        return "".join(result)
+        return result, i
+
+    def _classify(self, tokens: List[str]) -> List[int]:
+        """토큰 위치별 문자 분류 코드 계산 (자음/모음/기타 자소/비자소)"""
+        get_class = (_JASO_CLASS or _load_tables()).get
+        return [get_class(tok, JASO_NONE) for tok in tokens]
 
-    def _get_word_eos(self, tokens: List[str], start: int) -> int:
-        """단어의 끝 인덱스 찾기 (비자소 토큰 또는 리스트 끝)"""
-        def check_eos(tok):
-            if not isinstance(tok, str) or len(tok) != 1:
-                return False
-            return not self._is_jaso(tok)
-        word_eos = next((j for j, tok in enumerate(tokens[start:], start=start) if check_eos(tok)), len(tokens))
-        return word_eos
-
-    def _is_consonant(self, token):
-        if not isinstance(token, str): return False
-        return token in self.CONSONANTS
-
-    def _is_vowel(self, token):
-        if not isinstance(token, str): return False
-        return token in self.JUNG
-    
-    def _is_jaso(self, token):
-        """자소 범위 확인 (0x3131-0x318E)"""
-        if not isinstance(token, str) or len(token) != 1: return False
-        return 0x3131 <= ord(token) <= 0x318E
-    
-    def _compose_jamos(self, jamos: List[str]) -> str:
-        """자소를 음절로 조합 (Security & Validation)"""
-        if not isinstance(jamos, (list, tuple)): return ""
-        
-        try:
-            cho = jamos[0] if len(jamos) > 0 else ""
-            jung = jamos[1] if len(jamos) > 1 else ""
-            jong = jamos[2] if len(jamos) > 2 else ""
-
-            cho_idx = self.CHO_MAP.get(cho)
-            jung_idx = self.JUNG_MAP.get(jung)
-            # 종성이 없거나 매핑되지 않으면 0 (종성 없음)
-            jong_idx = self.JONG_MAP.get(jong, 0)
-
-            if cho_idx is None or jung_idx is None:
-                return "".join(jamos)
-
-            code = 0xAC00 + (cho_idx * 21 + jung_idx) * 28 + jong_idx
-
-            if 0xAC00 <= code <= 0xD7A3:
-                return chr(code)
-            else:
-                return "".join(jamos)
-        except Exception:
-            return "".join(jamos)
+    def _get_word_eos(self, tokens: List[str], start: int, classes: List[int] = None) -> int:
+        """단어의 끝 인덱스 찾기 (비자소 토큰 또는 리스트 끝)
+
+        start부터 앞으로만 탐색하며 토큰 리스트를 복사하지 않습니다.
+        detokenize는 직전 경계를 지난 위치에서만 다시 호출하므로
+        전체 경계 탐색 비용은 입력 길이에 선형입니다.
+        """
+        if classes is None:
+            classes = self._classify(tokens)
+        for j in range(start, len(tokens)):
+            if classes[j] == JASO_NONE:
+                # 한 글자 비자소 토큰만 경계 (여러 글자 토큰은 단어 내부로 취급)
+                tok = tokens[j]
+                if isinstance(tok, str) and len(tok) == 1:
+                    return j
+        return len(tokens)
 
 
 # 편의 함수
@@ -1,4 +1,204 @@
-from typing import List
+import re
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .cache import CacheInfo, LRUCache
+from .tables import CHO, DEFAULT_SPECIAL_SLANG, JONG, JUNG
+
+# 완성형 음절(U+AC00~U+D7A3, 11,172자) → 자소 튜플 분해 테이블
+# 최초 tokenize 호출 시 한 번만 생성하여 모든 인스턴스가 공유
+_SYLLABLE_TABLE: Optional[Dict[str, Tuple[str, ...]]] = None
+
+
+def _get_syllable_table() -> Dict[str, Tuple[str, ...]]:
+    """음절 분해 테이블 반환 (지연 생성)"""
+    global _SYLLABLE_TABLE
+    if _SYLLABLE_TABLE is None:
+        cho, jung, jong = CHO, JUNG, JONG
+        table = {}
+        for code in range(11172):
+            jong_idx = code % 28
+            jung_idx = (code // 28) % 21
+            cho_idx = (code // 28) // 21
+            jamos = (cho[cho_idx], jung[jung_idx])
+            if jong_idx > 0:
+                jamos += (jong[jong_idx],)
+            table[chr(0xAC00 + code)] = jamos
+        _SYLLABLE_TABLE = table
+    return _SYLLABLE_TABLE
+
+
+# str.translate 용 변환 테이블 (코드 포인트 → 자소 문자열)
+_TRANSLATE_TABLE: Optional[Dict[int, str]] = None
+
+
+def _get_translate_table() -> Dict[int, str]:
+    """str.translate 변환 테이블 반환 (지연 생성)"""
+    global _TRANSLATE_TABLE
+    if _TRANSLATE_TABLE is None:
+        # 음절 분해 테이블을 거치지 않고 코드 순서(초성 → 중성 → 종성)대로 직접 생성
+        # (tokenize 첫 호출 지연 단축)
+        table = {}
+        code = 0xAC00
+        for c in CHO:
+            for j in JUNG:
+                cj = c + j
+                for t in JONG:
+                    table[code] = cj + t
+                    code += 1
+        _TRANSLATE_TABLE = table
+    return _TRANSLATE_TABLE
+
+
+# 정수 ID 어휘 (고정)
+#   0 ~ 50 : 한글 호환 자모 U+3131(ㄱ) ~ U+3163(ㅣ)
+#   51 이상: 그 밖의 문자 (코드 포인트 + 51)
+JAMO_ID_START = 0x3131
+JAMO_VOCAB_SIZE = 51
+
+# ID 배열 타입: 부호 없는 32비트 정수 (코드 포인트 전체를 담기 위해 16비트 대신 사용)
+ID_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+_ID_ENCODING = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+# ID가 U+10FFFF를 넘는 코드 포인트 (U+10FFCD~U+10FFFF). ID 문자를 만들 수 없으므로
+# str.translate를 거치지 않고 정수 ID를 직접 씀
+_MAX_ID = 0x10FFFF + JAMO_VOCAB_SIZE
+_ID_OVERFLOW_SPLIT = re.compile(
+    "([" + chr(0x110000 - JAMO_VOCAB_SIZE) + "-" + chr(0x10FFFF) + "])"
+).split
+
+
+# 변환 테이블에 미리 넣어 두는 통과 문자 범위: ASCII와 나머지 호환 자모(U+3164~U+318E).
+# 그 밖의 문자는 조회할 때마다 계산하고 보관하지 않음 (테이블 크기 고정)
+_PREFILLED_CODES = (range(0x80), range(JAMO_ID_START + JAMO_VOCAB_SIZE, 0x318F))
+
+
+class _PassthroughIdTable(dict):
+    """str.translate 용 ID 변환 테이블 (미리 넣지 않은 통과 문자는 조회 시 계산)"""
+
+    def __missing__(self, code: int) -> str:
+        # U+10FFCD 이상은 encode가 translate 전에 따로 처리함
+        return chr(code + JAMO_VOCAB_SIZE)
+
+
+class _InverseIdTable(dict):
+    """str.translate 용 역변환 테이블 (ID → 문자)"""
+
+    def __missing__(self, ident: int) -> str:
+        return chr(ident - JAMO_VOCAB_SIZE)
+
+
+_ID_TABLE: Optional[_PassthroughIdTable] = None
+_INVERSE_ID_TABLE: Optional[_InverseIdTable] = None
+
+
+def _get_id_table() -> _PassthroughIdTable:
+    """문자 → ID 문자 변환 테이블 반환 (지연 생성, 음절은 자소 ID 열로 분해)"""
+    global _ID_TABLE
+    if _ID_TABLE is None:
+        table = _PassthroughIdTable()
+        for ident in range(JAMO_VOCAB_SIZE):
+            table[JAMO_ID_START + ident] = chr(ident)
+        for codes in _PREFILLED_CODES:
+            for code in codes:
+                table[code] = chr(code + JAMO_VOCAB_SIZE)
+        for char, jamos in _get_syllable_table().items():
+            table[ord(char)] = "".join(table[ord(jamo)] for jamo in jamos)
+        _ID_TABLE = table
+    return _ID_TABLE
+
+
+def _get_inverse_id_table() -> _InverseIdTable:
+    """ID 문자 → 원래 문자 역변환 테이블 반환 (지연 생성)"""
+    global _INVERSE_ID_TABLE
+    if _INVERSE_ID_TABLE is None:
+        table = _InverseIdTable()
+        for ident in range(JAMO_VOCAB_SIZE):
+            table[ident] = chr(JAMO_ID_START + ident)
+        for codes in _PREFILLED_CODES:
+            for code in codes:
+                table[code + JAMO_VOCAB_SIZE] = chr(code)
+        _INVERSE_ID_TABLE = table
+    return _INVERSE_ID_TABLE
+
+
+def ids_to_jaso(ids) -> str:
+    """ID 배열(버퍼)을 자소 문자열로 변환
+
+    Args:
+        ids: array("I"), numpy.uint32 배열 등 버퍼 또는 정수 iterable
+
+    Returns:
+        토큰 하나가 한 글자인 자소 문자열
+    """
+    try:
+        view = memoryview(ids)
+    except TypeError:
+        view = None
+    if view is None or view.ndim != 1 or view.itemsize != 4 or view.format not in "ILil":
+        view = memoryview(array(ID_TYPECODE, ids))
+    try:
+        jaso_ids = view.tobytes().decode(_ID_ENCODING, "surrogatepass")
+    except UnicodeDecodeError:
+        # ID 문자로 바꿀 수 없는 ID(U+10FFFF 초과) 포함: 정수 ID를 하나씩 변환
+        return _ids_to_jaso_slow(view.tolist())
+    return jaso_ids.translate(_get_inverse_id_table())
+
+
+def _ids_to_jaso_slow(ids: List[int]) -> str:
+    """ID 목록을 하나씩 자소 문자열로 변환 (U+10FFFF를 넘는 ID가 있을 때만 사용)"""
+    chars = []
+    for ident in ids:
+        if not 0 <= ident <= _MAX_ID:
+            raise ValueError(f"ID 범위를 벗어났습니다: {ident}")
+        if ident < JAMO_VOCAB_SIZE:
+            chars.append(chr(JAMO_ID_START + ident))
+        else:
+            chars.append(chr(ident - JAMO_VOCAB_SIZE))
+    return "".join(chars)
+
+
+# 길이 제한 초과 시 처리 정책
+OVERFLOW_TRUNCATE = "truncate"  # 최대 길이까지만 분리 (기존 동작)
+OVERFLOW_RAISE = "raise"  # ValueError 발생
+OVERFLOW_STREAM = "stream"  # 제한 없이 전체 분리
+OVERFLOW_POLICIES = (OVERFLOW_TRUNCATE, OVERFLOW_RAISE, OVERFLOW_STREAM)
+
+# iter_tokenize 기본 청크 크기 (문자 수)
+DEFAULT_CHUNK_SIZE = 65536
+
+# 어절 캐시: 공백 기준 분할 (공백 조각도 유지), 캐시에 저장할 최대 조각 길이
+_WHITESPACE_SPLIT = re.compile(r"(\s+)").split
+_CACHE_MAX_WORD = 64
+
+
+def _iter_chunks(source: Union[str, Iterable[str]], chunk_size: int) -> Iterator[str]:
+    """문자열 / 텍스트 스트림 / 문자열 iterable을 최대 chunk_size 문자 단위로 나눔"""
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start : start + chunk_size]
+        return
+
+    read = getattr(source, "read", None)
+    if read is not None:
+        # 파일/소켓(makefile) 등 텍스트 스트림
+        while True:
+            chunk = read(chunk_size)
+            if not chunk:
+                return
+            if not isinstance(chunk, str):
+                raise TypeError("텍스트 모드 스트림이 필요합니다 (bytes가 아닌 str 반환)")
+            yield chunk
+
+    for piece in source:
+        if not isinstance(piece, str):
+            raise TypeError(f"문자열 iterable이 필요합니다: {type(piece).__name__}")
+        if len(piece) <= chunk_size:
+            yield piece
+        else:
+            for start in range(0, len(piece), chunk_size):
+                yield piece[start : start + chunk_size]
 
 
 class JasoJamoTokenizer:
@@ -7,101 +207,58 @@ class JasoJamoTokenizer:
     한글 음절을 초성, 중성, 종성으로 분리합니다.
     """
 
+    # 인스턴스에는 설정값만 저장 (__dict__ 없음, 테이블은 모든 인스턴스 공유)
+    __slots__ = ("SPECIAL_SLANG", "max_length", "on_overflow", "_word_cache")
+
+    # DoS 방지: 기본 최대 문자열 길이 (100,000자)
+    MAX_LENGTH = 100000
+
+    # 유니코드 고정 테이블 (모든 인스턴스 공유)
+    CHO = CHO  # 초성 19자
+    JUNG = JUNG  # 중성 21자
+    JONG = JONG  # 종성 28자 (빈 종성 포함)
+
     def __init__(
         self,
-        special_slang: List[str] = [
-            "ㅇㅋ",
-            "ㄱㅅ",
-            "ㄳ",
-            "ㄷㅊ",
-            "ㅁㅊ",
-            "ㅅㄱ",
-            "ㅇㅈ",
-            "ㅎㅇ",
-            "ㅆㅅㅌㅊ",
-            "ㄹㅇ",
-        ],
+        special_slang: Sequence[str] = DEFAULT_SPECIAL_SLANG,
+        max_length: int = MAX_LENGTH,
+        on_overflow: str = OVERFLOW_TRUNCATE,
+        cache_size: int = 0,
     ):
-        # 초성 19자
-        self.CHO = [
-            "ㄱ",
-            "ㄲ",
-            "ㄴ",
-            "ㄷ",
-            "ㄸ",
-            "ㄹ",
-            "ㅁ",
-            "ㅂ",
-            "ㅃ",
-            "ㅅ",
-            "ㅆ",
-            "ㅇ",
-            "ㅈ",
-            "ㅉ",
-            "ㅊ",
-            "ㅋ",
-            "ㅌ",
-            "ㅍ",
-            "ㅎ",
-        ]
-        # 중성 21자
-        self.JUNG = [
-            "ㅏ",
-            "ㅐ",
-            "ㅑ",
-            "ㅒ",
-            "ㅓ",
-            "ㅔ",
-            "ㅕ",
-            "ㅖ",
-            "ㅗ",
-            "ㅘ",
-            "ㅙ",
-            "ㅚ",
-            "ㅛ",
-            "ㅜ",
-            "ㅝ",
-            "ㅞ",
-            "ㅟ",
-            "ㅠ",
-            "ㅡ",
-            "ㅢ",
-            "ㅣ",
-        ]
-        # 종성 28자 (빈 종성 포함)
-        self.JONG = [
-            "",
-            "ㄱ",
-            "ㄲ",
-            "ㄳ",
-            "ㄴ",
-            "ㄵ",
-            "ㄶ",
-            "ㄷ",
-            "ㄹ",
-            "ㄺ",
-            "ㄻ",
-            "ㄼ",
-            "ㄽ",
-            "ㄾ",
-            "ㄿ",
-            "ㅀ",
-            "ㅁ",
-            "ㅂ",
-            "ㅄ",
-            "ㅅ",
-            "ㅆ",
-            "ㅇ",
-            "ㅈ",
-            "ㅊ",
-            "ㅋ",
-            "ㅌ",
-            "ㅍ",
-            "ㅎ",
-        ]
+        """
+        Args:
+            special_slang: 사용하지 않음 (deprecated). 분리 결과에 영향이 없으며, 넘기면
+                           DeprecationWarning이 발생합니다. 반복 자소 슬랭 사전은
+                           JasoJamoDecoder(special_slang=...)로 지정합니다.
+            max_length: tokenize 최대 입력 길이 (기본값: 100,000자)
+            on_overflow: 최대 길이 초과 시 처리 정책
+                         "truncate" - 최대 길이까지만 분리 (기본값)
+                         "raise"    - ValueError 발생
+                         "stream"   - 제한 없이 전체 분리
+            cache_size: 어절 분리 결과 LRU 캐시 크기 (0이면 사용 안 함, 기본값).
+                        tokenize가 공백 기준 어절마다 캐시된 토큰을 재사용하므로
+                        같은 어절의 토큰 문자열 객체를 결과 리스트끼리 공유합니다.
+                        스레드 안전하지 않습니다.
+        """
+        if on_overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"on_overflow는 {OVERFLOW_POLICIES} 중 하나여야 합니다: {on_overflow!r}"
+            )
+        if special_slang is not DEFAULT_SPECIAL_SLANG:
+            import warnings
+
+            warnings.warn(
+                "JasoJamoTokenizer의 special_slang은 사용되지 않습니다. "
+                "JasoJamoDecoder(special_slang=...)를 사용하세요.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         if special_slang is None:
             special_slang = []
         self.SPECIAL_SLANG = special_slang
+        self.max_length = max_length
+        self.on_overflow = on_overflow
+        self._word_cache = LRUCache(cache_size) if cache_size else None
 
     def tokenize(self, text: str) -> List[str]:
         """텍스트를 자소 토큰으로 분리
@@ -121,79 +278,143 @@ class JasoJamoTokenizer:
             >>> tokenizer.tokenize("한글")
             ['ㅎ', 'ㅏ', 'ㄴ', 'ㄱ', 'ㅡ', 'ㄹ']
         """
+        if self._word_cache is not None and isinstance(text, str):
+            return self._tokenize_cached(self._limit_length(text))
+
+        # 자소 토큰은 모두 한 글자이므로 문자열 분해 결과를 그대로 나누면 된다
+        return list(self.tokenize_to_str(text))
+
+    def cache_info(self) -> CacheInfo:
+        """어절 캐시 통계 (hits, misses, maxsize, currsize, evictions, memory)
+
+        캐시를 쓰지 않으면 모두 0입니다. memory는 캐시된 키/값과 딕셔너리 크기의
+        바이트 단위 추정치로, cache_size를 정할 때 참고합니다.
+        """
+        if self._word_cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._word_cache.info()
+
+    def cache_clear(self) -> None:
+        """어절 캐시 비우기"""
+        if self._word_cache is not None:
+            self._word_cache.clear()
+
+    def _tokenize_cached(self, text: str) -> List[str]:
+        """공백 기준 조각(어절/공백)마다 캐시된 토큰 튜플을 이어 붙여 분리"""
+        cache = self._word_cache
+        table = _get_translate_table()
+        result: List[str] = []
+        extend = result.extend
+        for piece in _WHITESPACE_SPLIT(text):
+            if not piece:
+                continue
+            tokens = cache.get(piece)
+            if tokens is None:
+                tokens = tuple(piece.translate(table))
+                # 공백 없이 긴 조각은 재사용 가능성이 낮으므로 저장하지 않음
+                if len(piece) <= _CACHE_MAX_WORD:
+                    cache.put(piece, tokens)
+            extend(tokens)
+        return result
+
+    def tokenize_to_str(self, text: str) -> str:
+        """텍스트를 자소 문자열로 분리 (str.translate 기반 고속 경로)
+
+        리스트를 만들지 않고 전체 입력을 C 수준에서 한 번에 변환합니다.
+        ``list(tokenize_to_str(text)) == tokenize(text)`` 가 항상 성립합니다.
+
+        Args:
+            text: 분리할 텍스트
+
+        Returns:
+            자소 문자열
+
+        Example:
+            >>> tokenizer = JasoJamoTokenizer()
+            >>> tokenizer.tokenize_to_str("한글")
+            'ㅎㅏㄴㄱㅡㄹ'
+        """
         # 입력 검증
         if not isinstance(text, str):
-            return []
+            return ""
         if not text:
-            return []
-
-        # DoS 방지: 최대 문자열 길이 제한 (100,000자)
-        MAX_LENGTH = 100000
-        if len(text) > MAX_LENGTH:
-            text = text[:MAX_LENGTH]
-
-        result = []
-        try:
-            for char in text:
-                if self._is_hangeul(char):
-                    jamos = self._decompose(char)
-                    result.extend(jamos)
-                else:
-                    result.append(char)
-        except (TypeError, ValueError, AttributeError):
-            # 예외 발생 시 현재까지의 결과 반환
-            pass
+            return ""
 
-        return result
+        return self._limit_length(text).translate(_get_translate_table())
 
-    def _is_hangeul(self, char: str) -> bool:
-        """한글 음절인지 확인
+    def encode(self, text: str) -> array:
+        """텍스트를 자소 정수 ID 배열로 변환
 
-        Security: 타입 및 범위 검증
-        """
-        if not isinstance(char, str):
-            return False
-        if len(char) != 1:
-            return False
-        try:
-            code = ord(char)
-            return 0xAC00 <= code <= 0xD7A3
-        except (TypeError, ValueError):
-            return False
-
-    def _decompose(self, char: str) -> List[str]:
-        """한글 음절을 자소로 분해
+        토큰 문자열을 만들지 않고 str.translate 한 번으로 ID를 계산합니다.
+        ID 어휘는 고정: 0~50은 호환 자모(U+3131~U+3163), 그 밖의 문자는 코드 포인트 + 51.
+        numpy가 필요하면 ``numpy.frombuffer(ids, dtype=numpy.uint32)``로 복사 없이 변환합니다.
 
-        Security:
-            - 입력 검증 및 인덱스 범위 확인
-            - 예외 처리로 안전성 보장
+        Args:
+            text: 분리할 텍스트
+
+        Returns:
+            array("I") 부호 없는 32비트 ID 배열
+
+        Example:
+            >>> tokenizer = JasoJamoTokenizer()
+            >>> list(tokenizer.encode("한a"))
+            [29, 30, 3, 148]
         """
-        if not self._is_hangeul(char):
-            return [char] if isinstance(char, str) else []
+        ids = array(ID_TYPECODE)
+        if not isinstance(text, str) or not text:
+            return ids
 
-        try:
-            code = ord(char) - 0xAC00
+        text = self._limit_length(text)
+        table = _get_id_table()
+        pieces = _ID_OVERFLOW_SPLIT(text)
+        if len(pieces) == 1:
+            ids.frombytes(text.translate(table).encode(_ID_ENCODING, "surrogatepass"))
+            return ids
+        # U+10FFCD 이상 코드 포인트 포함 (홀수 번째 조각): 정수 ID를 직접 추가
+        for i, piece in enumerate(pieces):
+            if i % 2:
+                ids.append(ord(piece) + JAMO_VOCAB_SIZE)
+            elif piece:
+                ids.frombytes(piece.translate(table).encode(_ID_ENCODING, "surrogatepass"))
+        return ids
 
-            # 범위 검증
-            if code < 0 or code > 11171:  # 11172개 음절 (0~11171)
-                return [char]
+    def _limit_length(self, text: str) -> str:
+        """DoS 방지: 최대 문자열 길이 제한 (on_overflow 정책에 따름)"""
+        if len(text) > self.max_length:
+            if self.on_overflow == OVERFLOW_RAISE:
+                raise ValueError(
+                    f"입력 길이({len(text):,}자)가 최대 길이({self.max_length:,}자)를 초과합니다"
+                )
+            if self.on_overflow == OVERFLOW_TRUNCATE:
+                text = text[: self.max_length]
+        return text
 
-            jong_idx = code % 28
-            jung_idx = ((code - jong_idx) // 28) % 21
-            cho_idx = ((code - jong_idx) // 28) // 21
-
-            # 인덱스 범위 검증 (보안)
-            if not (0 <= cho_idx < len(self.CHO)):
-                return [char]
-            if not (0 <= jung_idx < len(self.JUNG)):
-                return [char]
-            if not (0 <= jong_idx < len(self.JONG)):
-                return [char]
-
-            jamos = [self.CHO[cho_idx], self.JUNG[jung_idx]]
-            if jong_idx > 0:
-                jamos.append(self.JONG[jong_idx])
+    def iter_tokenize(
+        self, source: Union[str, Iterable[str]], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[List[str]]:
+        """큰 텍스트를 청크 단위로 자소 분리 (제너레이터)
+
+        파일/소켓 같은 텍스트 스트림이나 문자열 iterable을 chunk_size 문자씩 읽어
+        분리하므로 입력 크기와 무관하게 메모리 사용량이 일정합니다.
+        자소 분리는 문자 단위이므로 청크 경계와 무관하게 결과를 이어 붙이면
+        제한 없는 tokenize 결과와 같으며, max_length 제한은 적용하지 않습니다.
+
+        Args:
+            source: 문자열, read(n)을 지원하는 텍스트 스트림, 또는 문자열 iterable
+            chunk_size: 한 번에 처리할 최대 문자 수
+
+        Yields:
+            청크별 자소 토큰 리스트
+
+        Example:
+            >>> tokenizer = JasoJamoTokenizer()
+            >>> list(tokenizer.iter_tokenize(["한", "글"]))
+            [['ㅎ', 'ㅏ', 'ㄴ'], ['ㄱ', 'ㅡ', 'ㄹ']]
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size는 양수여야 합니다: {chunk_size}")
 
-            return jamos
-        except (TypeError, ValueError, IndexError, KeyError):
-            return [char] if isinstance(char, str) else []
+        table = _get_translate_table()
+        for chunk in _iter_chunks(source, chunk_size):
+            if chunk:
+                yield list(chunk.translate(table))
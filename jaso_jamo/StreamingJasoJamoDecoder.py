@@ -0,0 +1,71 @@
+from typing import Iterable, List, Sequence
+
+from .JasoJamoDecoder import JasoJamoDecoder
+from .tables import DEFAULT_SPECIAL_SLANG
+
+
+class StreamingJasoJamoDecoder(JasoJamoDecoder):
+    """스트리밍 자소 복원기
+
+    자소 토큰을 조금씩 받아 결과가 확정된 음절부터 바로 돌려줍니다.
+    복원 규칙은 최대 5개 토큰을 미리 보므로, 어절 경계가 아직 보이지 않은
+    마지막 몇 개 토큰만 보류하고 나머지는 즉시 출력합니다.
+
+    feed로 나누어 넣은 결과를 모두 이어 붙이고 flush 결과를 더하면
+    같은 토큰을 한 번에 넣은 JasoJamoDecoder.detokenize 결과와 동일합니다.
+    (스트림은 길이 제한이 없으므로 MAX_TOKENS 자르기는 적용하지 않습니다.)
+
+    Example:
+        >>> decoder = StreamingJasoJamoDecoder()
+        >>> decoder.feed(['ㅎ', 'ㅏ', 'ㄴ'])
+        ''
+        >>> decoder.feed(['ㄱ', 'ㅡ', 'ㄹ', ' '])
+        '한글 '
+        >>> decoder.feed(['ㄱ', 'ㅏ'])
+        ''
+        >>> decoder.flush()
+        '가'
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(
+        self,
+        check_slang_mid=False,
+        special_slang: Sequence[str] = DEFAULT_SPECIAL_SLANG,
+    ):
+        super().__init__(check_slang_mid=check_slang_mid, special_slang=special_slang)
+        self._pending: List[str] = []
+
+    def feed(self, tokens: Iterable[str]) -> str:
+        """토큰 조각을 추가하고 확정된 부분을 복원하여 반환
+
+        Args:
+            tokens: 자소 토큰 iterable (문자열을 넘기면 한 글자씩 토큰으로 사용)
+
+        Returns:
+            이번 호출로 확정된 복원 텍스트 (보류 중인 토큰은 다음 feed/flush에서 출력)
+        """
+        pending = self._pending
+        pending.extend(tokens)
+        if not pending:
+            return ""
+
+        # 보류 토큰(최대 5개) + 새 토큰만 처리하므로 호출 비용은 스트림 전체 길이와 무관
+        result, consumed = self._decode(pending, final=False)
+        del pending[:consumed]
+        return "".join(result)
+
+    def flush(self) -> str:
+        """스트림 종료: 보류 중인 토큰을 모두 복원하여 반환하고 상태 초기화"""
+        pending = self._pending
+        if not pending:
+            return ""
+
+        result, _ = self._decode(pending)
+        pending.clear()
+        return "".join(result)
+
+    def reset(self):
+        """보류 중인 토큰을 버리고 상태 초기화"""
+        self._pending.clear()
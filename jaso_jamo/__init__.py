@@ -5,18 +5,40 @@
 GitHub: https://github.com/yourusername/hangul-jamo
 """
 
+# 클래스와 이름이 같은 하위 모듈의 클래스(JasoJamoDecoder 등)는 바로 가져옴
+# (지연 로딩하면 하위 모듈이 먼저 import될 때 패키지 속성이 모듈로 바뀜)
+from .AsyncJasoJamoDecoder import AsyncJasoJamoDecoder
 from .core import (
     JasoJamoTokenizer,
-    JasoJamoDecoder,
-    tokenize,
     detokenize,
+    detokenize_batch,
+    iter_tokenize,
+    tokenize,
+    tokenize_batch,
 )
+from .JasoJamoDecoder import JasoJamoDecoder
+from .StreamingJasoJamoDecoder import StreamingJasoJamoDecoder
 
 __version__ = "1.0.2"
 __author__ = "김명환"
 __all__ = [
     "JasoJamoTokenizer",
     "JasoJamoDecoder",
+    "StreamingJasoJamoDecoder",
+    "AsyncJasoJamoDecoder",
+    "JasoJamoEngine",
     "tokenize",
     "detokenize",
+    "tokenize_batch",
+    "detokenize_batch",
+    "iter_tokenize",
 ]
+
+
+def __getattr__(name: str):
+    """JasoJamoEngine은 처음 접근할 때 engine 모듈을 가져옴"""
+    if name == "JasoJamoEngine":
+        from .engine import JasoJamoEngine
+
+        return JasoJamoEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
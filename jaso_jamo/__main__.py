@@ -0,0 +1,7 @@
+"""python -m jaso_jamo tokenize|detokenize (jaso-jamo 명령과 동일)"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
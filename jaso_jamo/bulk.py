@@ -0,0 +1,367 @@
+"""
+대용량 말뭉치 일괄 처리 (멀티프로세스)
+
+입력 파일을 줄 경계에 맞춘 바이트 구간(샤드)으로 나누고 ProcessPoolExecutor로
+자소 분리/복원을 병렬 처리합니다. 워커마다 엔진(토크나이저/디코더)을 한 번만
+만들며, 샤드 결과는 입력 순서대로 샤드별 파일 또는 하나의 병합 파일로 씁니다.
+
+줄 형식:
+    tokenize    원문 한 줄 → 자소를 이어 붙인 한 줄
+    detokenize  자소를 이어 붙인 한 줄 → 복원된 한 줄 (줄 단위로 복원)
+    roundtrip   원문 한 줄 → 분리 후 복원한 한 줄 (원문과 다른 줄 수 집계)
+
+사용법:
+    python -m jaso_jamo.bulk corpus.txt -o corpus.jaso.txt --mode tokenize --jobs 8
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .JasoJamoDecoder import JasoJamoDecoder
+from .JasoJamoTokenizer import OVERFLOW_STREAM, JasoJamoTokenizer
+
+MODE_TOKENIZE = "tokenize"
+MODE_DETOKENIZE = "detokenize"
+MODE_ROUNDTRIP = "roundtrip"
+MODES = (MODE_TOKENIZE, MODE_DETOKENIZE, MODE_ROUNDTRIP)
+
+# 샤드 하나를 읽는 블록 크기 (줄 경계까지 연장)
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+# 워커당 샤드 수 (샤드 크기 편차 완화)
+DEFAULT_SHARDS_PER_JOB = 4
+# 이보다 작은 샤드는 만들지 않음
+MIN_SHARD_BYTES = 1024 * 1024
+
+# 잘못된 UTF-8 바이트도 왕복 보존
+_ERRORS = "surrogateescape"
+
+PathLike = Union[str, Path]
+
+
+class Shard(NamedTuple):
+    """입력 파일의 줄 경계 바이트 구간 [start, end)"""
+
+    index: int
+    path: str
+    start: int
+    end: int
+
+
+class ShardResult(NamedTuple):
+    """샤드 처리 결과"""
+
+    index: int
+    pid: int
+    lines: int
+    bytes_in: int
+    seconds: float
+    mismatches: int
+    output: str
+
+
+class WorkerStats(NamedTuple):
+    """워커(프로세스)별 누적 처리량"""
+
+    pid: int
+    shards: int
+    lines: int
+    bytes_in: int
+    seconds: float
+
+    @property
+    def mb_per_sec(self) -> float:
+        return self.bytes_in / self.seconds / 1e6 if self.seconds else 0.0
+
+
+class BulkReport(NamedTuple):
+    """일괄 처리 보고서"""
+
+    mode: str
+    jobs: int
+    shards: int
+    lines: int
+    bytes_in: int
+    seconds: float
+    mismatches: int
+    outputs: List[str]
+    workers: List[WorkerStats]
+
+    @property
+    def mb_per_sec(self) -> float:
+        return self.bytes_in / self.seconds / 1e6 if self.seconds else 0.0
+
+
+def plan_shards(
+    path: PathLike, shard_count: int, min_shard_bytes: int = MIN_SHARD_BYTES
+) -> List[Tuple[int, int]]:
+    """파일을 줄 경계에 맞춘 바이트 구간으로 분할
+
+    Args:
+        path: 입력 파일 경로
+        shard_count: 목표 샤드 수
+        min_shard_bytes: 샤드 최소 크기 (작은 파일은 샤드 수를 줄임)
+
+    Returns:
+        [(start, end), ...] 구간 리스트 (빈 파일이면 빈 리스트)
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    count = max(1, min(shard_count, size // max(1, min_shard_bytes)))
+
+    bounds = [0]
+    with open(path, "rb") as f:
+        for k in range(1, count):
+            target = size * k // count
+            if target <= bounds[-1]:
+                continue
+            # target - 1 바이트가 속한 줄의 끝(개행 다음)으로 이동
+            f.seek(target - 1)
+            f.readline()
+            pos = f.tell()
+            if bounds[-1] < pos < size:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+# 워커 프로세스 전역 엔진 (워커마다 한 번만 생성)
+_ENGINE: Optional[Tuple[str, JasoJamoTokenizer, JasoJamoDecoder]] = None
+
+
+def init_worker(mode: str, check_slang_mid: bool = False) -> None:
+    """현재 프로세스(워커)의 엔진 생성 (process_block 전에 한 번 호출)
+
+    ProcessPoolExecutor의 initializer로 쓰거나, 단일 프로세스에서는 직접 호출합니다.
+
+    Args:
+        mode: "tokenize", "detokenize", "roundtrip" 중 하나
+        check_slang_mid: 어절 중간 반복 자소 슬랭 처리 여부
+    """
+    global _ENGINE
+    if mode not in MODES:
+        raise ValueError(f"mode는 {MODES} 중 하나여야 합니다: {mode!r}")
+    tokenizer = JasoJamoTokenizer(on_overflow=OVERFLOW_STREAM)
+    decoder = JasoJamoDecoder(check_slang_mid=check_slang_mid, use_fsm=True)
+    _ENGINE = (mode, tokenizer, decoder)
+
+
+def process_block(data: bytes) -> Tuple[bytes, int]:
+    """완전한 줄들로 이루어진 UTF-8 바이트 블록 처리 (init_worker의 모드 사용)
+
+    잘못된 UTF-8 바이트는 그대로 보존합니다. 줄 길이 제한은 없습니다.
+
+    Returns:
+        (출력 바이트, 원문과 다른 줄 수). 줄 수는 roundtrip 모드에서만 집계
+    """
+    out, mismatches = _process_text(data.decode("utf-8", _ERRORS))
+    return out.encode("utf-8", _ERRORS), mismatches
+
+
+def _process_text(block: str) -> Tuple[str, int]:
+    """블록(완전한 줄들) 처리 → (출력 문자열, 원문과 다른 줄 수)"""
+    mode, tokenizer, decoder = _ENGINE
+    if mode == MODE_TOKENIZE:
+        # 개행은 비자소 문자이므로 블록 전체를 한 번에 분리해도 줄 단위와 같음
+        return tokenizer.tokenize_to_str(block), 0
+
+    # 복원은 입력 끝 규칙(2단계)이 있으므로 줄 단위로 처리. 한 줄은 한 글자 토큰을 이어
+    # 붙인 자소 문자열이므로 토큰 리스트 없이 FSM으로 바로 복원 (MAX_TOKENS 제한 없음)
+    slang = decoder._lexicon.trie
+    detokenize_jaso = decoder._detokenize_jaso
+    lines = block.split("\n")
+    if mode == MODE_DETOKENIZE:
+        return "\n".join([detokenize_jaso(line, slang) for line in lines]), 0
+
+    tokenize_to_str = tokenizer.tokenize_to_str
+    restored = [detokenize_jaso(tokenize_to_str(line), slang) for line in lines]
+    mismatches = sum(1 for a, b in zip(lines, restored) if a != b)
+    return "\n".join(restored), mismatches
+
+
+def _process_shard(shard: Shard, output: str, block_size: int = DEFAULT_BLOCK_SIZE) -> ShardResult:
+    """샤드 하나를 읽어 처리하고 output 파일에 쓰기"""
+    started = time.perf_counter()
+    lines = 0
+    mismatches = 0
+    with open(shard.path, "rb") as src, open(output, "wb") as dst:
+        src.seek(shard.start)
+        remaining = shard.end - shard.start
+        while remaining > 0:
+            data = src.read(min(block_size, remaining))
+            if not data:
+                break
+            # 블록을 줄 경계까지 연장 (샤드 끝은 이미 줄 경계)
+            if not data.endswith(b"\n") and len(data) < remaining:
+                data += src.readline(remaining - len(data))
+            remaining -= len(data)
+            lines += data.count(b"\n")
+
+            out, bad = process_block(data)
+            mismatches += bad
+            dst.write(out)
+
+        # 마지막 줄에 개행이 없는 경우
+        if shard.end > shard.start:
+            src.seek(shard.end - 1)
+            if src.read(1) != b"\n":
+                lines += 1
+
+    return ShardResult(
+        index=shard.index,
+        pid=os.getpid(),
+        lines=lines,
+        bytes_in=shard.end - shard.start,
+        seconds=time.perf_counter() - started,
+        mismatches=mismatches,
+        output=output,
+    )
+
+
+def _part_path(output: PathLike, index: int) -> str:
+    """샤드별 출력 파일 경로"""
+    return f"{output}.part{index:05d}"
+
+
+def run_bulk(
+    inputs: Sequence[PathLike],
+    output: PathLike,
+    mode: str = MODE_TOKENIZE,
+    jobs: Optional[int] = None,
+    sharded: bool = False,
+    check_slang_mid: bool = False,
+    shards_per_job: int = DEFAULT_SHARDS_PER_JOB,
+    min_shard_bytes: int = MIN_SHARD_BYTES,
+) -> BulkReport:
+    """입력 파일들을 샤드로 나누어 병렬 처리
+
+    Args:
+        inputs: 입력 파일 경로 목록 (출력은 이 순서를 따름)
+        output: 출력 파일 경로. sharded=True면 "{output}.partNNNNN" 파일들로 출력
+        mode: "tokenize", "detokenize", "roundtrip" 중 하나
+        jobs: 워커 프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 처리)
+        sharded: 샤드별 출력 파일 유지 여부 (False면 순서대로 병합)
+        check_slang_mid: 어절 중간 반복 자소 슬랭 처리 여부
+        shards_per_job: 워커당 샤드 수
+        min_shard_bytes: 샤드 최소 크기
+
+    Returns:
+        BulkReport (전체/워커별 처리량 포함)
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode는 {MODES} 중 하나여야 합니다: {mode!r}")
+    jobs = jobs or os.cpu_count() or 1
+    if jobs < 1:
+        raise ValueError(f"jobs는 1 이상이어야 합니다: {jobs}")
+
+    shards = []
+    for path in inputs:
+        for start, end in plan_shards(path, jobs * shards_per_job, min_shard_bytes):
+            shards.append(Shard(len(shards), str(path), start, end))
+    parts = [_part_path(output, shard.index) for shard in shards]
+
+    started = time.perf_counter()
+    if jobs == 1:
+        init_worker(mode, check_slang_mid)
+        results = [_process_shard(shard, part) for shard, part in zip(shards, parts)]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=init_worker, initargs=(mode, check_slang_mid)
+        ) as pool:
+            results = list(pool.map(_process_shard, shards, parts))
+
+    if sharded:
+        outputs = parts
+    else:
+        # 샤드 순서대로 병합 후 샤드 파일 삭제
+        with open(output, "wb") as dst:
+            for part in parts:
+                with open(part, "rb") as src:
+                    shutil.copyfileobj(src, dst)
+                os.remove(part)
+        outputs = [str(output)]
+    seconds = time.perf_counter() - started
+
+    workers: Dict[int, WorkerStats] = {}
+    for r in results:
+        w = workers.get(r.pid, WorkerStats(r.pid, 0, 0, 0, 0.0))
+        workers[r.pid] = WorkerStats(
+            r.pid, w.shards + 1, w.lines + r.lines, w.bytes_in + r.bytes_in, w.seconds + r.seconds
+        )
+
+    return BulkReport(
+        mode=mode,
+        jobs=jobs,
+        shards=len(shards),
+        lines=sum(r.lines for r in results),
+        bytes_in=sum(r.bytes_in for r in results),
+        seconds=seconds,
+        mismatches=sum(r.mismatches for r in results),
+        outputs=outputs,
+        workers=sorted(workers.values()),
+    )
+
+
+def format_report(report: BulkReport) -> str:
+    """보고서를 사람이 읽을 수 있는 문자열로 변환"""
+    lines = [
+        "=" * 60,
+        f"일괄 처리 ({report.mode})",
+        "=" * 60,
+        f"워커 수: {report.jobs}  샤드 수: {report.shards}",
+        f"처리: {report.lines:,}줄, {report.bytes_in / 1e6:,.1f} MB, {report.seconds:.2f}초"
+        f" ({report.mb_per_sec:.1f} MB/s)",
+    ]
+    if report.mode == MODE_ROUNDTRIP:
+        accuracy = 1 - report.mismatches / report.lines if report.lines else 1.0
+        lines.append(f"왕복 불일치: {report.mismatches:,}줄 (정확도 {accuracy:.2%})")
+    lines.append("-" * 60)
+    lines.append(f"{'PID':>8}{'샤드':>6}{'줄 수':>14}{'MB':>10}{'MB/s':>10}")
+    for w in report.workers:
+        lines.append(
+            f"{w.pid:>8}{w.shards:>6}{w.lines:>14,}{w.bytes_in / 1e6:>10.1f}{w.mb_per_sec:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(
+        prog="python -m jaso_jamo.bulk", description="대용량 말뭉치 자소 분리/복원 일괄 처리"
+    )
+    parser.add_argument("inputs", nargs="+", help="입력 파일 (UTF-8, 줄 단위)")
+    parser.add_argument("-o", "--output", required=True, help="출력 파일 경로")
+    parser.add_argument("--mode", choices=MODES, default=MODE_TOKENIZE, help="처리 모드")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 수)"
+    )
+    parser.add_argument("--sharded", action="store_true", help="병합하지 않고 샤드별 파일로 출력")
+    parser.add_argument(
+        "--shards-per-job", type=int, default=DEFAULT_SHARDS_PER_JOB, help="워커당 샤드 수"
+    )
+    parser.add_argument(
+        "--check-slang-mid", action="store_true", help="어절 중간 반복 자소 슬랭 처리"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_bulk(
+        args.inputs,
+        args.output,
+        mode=args.mode,
+        jobs=args.jobs,
+        sharded=args.sharded,
+        check_slang_mid=args.check_slang_mid,
+        shards_per_job=args.shards_per_job,
+    )
+    print(format_report(report), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+어절 단위 LRU 캐시
+
+채팅 말뭉치처럼 같은 어절("ㅋㅋㅋ", "감사합니다", "ㅇㅋ")이 반복되는 입력에서
+분리/복원 결과를 재사용하기 위한 크기 제한 캐시입니다 (스레드 안전하지 않음).
+"""
+
+import sys
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional
+
+
+class CacheInfo(NamedTuple):
+    """캐시 통계 (functools.lru_cache의 cache_info 형식 + 제거 횟수, 메모리 추정치)"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    evictions: int = 0
+    memory: int = 0  # 바이트 (키/값 객체와 딕셔너리 크기 합의 추정치)
+
+
+def _sizeof(obj: Any) -> int:
+    """객체 크기 추정 (튜플은 원소 크기 포함)"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, tuple):
+        size += sum(_sizeof(item) for item in obj)
+    return size
+
+
+class LRUCache:
+    """최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거하는 캐시
+
+    Example:
+        >>> cache = LRUCache(2)
+        >>> cache.put("a", 1)
+        >>> cache.put("b", 2)
+        >>> cache.get("a")
+        1
+        >>> cache.put("c", 3)  # "b" 제거
+        >>> cache.get("b") is None
+        True
+        >>> info = cache.info()
+        >>> (info.hits, info.misses, info.currsize, info.evictions)
+        (1, 1, 2, 1)
+    """
+
+    __slots__ = ("maxsize", "_data", "hits", "misses", "evictions", "_item_bytes")
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: 최대 항목 수 (1 이상)
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize는 1 이상이어야 합니다: {maxsize}")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # 저장된 키/값 크기 합 (저장/제거 시 갱신)
+        self._item_bytes = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """항목 조회 (없으면 None). 조회된 항목은 가장 최근 사용으로 이동"""
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """항목 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        data = self._data
+        old = data.get(key)
+        if old is not None:
+            self._item_bytes -= _sizeof(key) + _sizeof(old)
+        data[key] = value
+        data.move_to_end(key)
+        self._item_bytes += _sizeof(key) + _sizeof(value)
+        if len(data) > self.maxsize:
+            old_key, old_value = data.popitem(last=False)
+            self._item_bytes -= _sizeof(old_key) + _sizeof(old_value)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """항목과 통계 초기화"""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._item_bytes = 0
+
+    def info(self) -> CacheInfo:
+        """캐시 통계"""
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.maxsize,
+            len(self._data),
+            self.evictions,
+            self._item_bytes + sys.getsizeof(self._data),
+        )
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,165 @@
+"""
+명령줄 도구 (jaso-jamo tokenize | detokenize)
+
+표준 입력 또는 파일을 줄 단위로 읽어 자소 분리/복원한 결과를 표준 출력(또는 -o 파일)에
+씁니다. 엔진은 프로세스(워커)마다 한 번만 만들고, 입력은 줄 경계 블록 단위로 처리하여
+블록마다 한 번씩 씁니다. 파이프 입력은 블록이 찰 때까지 기다리지 않고 도착한 줄부터
+처리하므로 tail -f 같은 스트림에도 사용할 수 있습니다.
+
+줄 형식은 python -m jaso_jamo.bulk와 같습니다:
+    tokenize    원문 한 줄 → 자소를 이어 붙인 한 줄
+    detokenize  자소를 이어 붙인 한 줄 → 복원된 한 줄
+
+사용법:
+    jaso-jamo tokenize app.log > app.jaso
+    zcat logs/*.gz | jaso-jamo tokenize --jobs 4 | grep ...
+    jaso-jamo detokenize app.jaso -o app.restored
+"""
+
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence
+
+from .bulk import MODE_DETOKENIZE, MODE_TOKENIZE, init_worker, process_block
+
+COMMANDS = (MODE_TOKENIZE, MODE_DETOKENIZE)
+
+# 한 번에 읽을 최대 바이트 수 (블록은 줄 경계까지 자름)
+DEFAULT_READ_SIZE = 1024 * 1024
+
+
+def iter_line_blocks(stream: BinaryIO, read_size: int = DEFAULT_READ_SIZE) -> Iterator[bytes]:
+    """완전한 줄들로 이루어진 바이트 블록 순회 (마지막 줄은 개행이 없을 수 있음)
+
+    read1이 있으면 이미 도착한 바이트만 읽으므로 파이프 입력이 read_size만큼 쌓이기를
+    기다리지 않습니다.
+    """
+    read = getattr(stream, "read1", stream.read)
+    partial: List[bytes] = []
+    while True:
+        data = read(read_size)
+        if not data:
+            break
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            # 개행이 아직 없음: 다음 읽기와 합침
+            partial.append(data)
+            continue
+        if partial:
+            partial.append(data[:cut])
+            yield b"".join(partial)
+            partial = []
+        else:
+            yield data[:cut]
+        if cut < len(data):
+            partial.append(data[cut:])
+    if partial:
+        yield b"".join(partial)
+
+
+def _iter_inputs(paths: Sequence[str], stdin: BinaryIO, read_size: int) -> Iterator[bytes]:
+    """입력 파일들을 순서대로 블록 단위로 순회 ("-"는 표준 입력)"""
+    for path in paths:
+        if path == "-":
+            yield from iter_line_blocks(stdin, read_size)
+        else:
+            with open(path, "rb") as f:
+                yield from iter_line_blocks(f, read_size)
+
+
+def _process(block: bytes) -> bytes:
+    """워커에서 블록 하나 처리 (바이트 → 바이트, 잘못된 UTF-8 바이트는 그대로 보존)"""
+    return process_block(block)[0]
+
+
+def iter_processed(
+    blocks: Iterable[bytes], mode: str, check_slang_mid: bool = False, jobs: int = 1
+) -> Iterator[bytes]:
+    """블록을 처리하여 입력 순서대로 순회
+
+    jobs > 1이면 워커 프로세스 jobs개(워커마다 엔진 하나)에서 병렬 처리하며,
+    메모리 사용량을 제한하기 위해 처리 중인 블록은 jobs * 2개 이하로 유지합니다.
+    """
+    if jobs <= 1:
+        init_worker(mode, check_slang_mid)
+        for block in blocks:
+            yield _process(block)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=(mode, check_slang_mid)
+    ) as pool:
+        pending: deque = deque()
+        for block in blocks:
+            pending.append(pool.submit(_process, block))
+            if len(pending) >= jobs * 2:
+                yield pending.popleft().result()
+            # 이미 끝난 앞쪽 블록은 바로 출력 (파이프 입력 지연 최소화)
+            while pending and pending[0].done():
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run(
+    mode: str,
+    inputs: Sequence[str],
+    output: BinaryIO,
+    stdin: Optional[BinaryIO] = None,
+    check_slang_mid: bool = False,
+    jobs: int = 1,
+    read_size: int = DEFAULT_READ_SIZE,
+) -> None:
+    """입력(파일 경로 또는 "-")을 처리하여 output에 블록 단위로 쓰기"""
+    if stdin is None:
+        stdin = sys.stdin.buffer
+    blocks = _iter_inputs(inputs or ["-"], stdin, read_size)
+    for out in iter_processed(blocks, mode, check_slang_mid, jobs):
+        output.write(out)
+        output.flush()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """명령줄 진입점 (jaso-jamo)"""
+    parser = argparse.ArgumentParser(
+        prog="jaso-jamo", description="한글 자소 분리/복원 (줄 단위, 표준 입력/출력)"
+    )
+    parser.add_argument(
+        "command", choices=COMMANDS, help="tokenize: 자소 분리, detokenize: 자소 복원"
+    )
+    parser.add_argument("inputs", nargs="*", help="입력 파일 (기본값: 표준 입력, '-'도 표준 입력)")
+    parser.add_argument("-o", "--output", default=None, help="출력 파일 (기본값: 표준 출력)")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="워커 프로세스 수 (0이면 CPU 수, 기본값: 1)"
+    )
+    parser.add_argument(
+        "--check-slang-mid", action="store_true", help="어절 중간 반복 자소 슬랭 처리 (detokenize)"
+    )
+    parser.add_argument(
+        "--read-size", type=int, default=DEFAULT_READ_SIZE, help="한 번에 읽을 최대 바이트 수"
+    )
+    # 옵션 뒤에 입력 파일이 와도 되도록 (jaso-jamo detokenize --check-slang-mid a.jaso)
+    args = parser.parse_intermixed_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        run(args.command, args.inputs, output, None, args.check_slang_mid, jobs, args.read_size)
+    except BrokenPipeError:
+        # 출력 파이프가 먼저 닫힘 (예: | head). 종료 시 flush 오류가 나지 않도록 출력을 버림
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if args.output:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,101 @@
-from typing import List
-from .JasoJamoTokenizer import JasoJamoTokenizer
-from .JasoJamoDecoder import JasoJamoDecoder
+from typing import Iterable, Iterator, List, Union
+
+from .JasoJamoTokenizer import DEFAULT_CHUNK_SIZE, JasoJamoTokenizer
+
+__all__ = [
+    "JasoJamoTokenizer",
+    "JasoJamoDecoder",  # noqa: F822 (모듈 __getattr__로 지연 제공)
+    "tokenize",
+    "detokenize",
+    "tokenize_batch",
+    "detokenize_batch",
+    "iter_tokenize",
+]
+
+
+# 공유 엔진 (engine 모듈은 import jaso_jamo 시점이 아니라 첫 호출에서 가져옴)
+_ENGINE = None
+
+
+def _load_engine():
+    global _ENGINE
+    from .engine import default_engine
+
+    _ENGINE = default_engine()
+    return _ENGINE
+
+
+def __getattr__(name: str):
+    """JasoJamoDecoder는 처음 접근할 때 가져옴 (이전 버전과 같은 재수출)"""
+    if name == "JasoJamoDecoder":
+        from .JasoJamoDecoder import JasoJamoDecoder
+
+        return JasoJamoDecoder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def tokenize(text: str) -> List[str]:
-    """텍스트를 자소로 분리"""
-    tokenizer = JasoJamoTokenizer()
-    return tokenizer.tokenize(text)
+    """텍스트를 자소로 분리 (공유 엔진 사용, 호출마다 객체를 만들지 않음)"""
+    return (_ENGINE or _load_engine()).tokenize(text)
 
 
 def detokenize(tokens: List[str], check_slang_mid=False) -> str:
-    """자소를 한글로 복원
-    
+    """자소를 한글로 복원 (공유 엔진 사용, 스레드 안전)
+
     Args:
         tokens: 자소 토큰 리스트
         check_slang_mid: 어절 중간 반복 자소 슬랭 처리 여부 (기본값: False)
-    
+
     Returns:
         복원된 한글 텍스트
     """
-    decoder = JasoJamoDecoder(check_slang_mid=check_slang_mid)
-    return decoder.detokenize(tokens)
+    return (_ENGINE or _load_engine()).detokenize(tokens, check_slang_mid=check_slang_mid)
+
+
+def tokenize_batch(texts: Iterable[str]) -> Iterator[List[str]]:
+    """여러 문장을 자소로 분리 (제너레이터)
+
+    토크나이저 하나를 재사용하므로 문장마다 객체를 생성하지 않습니다.
+
+    Args:
+        texts: 문장 iterable
+
+    Yields:
+        문장별 자소 토큰 리스트
+    """
+    tokenizer = JasoJamoTokenizer()
+    for text in texts:
+        yield tokenizer.tokenize(text)
+
+
+def iter_tokenize(
+    source: Union[str, Iterable[str]], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[List[str]]:
+    """큰 텍스트/스트림을 청크 단위로 자소 분리 (길이 제한 없음)
+
+    Args:
+        source: 문자열, read(n)을 지원하는 텍스트 스트림, 또는 문자열 iterable
+        chunk_size: 한 번에 처리할 최대 문자 수
+
+    Yields:
+        청크별 자소 토큰 리스트
+    """
+    tokenizer = JasoJamoTokenizer()
+    return tokenizer.iter_tokenize(source, chunk_size=chunk_size)
+
+
+def detokenize_batch(token_lists: Iterable[List[str]], check_slang_mid=False) -> Iterator[str]:
+    """여러 자소 토큰 리스트를 한글로 복원 (제너레이터)
+
+    공유 엔진을 사용하므로 문장마다 테이블을 다시 만들지 않습니다.
+
+    Args:
+        token_lists: 자소 토큰 리스트의 iterable
+        check_slang_mid: 어절 중간 반복 자소 슬랭 처리 여부 (기본값: False)
+
+    Yields:
+        문장별 복원된 한글 텍스트
+    """
+    return (_ENGINE or _load_engine()).detokenize_batch(
+        token_lists, check_slang_mid=check_slang_mid
+    )
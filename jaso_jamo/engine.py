@@ -0,0 +1,158 @@
+"""
+스레드 안전 무상태 분리/복원 엔진
+
+JasoJamoDecoder는 check_slang_mid, SPECIAL_SLANG 같은 설정을 인스턴스 속성으로
+가지고 있어 스레드끼리 공유하면서 속성을 바꾸면 다른 요청에 영향을 줍니다.
+JasoJamoEngine은 생성 후 상태를 바꾸지 않고, 요청마다 다른 옵션은 메서드 인자로
+받습니다. 인스턴스 하나를 멀티스레드 서버 전체에서 잠금 없이 공유할 수 있습니다.
+
+스레드 안전성:
+    - 자모 테이블, 음절 분해 테이블, 슬랭 트라이는 생성 후 변경되지 않습니다.
+      공유 테이블과 FSM 정규식은 엔진 생성 시 미리 만들어(warmup) 요청 처리 중에
+      생성되지 않습니다. 모듈 수준 편의 함수의 기본 엔진은 import와 첫 호출을
+      가볍게 하기 위해 미리 만들지 않고 처음 쓰는 테이블만 생성합니다.
+    - FSM 정규식과 인자로 받은 슬랭 목록의 트라이는 lru_cache로 한 번만 컴파일되며
+      정규식 객체는 여러 스레드에서 동시에 사용할 수 있습니다.
+    - 복원 상태(결과 리스트, 커서)는 모두 호출 지역 변수입니다.
+    - 어절 LRU 캐시(cache_size)는 스레드 안전하지 않으므로 엔진에서 사용하지 않습니다.
+
+Example:
+    >>> engine = JasoJamoEngine()
+    >>> tokens = engine.tokenize("가요ㅋㅋㅋ네")
+    >>> engine.detokenize(tokens)
+    '가욬ㅋㅋ네'
+    >>> engine.detokenize(tokens, check_slang_mid=True)
+    '가요ㅋㅋㅋ네'
+"""
+
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+from .JasoJamoDecoder import JasoJamoDecoder
+from .JasoJamoTokenizer import OVERFLOW_TRUNCATE, JasoJamoTokenizer
+from .slang import SlangLexicon, SlangTrie, compile_slang
+from .tables import DEFAULT_SPECIAL_SLANG
+
+SlangArg = Union[None, SlangTrie, SlangLexicon, Sequence[str]]
+
+
+class JasoJamoEngine:
+    """스레드 안전 무상태 자소 분리/복원 엔진
+
+    생성 시 정한 설정(기본 슬랭 사전, 복원 엔진, 최대 길이)은 바꿀 수 없고,
+    요청별 옵션(check_slang_mid, special_slang)은 호출 인자로 받습니다.
+    결과는 같은 옵션의 JasoJamoTokenizer/JasoJamoDecoder와 동일합니다.
+    """
+
+    __slots__ = ("_tokenizer", "_decoder")
+
+    def __init__(
+        self,
+        special_slang: Union[SlangLexicon, Sequence[str]] = DEFAULT_SPECIAL_SLANG,
+        use_fsm: bool = True,
+        use_numpy: bool = False,
+        max_length: int = JasoJamoTokenizer.MAX_LENGTH,
+        on_overflow: str = OVERFLOW_TRUNCATE,
+        warmup: bool = True,
+    ):
+        """
+        Args:
+            special_slang: 기본 사전 반복 자소 슬랭 목록 또는 공유 SlangLexicon
+                           (SlangLexicon의 reload/swap은 다음 호출부터 반영)
+            use_fsm: FSM 엔진 사용 여부 (기본값 True, 결과는 5단계 엔진과 동일)
+            use_numpy: NumPy 벡터화 엔진 사용 여부 (numpy 필요)
+            max_length: tokenize 최대 입력 길이
+            on_overflow: 최대 길이 초과 시 처리 정책 ("truncate", "raise", "stream")
+            warmup: 분해/복원 테이블과 FSM 정규식을 생성 시 미리 만들지 여부 (기본값 True).
+                    False면 처음 사용하는 호출에서 필요한 것만 생성합니다.
+        """
+        self._tokenizer = JasoJamoTokenizer(max_length=max_length, on_overflow=on_overflow)
+        self._decoder = JasoJamoDecoder(
+            special_slang=special_slang, use_fsm=use_fsm, use_numpy=use_numpy
+        )
+        if warmup:
+            # 요청 처리 중에 테이블과 FSM 정규식이 생성되지 않도록 미리 생성
+            self.tokenize_to_str("가")
+            for check_slang_mid in (False, True):
+                self.detokenize(["ㄱ", "ㅏ"], check_slang_mid)
+
+    @property
+    def special_slang(self) -> SlangTrie:
+        """현재 기본 슬랭 트라이 (불변 스냅샷)"""
+        return self._decoder._lexicon.trie
+
+    def tokenize(self, text: str) -> List[str]:
+        """텍스트를 자소 토큰으로 분리 (JasoJamoTokenizer.tokenize와 동일)"""
+        return list(self._tokenizer.tokenize_to_str(text))
+
+    def tokenize_to_str(self, text: str) -> str:
+        """텍스트를 자소 문자열로 분리 (JasoJamoTokenizer.tokenize_to_str와 동일)"""
+        return self._tokenizer.tokenize_to_str(text)
+
+    def detokenize(
+        self,
+        tokens: Sequence[str],
+        check_slang_mid: bool = False,
+        special_slang: SlangArg = None,
+    ) -> str:
+        """자소 토큰을 한글 텍스트로 복원
+
+        Args:
+            tokens: 자소 토큰 리스트 (또는 튜플)
+            check_slang_mid: 어절 중간 반복 자소 슬랭 처리 여부 (기본값: False)
+            special_slang: 이 호출에만 쓸 슬랭 목록, SlangTrie 또는 SlangLexicon
+                           (기본값 None: 엔진 기본 사전)
+
+        Returns:
+            복원된 한글 텍스트
+        """
+        if not isinstance(tokens, (list, tuple)) or not tokens:
+            return ""
+
+        decoder = self._decoder
+        # DoS 방지: 최대 토큰 수 제한
+        if len(tokens) > decoder.MAX_TOKENS:
+            tokens = tokens[: decoder.MAX_TOKENS]
+
+        return decoder._detokenize_with(tokens, self._resolve_slang(special_slang), check_slang_mid)
+
+    def detokenize_batch(
+        self,
+        token_lists: Iterable[Sequence[str]],
+        check_slang_mid: bool = False,
+        special_slang: SlangArg = None,
+    ) -> Iterator[str]:
+        """여러 자소 토큰 리스트를 같은 옵션으로 복원 (제너레이터)"""
+        slang = self._resolve_slang(special_slang)
+        for tokens in token_lists:
+            yield self.detokenize(tokens, check_slang_mid, slang)
+
+    def _resolve_slang(self, special_slang: SlangArg) -> SlangTrie:
+        """호출 인자를 슬랭 트라이 스냅샷으로 변환"""
+        if special_slang is None:
+            return self._decoder._lexicon.trie
+        if isinstance(special_slang, SlangTrie):
+            return special_slang
+        if isinstance(special_slang, SlangLexicon):
+            return special_slang.trie
+        return compile_slang(special_slang)
+
+    def __repr__(self) -> str:
+        decoder = self._decoder
+        return (
+            f"JasoJamoEngine({len(self.special_slang)} slang entries, "
+            f"use_fsm={decoder.use_fsm}, use_numpy={decoder.use_numpy})"
+        )
+
+
+# 편의 함수가 공유하는 기본 엔진 (최초 사용 시 생성)
+_DEFAULT_ENGINE: Optional[JasoJamoEngine] = None
+
+
+def default_engine() -> JasoJamoEngine:
+    """기본 설정 공유 엔진 반환 (모듈 수준 편의 함수가 사용)"""
+    global _DEFAULT_ENGINE
+    if _DEFAULT_ENGINE is None:
+        # 동시에 처음 호출되면 두 번 생성될 수 있으나 어느 쪽이든 같은 동작
+        # (tokenize만 쓰는 프로그램이 복원 테이블을 만들지 않도록 미리 만들지 않음)
+        _DEFAULT_ENGINE = JasoJamoEngine(warmup=False)
+    return _DEFAULT_ENGINE
@@ -0,0 +1,114 @@
+"""
+단일 패스 상태 기계(FSM) 복원 엔진
+
+JasoJamoDecoder의 5단계 Fallback 규칙(반복 자소 슬랭 안전장치, check_slang_mid 포함)을
+정규식 하나로 컴파일하여 자소 문자열을 한 번만 훑으면서 음절을 바로 만들어 냅니다.
+
+규칙 → 대안(alternative) 대응 (앞에 있을수록 우선):
+    1. [1단계] 자모 + 동일 자음 3개 반복 (어절 끝)      → 자모
+    2. [1단계] 자모 + 3글자 사전 슬랭 (어절 끝)         → 자모
+    3. [1단계] 자모자 + 2글자 사전 슬랭 (어절 끝)       → 자모자
+    4. [2단계] 자모 + 동일 자음 2개 (입력 끝)           → 자모
+    5. [2단계] 자모 + 자모                              → 자모
+    6. [2/3단계] 자모자                                 → 자모자
+    7. [4단계] 자모                                     → 자모
+    어느 대안에도 맞지 않는 문자는 그대로 통과합니다 (5단계).
+
+check_slang_mid=False이면 1~3번 대안 뒤에 "다음 문자가 자소가 아님(어절 끝)" 조건이 붙습니다.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Pattern, Sequence
+
+from .tables import get_jamo_tables
+
+# 자소 범위 (0x3131-0x318E)
+_JASO_RANGE = "ㄱ-ㆎ"
+
+
+class _SyllableCache(dict):
+    """매칭된 자소 문자열("자모" / "자모자") → 음절 (최초 조회 시 계산 후 보관)"""
+
+    def __missing__(self, key: str) -> str:
+        tables = get_jamo_tables()
+        cho_idx = tables.CHO_MAP.get(key[0])
+        jung_idx = tables.JUNG_MAP.get(key[1])
+        if cho_idx is None or jung_idx is None:
+            # 초성으로 쓸 수 없는 자음(겹자음 등)은 조합하지 않고 그대로 유지
+            value = key
+        else:
+            # 종성으로 쓸 수 없는 자음은 종성 없음(0)으로 처리 (기존 복원기와 동일)
+            jong_idx = tables.JONG_MAP.get(key[2], 0) if len(key) > 2 else 0
+            value = chr(0xAC00 + (cho_idx * 21 + jung_idx) * 28 + jong_idx)
+        self[key] = value
+        return value
+
+
+_SYLLABLES = _SyllableCache()
+
+
+def _repl(match, _syllables: Dict[str, str] = _SYLLABLES) -> str:
+    return _syllables[match.group()]
+
+
+@lru_cache(maxsize=32)
+def compile_fsm(special_slang: Iterable[str], check_slang_mid: bool) -> Pattern:
+    """복원 규칙을 정규식 상태 기계로 컴파일
+
+    Args:
+        special_slang: 사전 반복 자소 슬랭 목록 (해시 가능해야 함: 튜플 또는 SlangTrie)
+        check_slang_mid: 어절 중간 반복 자소 슬랭 처리 여부
+
+    Returns:
+        컴파일된 패턴 (결과는 인자별로 캐시)
+    """
+    tables = get_jamo_tables()
+    consonants = tables.CONSONANTS
+    c = "[" + "".join(sorted(consonants)) + "]"
+    v = "[" + "".join(tables.JUNG) + "]"
+    # [안전장치 2] 어절 끝에서만 슬랭 처리 (check_slang_mid=False)
+    end = "" if check_slang_mid else "(?![" + _JASO_RANGE + "])"
+
+    # [안전장치 1] 슬랭 창(t2~t4)은 모두 자음이어야 하므로 자음으로만 된 항목만 사용
+    entries = {s for s in special_slang if isinstance(s, str)}
+    slang3 = sorted(s for s in entries if len(s) == 3 and set(s) <= consonants)
+    slang2 = sorted(s for s in entries if len(s) == 2 and set(s) <= consonants)
+
+    alternatives = [c + v + "(?=(?P<rep3>" + c + ")(?P=rep3)(?P=rep3)" + end + ")"]
+    if slang3:
+        alternatives.append(c + v + "(?=(?:" + "|".join(slang3) + ")" + end + ")")
+    if slang2:
+        alternatives.append(c + v + c + "(?=(?:" + "|".join(slang2) + ")" + end + ")")
+    alternatives += [
+        c + v + "(?=(?P<rep2>" + c + ")(?P=rep2)\\Z)",
+        c + v + "(?=" + c + v + ")",
+        c + v + c,
+        c + v,
+    ]
+    return re.compile("|".join(alternatives))
+
+
+def fsm_detokenize(jaso: str, pattern: Pattern) -> str:
+    """자소 문자열을 한 번 훑어 음절로 복원
+
+    Args:
+        jaso: 한 글자 토큰을 이어 붙인 자소 문자열
+        pattern: compile_fsm 결과
+
+    Returns:
+        복원된 한글 텍스트
+    """
+    return pattern.sub(_repl, jaso)
+
+
+def join_single_char_tokens(tokens: Sequence[str]) -> Optional[str]:
+    """모든 토큰이 한 글자 문자열이면 이어 붙인 문자열, 아니면 None 반환"""
+    try:
+        joined = "".join(tokens)
+    except TypeError:
+        return None
+    # 빈 토큰이 없고 전체 길이가 토큰 수와 같으면 모든 토큰이 정확히 한 글자
+    if len(joined) != len(tokens) or "" in tokens:
+        return None
+    return joined
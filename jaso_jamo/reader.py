@@ -0,0 +1,102 @@
+"""
+메모리 매핑(mmap) 말뭉치 문장 리더
+
+말뭉치 파일을 mmap으로 열고 문장 구간을 하나씩 돌려줍니다. 파일 전체를 읽거나
+문장 리스트를 만들지 않으므로 최대 메모리 사용량이 말뭉치 크기와 무관하며,
+10GB 파일도 열자마자 처리를 시작할 수 있습니다.
+
+문장 구분은 기존 벤치마크의 re.split(r"[\\n.!?]+", text)와 같습니다 (줄바꿈, 마침표,
+느낌표, 물음표). 구분 문자가 모두 ASCII이므로 UTF-8 바이트에서 바로 나눠도
+문자 경계가 깨지지 않습니다.
+
+Example:
+    >>> from jaso_jamo import tokenize_batch
+    >>> from jaso_jamo.reader import iter_sentences
+    >>> for tokens in tokenize_batch(iter_sentences("corpus.txt")):  # doctest: +SKIP
+    ...     ...
+"""
+
+import mmap
+import random
+import re
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+# 문장 본문 (구분 문자 제외). 텍스트 모드 읽기처럼 단독 \r도 줄바꿈으로 취급
+SENTENCE_PATTERN = re.compile(rb"[^\r\n.!?]+")
+
+PathLike = Union[str, Path]
+
+
+def _iter_matches(path: PathLike) -> Iterator["re.Match"]:
+    """mmap한 파일에서 문장 본문 매치 순회 (순회가 끝나면 매핑 해제)"""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 매핑할 수 없음
+            return
+        with mm:
+            yield from SENTENCE_PATTERN.finditer(mm)
+
+
+def iter_sentence_spans(path: PathLike) -> Iterator[Tuple[int, int]]:
+    """문장 바이트 구간 (start, end) 순회 (공백만 있는 구간 포함)
+
+    Args:
+        path: UTF-8 말뭉치 파일 경로
+
+    Yields:
+        파일 내 바이트 구간 [start, end)
+    """
+    for match in _iter_matches(path):
+        yield match.span()
+
+
+def iter_sentences(path: PathLike, errors: str = "strict") -> Iterator[str]:
+    """공백을 정리한 문장 순회 (빈 문장 제외)
+
+    Args:
+        path: UTF-8 말뭉치 파일 경로
+        errors: UTF-8 디코딩 오류 처리 방식 (str.decode의 errors)
+
+    Yields:
+        문장 문자열
+    """
+    for match in _iter_matches(path):
+        sentence = match.group().decode("utf-8", errors).strip()
+        if sentence:
+            yield sentence
+
+
+def sample_sentences(
+    path: PathLike, sample_size: int, rng: Optional[random.Random] = None
+) -> Tuple[List[str], int]:
+    """문장 무작위 표본 추출 (저장소 샘플링, 한 번 순회)
+
+    메모리에는 표본 sample_size개만 유지합니다.
+
+    Args:
+        path: UTF-8 말뭉치 파일 경로
+        sample_size: 표본 크기 (0 이하이면 전체 문장)
+        rng: 난수 생성기 (기본값: random 모듈)
+
+    Returns:
+        (문장 리스트, 전체 문장 수)
+    """
+    if sample_size <= 0:
+        sentences = list(iter_sentences(path))
+        return sentences, len(sentences)
+
+    randrange = (rng or random).randrange
+    reservoir: List[str] = []
+    total = 0
+    for sentence in iter_sentences(path):
+        total += 1
+        if len(reservoir) < sample_size:
+            reservoir.append(sentence)
+        else:
+            j = randrange(total)
+            if j < sample_size:
+                reservoir[j] = sentence
+    return reservoir, total
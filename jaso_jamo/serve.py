@@ -0,0 +1,450 @@
+"""
+로컬 자소 분리/복원 서버 (JSON-lines / HTTP)
+
+다른 언어로 작성된 서비스가 호출마다 Python 프로세스를 띄우지 않도록, 미리 준비된
+토크나이저/디코더 한 쌍(JasoJamoEngine)을 가진 상주 프로세스로 요청을 처리합니다.
+동시에 들어온 요청은 작업 스레드 하나가 마이크로 배치로 묶어 처리하며
+처리량/지연 시간 카운터를 제공합니다.
+
+요청 (JSON 객체, "id"는 응답에 그대로 돌려줌):
+    {"id": 1, "op": "tokenize", "text": "한글"}
+        → {"id": 1, "tokens": ["ㅎ", "ㅏ", "ㄴ", "ㄱ", "ㅡ", "ㄹ"]}
+    {"id": 2, "op": "detokenize", "tokens": ["ㅎ", "ㅏ", "ㄴ"], "check_slang_mid": false}
+        → {"id": 2, "text": "한"}   (tokens는 자소를 이어 붙인 문자열도 가능)
+    {"id": 3, "op": "stats"}
+        → {"id": 3, "stats": {...}}
+    잘못된 요청 → {"id": ..., "error": "..."}
+
+사용법:
+    # 표준 입력/출력 JSON-lines (한 줄에 요청 하나, 응답은 요청 순서대로)
+    python -m jaso_jamo.serve
+
+    # HTTP (기본 127.0.0.1:8765)
+    python -m jaso_jamo.serve --http --port 8765
+    curl -d '{"text": "한글"}' http://127.0.0.1:8765/tokenize
+    curl http://127.0.0.1:8765/stats
+"""
+
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from .engine import JasoJamoEngine
+from .slang import SlangLexicon
+
+OP_TOKENIZE = "tokenize"
+OP_DETOKENIZE = "detokenize"
+OP_STATS = "stats"
+OPS = (OP_TOKENIZE, OP_DETOKENIZE, OP_STATS)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# 배치 하나에 묶을 최대 요청 수
+DEFAULT_MAX_BATCH = 64
+# 첫 요청 이후 배치를 채우기 위해 기다리는 최대 시간 (0이면 이미 대기 중인 요청만 묶음)
+DEFAULT_MAX_DELAY = 0.0
+# DoS 방지: HTTP 요청 본문 최대 크기 (MAX_TOKENS 토큰 요청이 들어가는 크기)
+MAX_BODY_BYTES = 16 * 1024 * 1024
+# 지연 시간 백분위수 계산에 쓰는 최근 요청 수
+LATENCY_WINDOW = 4096
+
+# 작업 스레드 종료 신호
+_STOP = object()
+
+
+def handle_request(engine: JasoJamoEngine, request: Any) -> Dict[str, Any]:
+    """요청 하나 처리 (stats 제외)
+
+    Raises:
+        ValueError: 요청 형식이 잘못된 경우
+    """
+    if not isinstance(request, dict):
+        raise ValueError("요청은 JSON 객체여야 합니다")
+    op = request.get("op")
+    if op == OP_TOKENIZE:
+        text = request.get("text")
+        if not isinstance(text, str):
+            raise ValueError("tokenize 요청에는 문자열 text가 필요합니다")
+        return {"tokens": engine.tokenize(text)}
+    if op == OP_DETOKENIZE:
+        tokens = request.get("tokens")
+        if isinstance(tokens, str):
+            tokens = list(tokens)
+        if not isinstance(tokens, list) or not all(isinstance(tok, str) for tok in tokens):
+            raise ValueError("detokenize 요청에는 문자열 배열(또는 문자열) tokens가 필요합니다")
+        check_slang_mid = bool(request.get("check_slang_mid", False))
+        return {"text": engine.detokenize(tokens, check_slang_mid=check_slang_mid)}
+    raise ValueError(f"op는 {OPS} 중 하나여야 합니다: {op!r}")
+
+
+def _with_id(request: Any, response: Dict[str, Any]) -> Dict[str, Any]:
+    """요청에 id가 있으면 응답 앞에 붙임"""
+    if isinstance(request, dict) and "id" in request:
+        return {"id": request["id"], **response}
+    return response
+
+
+def _percentile(sorted_values: List[float], p: float) -> float:
+    """정렬된 값의 p 백분위수 (최근접 순위)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class ServiceStats:
+    """처리량/지연 시간 카운터 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.busy_seconds = 0.0
+        self.max_batch_size = 0
+        self._latencies: "deque[float]" = deque(maxlen=LATENCY_WINDOW)
+
+    def record_batch(self, latencies: Sequence[float], errors: int, busy: float) -> None:
+        """배치 하나의 요청별 지연 시간(초), 오류 수, 처리 시간 기록"""
+        with self._lock:
+            self.requests += len(latencies)
+            self.errors += errors
+            self.batches += 1
+            self.busy_seconds += busy
+            self.max_batch_size = max(self.max_batch_size, len(latencies))
+            self._latencies.extend(latencies)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 카운터 (JSON 직렬화 가능)"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            requests, errors, batches = self.requests, self.errors, self.batches
+            busy, max_batch = self.busy_seconds, self.max_batch_size
+        uptime = time.monotonic() - self.started
+        return {
+            "uptime_seconds": round(uptime, 3),
+            "requests": requests,
+            "errors": errors,
+            "batches": batches,
+            "mean_batch_size": round(requests / batches, 3) if batches else 0.0,
+            "max_batch_size": max_batch,
+            "requests_per_second": round(requests / uptime, 3) if uptime else 0.0,
+            "busy_ratio": round(busy / uptime, 4) if uptime else 0.0,
+            "latency_ms": {
+                f"p{p}": round(_percentile(latencies, p) * 1000, 3) for p in (50, 90, 99)
+            },
+            "max_latency_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        }
+
+
+class MicroBatcher:
+    """요청을 큐에 모아 작업 스레드 하나에서 배치 단위로 처리
+
+    작업 스레드는 첫 요청을 꺼낸 뒤 큐에 이미 있는 요청을 max_batch개까지 함께
+    꺼냅니다. max_delay가 0보다 크면 그 시간 동안 다음 요청을 더 기다립니다.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Tuple[Any, Future, float]]], None],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ):
+        if max_batch < 1:
+            raise ValueError(f"max_batch는 1 이상이어야 합니다: {max_batch}")
+        self._process_batch = process_batch
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="jaso-jamo-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any) -> Future:
+        """요청 추가 (결과는 Future로 전달)"""
+        if self._closed:
+            raise RuntimeError("종료된 배치 처리기입니다")
+        future: Future = Future()
+        self._queue.put((item, future, time.monotonic()))
+        return future
+
+    def close(self) -> None:
+        """대기 중인 요청을 모두 처리한 뒤 작업 스레드 종료"""
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _run(self) -> None:
+        get = self._queue.get
+        while True:
+            first = get()
+            if first is _STOP:
+                return
+            batch = [first]
+            stop = False
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._process_batch(batch)
+            if stop:
+                return
+
+
+class JasoJamoService:
+    """마이크로 배치 분리/복원 서비스 (스레드 안전)
+
+    Example:
+        >>> with JasoJamoService() as service:
+        ...     service.call({"id": 1, "op": "tokenize", "text": "한글"})
+        {'id': 1, 'tokens': ['ㅎ', 'ㅏ', 'ㄴ', 'ㄱ', 'ㅡ', 'ㄹ']}
+    """
+
+    def __init__(
+        self,
+        engine: Optional[JasoJamoEngine] = None,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ):
+        """
+        Args:
+            engine: 요청을 처리할 엔진 (기본값: 기본 설정 JasoJamoEngine)
+            max_batch: 배치 하나에 묶을 최대 요청 수
+            max_delay: 배치를 채우기 위해 기다리는 최대 시간 (초)
+        """
+        self.engine = engine if engine is not None else JasoJamoEngine()
+        self.stats = ServiceStats()
+        self._batcher = MicroBatcher(self._process_batch, max_batch, max_delay)
+
+    def submit(self, request: Any) -> Future:
+        """요청 추가 (응답 딕셔너리는 Future로 전달)"""
+        if isinstance(request, dict) and request.get("op") == OP_STATS:
+            # 카운터 조회는 배치를 거치지 않음
+            future: Future = Future()
+            future.set_result(_with_id(request, {"stats": self.stats.snapshot()}))
+            return future
+        return self._batcher.submit(request)
+
+    def call(self, request: Any, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """요청 하나를 처리하고 응답 반환 (배치 처리가 끝날 때까지 대기)"""
+        return self.submit(request).result(timeout)
+
+    def close(self) -> None:
+        """대기 중인 요청을 처리한 뒤 작업 스레드 종료"""
+        self._batcher.close()
+
+    def __enter__(self) -> "JasoJamoService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _process_batch(self, batch: List[Tuple[Any, Future, float]]) -> None:
+        engine = self.engine
+        started = time.monotonic()
+        responses = []
+        errors = 0
+        for request, _, _ in batch:
+            try:
+                response = handle_request(engine, request)
+            except Exception as e:  # 요청 하나의 오류가 작업 스레드를 멈추지 않도록 응답으로 전달
+                response = {"error": str(e) or type(e).__name__}
+                errors += 1
+            responses.append(_with_id(request, response))
+        finished = time.monotonic()
+        # 카운터를 먼저 갱신해 응답을 받은 클라이언트가 바로 조회해도 반영되어 있도록 함
+        self.stats.record_batch(
+            [finished - submitted for _, _, submitted in batch], errors, finished - started
+        )
+        for (_, future, _), response in zip(batch, responses):
+            future.set_result(response)
+
+
+# =============================================================================
+# JSON-lines (표준 입력/출력)
+# =============================================================================
+
+
+def _parse_line(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return e
+
+
+def _write_responses(pending: "queue.Queue", stdout: TextIO) -> None:
+    """응답을 요청 순서대로 쓰기 (대기 중인 응답이 없을 때만 flush)"""
+    while True:
+        future = pending.get()
+        if future is None:
+            break
+        stdout.write(json.dumps(future.result(), ensure_ascii=False) + "\n")
+        if pending.empty():
+            stdout.flush()
+    stdout.flush()
+
+
+def serve_stdio(service: JasoJamoService, stdin: TextIO, stdout: TextIO) -> None:
+    """한 줄에 JSON 요청 하나를 읽어 같은 순서로 JSON 응답을 한 줄씩 쓰기 (입력 끝까지)"""
+    pending: "queue.Queue" = queue.Queue()
+    writer = threading.Thread(target=_write_responses, args=(pending, stdout), daemon=True)
+    writer.start()
+    try:
+        for line in stdin:
+            if not line.strip():
+                continue
+            request = _parse_line(line)
+            if isinstance(request, ValueError):
+                future: Future = Future()
+                future.set_result({"error": f"JSON 형식 오류: {request}"})
+            else:
+                future = service.submit(request)
+            pending.put(future)
+    finally:
+        pending.put(None)
+        writer.join()
+
+
+# =============================================================================
+# HTTP
+# =============================================================================
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """POST /tokenize, /detokenize, / (op 포함) · GET /stats, /health"""
+
+    protocol_version = "HTTP/1.1"
+    service: JasoJamoService = None
+    verbose = False
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send(200, {"stats": self.service.stats.snapshot()})
+        elif self.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": f"알 수 없는 경로: {self.path}"})
+
+    def do_POST(self) -> None:
+        op = {"/": None, "/tokenize": OP_TOKENIZE, "/detokenize": OP_DETOKENIZE}.get(self.path, "")
+        if op == "":
+            self._send(404, {"error": f"알 수 없는 경로: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send(413, {"error": f"요청 본문은 {MAX_BODY_BYTES:,}바이트 이하여야 합니다"})
+            return
+        try:
+            request = json.loads(self.rfile.read(length).decode("utf-8"))
+        except ValueError as e:
+            self._send(400, {"error": f"JSON 형식 오류: {e}"})
+            return
+        if op is not None and isinstance(request, dict):
+            request = {**request, "op": op}
+        response = self.service.call(request)
+        self._send(400 if "error" in response else 200, response)
+
+    def _send(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def make_http_server(
+    service: JasoJamoService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    verbose: bool = False,
+) -> ThreadingHTTPServer:
+    """HTTP 서버 생성 (port=0이면 빈 포트 사용, server_address로 확인)
+
+    연결마다 스레드가 요청을 받고 처리는 서비스의 작업 스레드에서 배치로 수행합니다.
+    """
+    handler = type("RequestHandler", (_RequestHandler,), {"service": service, "verbose": verbose})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(
+        prog="python -m jaso_jamo.serve", description="로컬 자소 분리/복원 서버 (JSON-lines / HTTP)"
+    )
+    parser.add_argument(
+        "--http", action="store_true", help="HTTP 서버로 실행 (기본값: 표준 입력/출력)"
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help="HTTP 바인드 주소")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="HTTP 포트")
+    parser.add_argument(
+        "--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="배치 하나에 묶을 최대 요청 수"
+    )
+    parser.add_argument(
+        "--max-delay-ms",
+        type=float,
+        default=DEFAULT_MAX_DELAY * 1000,
+        help="배치를 채우기 위해 기다리는 최대 시간 (ms)",
+    )
+    parser.add_argument("--slang-file", default=None, help="반복 자소 슬랭 사전 파일")
+    parser.add_argument("-v", "--verbose", action="store_true", help="HTTP 요청 로그 출력")
+    args = parser.parse_args(argv)
+
+    if args.slang_file:
+        engine = JasoJamoEngine(special_slang=SlangLexicon.from_file(args.slang_file))
+    else:
+        engine = JasoJamoEngine()
+    service = JasoJamoService(engine, max_batch=args.max_batch, max_delay=args.max_delay_ms / 1000)
+
+    try:
+        if args.http:
+            server = make_http_server(service, args.host, args.port, verbose=args.verbose)
+            host, port = server.server_address[:2]
+            print(f"jaso-jamo serving on http://{host}:{port}", file=sys.stderr)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.server_close()
+        else:
+            serve_stdio(service, sys.stdin, sys.stdout)
+    finally:
+        service.close()
+        print(json.dumps(service.stats.snapshot(), ensure_ascii=False), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+사전 반복 자소 슬랭 트라이 / 교체 가능한 슬랭 사전
+
+SPECIAL_SLANG 목록을 자소(한 글자) 단위 트라이로 컴파일합니다. 토큰 시퀀스를
+문자열로 이어 붙이지 않고 트라이를 따라가며 바로 비교하므로 사전 크기와 관계없이
+조회 비용은 비교하는 토큰 수에만 비례합니다. 항목 길이에는 제한이 없습니다.
+
+같은 항목 목록의 트라이는 compile_slang이 한 번만 컴파일하여 디코더끼리 공유합니다
+(트라이는 불변이므로 공유해도 안전합니다).
+
+SlangLexicon은 파일(한 줄에 한 항목 또는 JSON)에서 사전을 읽어 트라이로 컴파일하고,
+실행 중에 새 트라이로 통째로 교체합니다. 교체는 참조 대입 한 번이므로 디코더를
+다시 만들 필요가 없고, 복원 중인 호출은 시작할 때 읽은 트라이를 끝까지 사용합니다.
+
+Example:
+    >>> trie = SlangTrie(["ㅇㅋ", "ㄹㅇ", "ㅆㅅㅌㅊ"])
+    >>> trie.match_window(["ㄴ", "ㅔ", "ㅇ", "ㅋ"], 2, 4)
+    True
+    >>> trie.longest_match(["ㅆ", "ㅅ", "ㅌ", "ㅊ", "!"], 0)
+    4
+"""
+
+import os
+from _thread import allocate_lock  # threading.Lock과 같음 (import threading 비용 없이)
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .tables import DEFAULT_SPECIAL_SLANG
+
+# 노드에서 "여기서 끝나는 항목이 있음"을 나타내는 키.
+# 값은 빈 노드이므로 None 토큰이 들어와도 빈 노드로 내려가 일치하지 않음
+_TERMINAL = None
+
+
+class SlangTrie:
+    """반복 자소 슬랭 사전 트라이 (생성 후 변경하지 않음)
+
+    노드는 {자소: 자식 노드} 딕셔너리이며, 항목이 끝나는 노드에는 _TERMINAL 키가 있습니다.
+    토큰 하나가 트라이의 간선 하나에 대응하므로 여러 글자 토큰은 일치하지 않습니다.
+    """
+
+    __slots__ = ("_root", "entries")
+
+    def __init__(self, entries: Iterable[str] = ()):
+        """
+        Args:
+            entries: 슬랭 항목 (문자열이 아니거나 빈 항목은 무시)
+        """
+        root: Dict = {}
+        kept = []
+        for entry in entries:
+            if not isinstance(entry, str) or not entry:
+                continue
+            node = root
+            for char in entry:
+                node = node.setdefault(char, {})
+            if _TERMINAL not in node:
+                node[_TERMINAL] = {}
+                kept.append(entry)
+        self._root = root
+        # 중복 제거한 항목 (입력 순서 유지). FSM/NumPy 엔진 컴파일 키로 사용
+        self.entries: Tuple[str, ...] = tuple(kept)
+
+    def match_window(self, tokens: Sequence[str], start: int, end: int) -> bool:
+        """tokens[start:end]가 정확히 사전 항목 하나와 같은지 확인
+
+        "".join(tokens[start:end]) in SPECIAL_SLANG과 같지만 문자열을 만들지 않습니다.
+        """
+        node = self._root
+        for i in range(start, end):
+            node = node.get(tokens[i])
+            if node is None:
+                return False
+        return _TERMINAL in node
+
+    def iter_matches(
+        self, tokens: Sequence[str], start: int, end: Optional[int] = None
+    ) -> Iterator[int]:
+        """start에서 시작해 일치하는 모든 항목의 길이를 짧은 것부터 순회"""
+        if end is None:
+            end = len(tokens)
+        node = self._root
+        for i in range(start, end):
+            node = node.get(tokens[i])
+            if node is None:
+                return
+            if _TERMINAL in node:
+                yield i + 1 - start
+
+    def longest_match(self, tokens: Sequence[str], start: int, end: Optional[int] = None) -> int:
+        """start에서 시작하는 가장 긴 일치 항목 길이 (없으면 0)"""
+        longest = 0
+        for length in self.iter_matches(tokens, start, end):
+            longest = length
+        return longest
+
+    def __contains__(self, entry: object) -> bool:
+        if not isinstance(entry, str) or not entry:
+            return False
+        return self.match_window(entry, 0, len(entry))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __repr__(self) -> str:
+        return f"SlangTrie({list(self.entries)!r})"
+
+
+@lru_cache(maxsize=32)
+def _compile_slang(entries: Tuple[str, ...]) -> SlangTrie:
+    return SlangTrie(entries)
+
+
+def compile_slang(entries: Iterable[str]) -> SlangTrie:
+    """슬랭 목록을 트라이로 컴파일 (같은 목록은 한 번만 컴파일하여 공유)
+
+    Example:
+        >>> compile_slang(["ㅇㅋ", "ㄹㅇ"]) is compile_slang(("ㅇㅋ", "ㄹㅇ"))
+        True
+    """
+    if isinstance(entries, SlangTrie):
+        return entries
+    entries = tuple(entries)
+    try:
+        return _compile_slang(entries)
+    except TypeError:
+        # 해시할 수 없는 항목이 섞인 목록은 공유하지 않고 컴파일 (문자열이 아닌 항목은 무시됨)
+        return SlangTrie(entries)
+
+
+def load_slang_file(path: Union[str, "os.PathLike[str]"]) -> List[str]:
+    """슬랭 사전 파일 읽기
+
+    형식:
+        - JSON: 문자열 배열, 또는 {"special_slang": [...]} 객체
+        - 텍스트: 한 줄에 한 항목 (앞뒤 공백 제거, 빈 줄과 '#'으로 시작하는 줄 무시)
+
+    Args:
+        path: UTF-8 사전 파일 경로
+
+    Returns:
+        슬랭 항목 리스트
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    stripped = text.lstrip("\ufeff \t\r\n")
+    if stripped.startswith(("[", "{")):
+        import json
+
+        data = json.loads(stripped)
+        if isinstance(data, dict):
+            data = data.get("special_slang", [])
+        if not isinstance(data, list) or not all(isinstance(entry, str) for entry in data):
+            raise ValueError(f"슬랭 사전 JSON은 문자열 배열이어야 합니다: {path}")
+        return data
+
+    entries = []
+    for line in stripped.splitlines():
+        entry = line.strip()
+        if entry and not entry.startswith("#"):
+            entries.append(entry)
+    return entries
+
+
+class SlangLexicon:
+    """실행 중 교체 가능한 슬랭 사전
+
+    디코더 여러 개가 같은 사전을 공유할 수 있습니다
+    (JasoJamoDecoder(special_slang=lexicon)). 디코더는 호출마다 trie를 한 번 읽으며,
+    reload/swap은 새 트라이를 다 만든 뒤 참조만 바꾸므로 복원 호출을 막지 않습니다.
+
+    Example:
+        >>> lexicon = SlangLexicon(["ㅇㅋ"])
+        >>> "ㅇㅋ" in lexicon
+        True
+        >>> _ = lexicon.swap(["ㄹㅇ"])
+        >>> list(lexicon)
+        ['ㄹㅇ']
+    """
+
+    __slots__ = ("path", "_trie", "_reload_lock")
+
+    def __init__(
+        self,
+        entries: Iterable[str] = DEFAULT_SPECIAL_SLANG,
+        path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ):
+        """
+        Args:
+            entries: 초기 슬랭 항목 또는 SlangTrie (같은 목록의 트라이는 공유)
+            path: reload()가 다시 읽을 사전 파일 경로
+        """
+        self.path = path
+        self._trie = compile_slang(entries)
+        # 동시에 들어온 reload끼리만 직렬화 (복원 호출은 이 잠금을 사용하지 않음)
+        self._reload_lock = allocate_lock()
+
+    @classmethod
+    def from_file(cls, path: Union[str, "os.PathLike[str]"]) -> "SlangLexicon":
+        """사전 파일에서 생성"""
+        return cls(load_slang_file(path), path=path)
+
+    @property
+    def trie(self) -> SlangTrie:
+        """현재 트라이 (불변 스냅샷)"""
+        return self._trie
+
+    def swap(self, entries: Iterable[str]) -> SlangTrie:
+        """새 항목으로 트라이를 만들어 원자적으로 교체하고 이전 트라이를 반환 (O(사전 크기))"""
+        trie = SlangTrie(entries)
+        with self._reload_lock:
+            old, self._trie = self._trie, trie
+        return old
+
+    def reload(self, path: Optional[Union[str, "os.PathLike[str]"]] = None) -> SlangTrie:
+        """사전 파일을 다시 읽어 교체 (path를 주면 이후 reload도 그 파일 사용)
+
+        Returns:
+            새 트라이
+        """
+        if path is not None:
+            self.path = path
+        if self.path is None:
+            raise ValueError("reload할 사전 파일 경로가 없습니다")
+        self.swap(load_slang_file(self.path))
+        return self._trie
+
+    def __contains__(self, entry: object) -> bool:
+        return entry in self._trie
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._trie)
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def __repr__(self) -> str:
+        return f"SlangLexicon({len(self)} entries, path={self.path!r})"
@@ -0,0 +1,145 @@
+"""
+한글 자모 공유 테이블
+
+유니코드로 고정된 초성/중성/종성 테이블을 최초 사용 시 한 번만 생성합니다
+(모듈 로드 시에는 아무 테이블도 만들지 않음). 모든 JasoJamoTokenizer /
+JasoJamoDecoder 인스턴스가 같은 불변 객체를 참조하므로 인스턴스에는
+설정값(special_slang, check_slang_mid)만 남습니다.
+"""
+
+from _thread import allocate_lock  # threading.Lock과 같음 (import threading 비용 없이)
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+# 초성 19자
+CHO = (
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)  # fmt: skip
+
+# 중성 21자
+JUNG = (
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅘ", "ㅙ",
+    "ㅚ", "ㅛ", "ㅜ", "ㅝ", "ㅞ", "ㅟ", "ㅠ", "ㅡ", "ㅢ", "ㅣ",
+)  # fmt: skip
+
+# 종성 28자 (빈 종성 포함)
+JONG = (
+    "", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ",
+    "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)  # fmt: skip
+
+# 기본 사전 반복 자소 슬랭
+DEFAULT_SPECIAL_SLANG = (
+    "ㅇㅋ", "ㄱㅅ", "ㄳ", "ㄷㅊ", "ㅁㅊ", "ㅅㄱ", "ㅇㅈ", "ㅎㅇ", "ㅆㅅㅌㅊ", "ㄹㅇ",
+)  # fmt: skip
+
+
+# 토큰 문자 분류 코드
+JASO_NONE = 0  # 비자소 (한글 호환 자모가 아닌 토큰)
+JASO_CONSONANT = 1  # 자음 (초성 또는 종성)
+JASO_VOWEL = 2  # 모음 (중성)
+JASO_OTHER = 3  # 기타 자소 (0x3131-0x318E 중 자음/모음이 아닌 옛한글 등)
+
+
+class JamoTables(NamedTuple):
+    """자모 테이블 묶음 (불변)"""
+
+    CHO: Tuple[str, ...]
+    JUNG: Tuple[str, ...]
+    JONG: Tuple[str, ...]
+    CHO_SET: FrozenSet[str]
+    JUNG_SET: FrozenSet[str]
+    JONG_SET: FrozenSet[str]  # 빈 종성 제외
+    CONSONANTS: FrozenSet[str]  # 모든 자음 (초성 | 종성)
+    CHO_MAP: Dict[str, int]
+    JUNG_MAP: Dict[str, int]
+    JONG_MAP: Dict[str, int]
+    JASO_CLASS: Dict[str, int]  # 호환 자모 문자 → 분류 코드 (없으면 JASO_NONE)
+    CHO_BASE: Dict[str, int]  # 초성 → 음절 오프셋 (cho_idx * 21 * 28)
+    JUNG_BASE: Dict[str, int]  # 중성 → 음절 오프셋 (jung_idx * 28)
+    SYLLABLES: Tuple[str, ...]  # 19 x 21 x 28 음절 테이블 (오프셋 → 음절)
+
+
+def _build_tables() -> JamoTables:
+    """자모 테이블 생성"""
+    cho_set = frozenset(CHO)
+    jong_set = frozenset(JONG[1:])
+    consonants = jong_set | cho_set
+
+    jaso_class = {}
+    for code in range(0x3131, 0x318F):
+        char = chr(code)
+        if char in consonants:
+            jaso_class[char] = JASO_CONSONANT
+        elif char in JUNG:
+            jaso_class[char] = JASO_VOWEL
+        else:
+            jaso_class[char] = JASO_OTHER
+
+    return JamoTables(
+        CHO=CHO,
+        JUNG=JUNG,
+        JONG=JONG,
+        CHO_SET=cho_set,
+        JUNG_SET=frozenset(JUNG),
+        JONG_SET=jong_set,
+        CONSONANTS=consonants,
+        CHO_MAP={ch: i for i, ch in enumerate(CHO)},
+        JUNG_MAP={ch: i for i, ch in enumerate(JUNG)},
+        JONG_MAP={ch: i for i, ch in enumerate(JONG)},
+        JASO_CLASS=jaso_class,
+        CHO_BASE={ch: i * 21 * 28 for i, ch in enumerate(CHO)},
+        JUNG_BASE={ch: i * 28 for i, ch in enumerate(JUNG)},
+        SYLLABLES=tuple(chr(code) for code in range(0xAC00, 0xD7A4)),
+    )
+
+
+# 공유 싱글톤 (최초 get_jamo_tables 호출 시 생성)
+_TABLES: Optional[JamoTables] = None
+_TABLES_LOCK = allocate_lock()
+
+
+def get_jamo_tables() -> JamoTables:
+    """공유 자모 테이블 반환 (최초 호출 시 한 번만 생성, 스레드 안전)"""
+    tables = _TABLES
+    if tables is None:
+        tables = _load_tables()
+    return tables
+
+
+def _load_tables() -> JamoTables:
+    global _TABLES
+    with _TABLES_LOCK:
+        # 동시에 처음 호출되어도 모든 스레드가 같은 객체를 받도록 잠금 안에서 다시 확인
+        if _TABLES is None:
+            _TABLES = _build_tables()
+        return _TABLES
+
+
+def __getattr__(name: str):
+    """JAMO_TABLES / JASO_CLASS 모듈 속성은 처음 접근할 때 테이블 생성"""
+    if name == "JAMO_TABLES":
+        return get_jamo_tables()
+    if name == "JASO_CLASS":
+        return get_jamo_tables().JASO_CLASS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LazyTable:
+    """클래스 속성용 공유 테이블 참조 (처음 읽을 때 테이블 생성)
+
+    Example:
+        >>> class Decoder:
+        ...     CHO = LazyTable("CHO_SET")
+        >>> "ㄱ" in Decoder.CHO
+        True
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        return getattr(get_jamo_tables(), self.name)
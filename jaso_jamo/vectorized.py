@@ -0,0 +1,243 @@
+"""
+NumPy 벡터화 자소 분리 / 복원
+
+대용량 말뭉치 준비용 모듈입니다. 텍스트 전체를 uint32 코드 포인트 배열로 받아
+공유 자모 테이블(jaso_jamo.tables의 CHO/JUNG/JONG) 순서의 음절 산술(code % 28, code // 28)을
+배열 연산으로 한 번에 계산하므로 문자마다 Python 코드를 실행하지 않습니다.
+
+복원(recompose)은 JasoJamoDecoder의 5단계 규칙을 이동 배열 비교로 옮긴 것으로
+JasoJamoDecoder(use_numpy=True)가 사용합니다.
+
+numpy가 필요합니다 (선택 의존성: ``pip install jaso-jamo[numpy]``).
+
+Example:
+    >>> import numpy as np
+    >>> from jaso_jamo import vectorized
+    >>> codes = np.frombuffer("한글".encode("utf-32-le"), dtype=np.uint32)
+    >>> vectorized.codepoints_to_str(vectorized.decompose(codes))
+    'ㅎㅏㄴㄱㅡㄹ'
+"""
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - numpy 미설치 환경
+    raise ImportError("jaso_jamo.vectorized 모듈은 numpy가 필요합니다: pip install numpy") from e
+
+from functools import lru_cache
+from typing import Hashable, Iterable, Tuple
+
+from .tables import JASO_CONSONANT, JASO_NONE, JASO_VOWEL, get_jamo_tables
+
+# 선택 모듈이므로 import 시 공유 테이블을 생성하여 조회 배열을 만듦
+JAMO_TABLES = get_jamo_tables()
+JASO_CLASS = JAMO_TABLES.JASO_CLASS
+
+# 완성형 음절 범위
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_COUNT = 11172
+
+# 인덱스 → 호환 자모 코드 포인트 (종성 0번은 빈 종성이므로 사용하지 않음)
+CHO_CODES = np.array([ord(ch) for ch in JAMO_TABLES.CHO], dtype=np.uint32)
+JUNG_CODES = np.array([ord(ch) for ch in JAMO_TABLES.JUNG], dtype=np.uint32)
+JONG_CODES = np.array([ord(ch) if ch else 0 for ch in JAMO_TABLES.JONG], dtype=np.uint32)
+
+_CODEPOINT_DTYPE = np.dtype("<u4")
+
+# 호환 자모 범위 (0x3131-0x318E) 오프셋 → 분류 코드 / 조합 인덱스
+_JASO_START = 0x3131
+_JASO_SIZE = 0x318E - _JASO_START + 1
+_JASO_CHARS = [chr(_JASO_START + off) for off in range(_JASO_SIZE)]
+# 마지막 칸은 범위 밖 문자(비자소)용
+_CLASS_LOOKUP = np.array(
+    [JASO_CLASS.get(ch, JASO_NONE) for ch in _JASO_CHARS] + [JASO_NONE], dtype=np.uint8
+)
+# 초성으로 쓸 수 없는 자음은 -1
+_CHO_LOOKUP = np.array(
+    [JAMO_TABLES.CHO_MAP.get(ch, -1) for ch in _JASO_CHARS] + [-1], dtype=np.int32
+)
+_JUNG_LOOKUP = np.array(
+    [JAMO_TABLES.JUNG_MAP.get(ch, 0) for ch in _JASO_CHARS] + [0], dtype=np.int32
+)
+# 종성으로 쓸 수 없는 자음은 0 (종성 없음)
+_JONG_LOOKUP = np.array(
+    [JAMO_TABLES.JONG_MAP.get(ch, 0) for ch in _JASO_CHARS] + [0], dtype=np.int32
+)
+# 선행 탐색 창 (1단계: t0~t5) 만큼 배열 끝을 비자소로 채움
+_PAD = 6
+
+
+def str_to_codepoints(text: str) -> np.ndarray:
+    """문자열 → uint32 코드 포인트 배열 (UTF-32 버퍼를 그대로 사용)"""
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=_CODEPOINT_DTYPE)
+
+
+def codepoints_to_str(codes: np.ndarray) -> str:
+    """uint32 코드 포인트 배열 → 문자열"""
+    data = np.ascontiguousarray(codes, dtype=_CODEPOINT_DTYPE).tobytes()
+    return data.decode("utf-32-le", "surrogatepass")
+
+
+def decompose_indices(
+    codes: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """코드 포인트 배열의 음절 여부와 초성/중성/종성 인덱스 계산
+
+    Args:
+        codes: uint32 코드 포인트 배열
+
+    Returns:
+        (음절 마스크, 초성 인덱스, 중성 인덱스, 종성 인덱스).
+        음절이 아닌 위치의 인덱스 값은 의미가 없습니다.
+    """
+    codes = np.asarray(codes, dtype=np.uint32)
+    # 부호 없는 뺄셈: 0xAC00 미만은 큰 값으로 넘어가므로 비교 한 번으로 범위 검사
+    code = codes - np.uint32(SYLLABLE_BASE)
+    is_syllable = code < SYLLABLE_COUNT
+    code = np.where(is_syllable, code, 0)
+
+    jong_idx = code % 28
+    jung_idx = (code // 28) % 21
+    cho_idx = (code // 28) // 21
+    return is_syllable, cho_idx, jung_idx, jong_idx
+
+
+def decompose(codes: np.ndarray) -> np.ndarray:
+    """코드 포인트 배열을 자소 코드 포인트 배열로 분해
+
+    음절은 초성/중성/(종성) 코드 포인트로, 그 밖의 문자는 그대로 출력합니다.
+    결과는 같은 텍스트에 대한 JasoJamoTokenizer.tokenize_to_str와 동일합니다
+    (길이 제한 없음).
+
+    Args:
+        codes: uint32 코드 포인트 배열
+
+    Returns:
+        uint32 자소 코드 포인트 배열
+    """
+    codes = np.asarray(codes, dtype=np.uint32)
+    is_syllable, cho_idx, jung_idx, jong_idx = decompose_indices(codes)
+    has_jong = is_syllable & (jong_idx > 0)
+
+    # 문자별 출력 길이: 비음절 1, 받침 없는 음절 2, 받침 있는 음절 3
+    width = 1 + is_syllable.astype(np.intp) + has_jong
+    start = np.cumsum(width) - width
+
+    out = np.empty(int(width.sum()), dtype=np.uint32)
+    out[start] = np.where(is_syllable, CHO_CODES[cho_idx], codes)
+    out[start[is_syllable] + 1] = JUNG_CODES[jung_idx[is_syllable]]
+    out[start[has_jong] + 2] = JONG_CODES[jong_idx[has_jong]]
+    return out
+
+
+def decompose_text(text: str) -> str:
+    """텍스트를 자소 문자열로 분해 (벡터화 경로)"""
+    if not text:
+        return ""
+    return codepoints_to_str(decompose(str_to_codepoints(text)))
+
+
+@lru_cache(maxsize=32)
+def _slang3_keys(special_slang: Iterable[str]) -> np.ndarray:
+    """자음 3개로 된 사전 슬랭 항목 → 정수 키 배열 (정렬됨)"""
+    keys = set()
+    for slang in special_slang:
+        if isinstance(slang, str) and len(slang) == 3:
+            if all(JASO_CLASS.get(ch) == JASO_CONSONANT for ch in slang):
+                keys.add(_slang_key(*(ord(ch) - _JASO_START for ch in slang)))
+    return np.array(sorted(keys), dtype=np.int64)
+
+
+def _slang_key(a, b, c):
+    """자음 오프셋 세 개 → 정수 키 (스칼라/배열 공용)"""
+    return (a * _JASO_SIZE + b) * _JASO_SIZE + c
+
+
+def recompose(
+    codes: np.ndarray,
+    special_slang: Iterable[str] = (),
+    check_slang_mid: bool = False,
+) -> np.ndarray:
+    """자소 코드 포인트 배열을 음절 코드 포인트 배열로 복원
+
+    한 글자 토큰을 이어 붙인 자소 문자열에 대한 JasoJamoDecoder.detokenize와
+    결과가 같습니다. 음절 시작 위치(자음 + 모음)는 서로 겹치지 않으므로 모든 위치를
+    한 번에 판정할 수 있습니다:
+        - 종성: t2가 자음이고 t3가 모음이 아님 (2/3단계)
+        - 단, 입력 끝의 동일 자음 2개(t2 == t3)는 종성으로 붙이지 않음 (2단계)
+        - 단, 1단계 후보(t2~t4 자음, 어절 끝 또는 check_slang_mid)가 동일 자음
+          3개 반복이거나 3글자 사전 슬랭이면 종성으로 붙이지 않음
+          (2글자 사전 슬랭은 어차피 t2를 종성으로 붙이므로 결과가 같음)
+
+    Args:
+        codes: uint32 자소 코드 포인트 배열
+        special_slang: 사전 반복 자소 슬랭 목록 (튜플 또는 SlangTrie면 키 배열을 캐시)
+        check_slang_mid: 어절 중간 반복 자소 슬랭 처리 여부
+
+    Returns:
+        uint32 코드 포인트 배열
+    """
+    codes = np.asarray(codes, dtype=np.uint32)
+    n = len(codes)
+    if n == 0:
+        return codes.copy()
+
+    # 범위 밖 문자는 마지막 칸(비자소)으로 모음
+    offset = np.minimum(codes - np.uint32(_JASO_START), _JASO_SIZE).astype(np.intp)
+    offset = np.concatenate([offset, np.full(_PAD, _JASO_SIZE, dtype=np.intp)])
+    cls = _CLASS_LOOKUP[offset]
+    is_c = cls == JASO_CONSONANT
+    is_v = cls == JASO_VOWEL
+
+    # 위치 i 기준 t0~t5 창
+    c0, c2, c3, c4 = is_c[:n], is_c[2 : n + 2], is_c[3 : n + 3], is_c[4 : n + 4]
+    o2, o3, o4 = offset[2 : n + 2], offset[3 : n + 3], offset[4 : n + 4]
+
+    start = c0 & is_v[1 : n + 1]
+    jong = start & c2 & ~is_v[3 : n + 3]
+
+    # [2단계 안전장치] 입력 끝 동일 자음 2개 (i + 4 == n)
+    if n >= 4:
+        i = n - 4
+        if jong[i] and c3[i] and o2[i] == o3[i]:
+            jong[i] = False
+
+    # [1단계] 반복 자소 슬랭 후보
+    candidate = jong & c3 & c4
+    if not check_slang_mid:
+        candidate &= cls[5 : n + 5] == JASO_NONE
+    if candidate.any():
+        idx = np.flatnonzero(candidate)
+        a, b, c = o2[idx], o3[idx], o4[idx]
+        slang = (a == b) & (b == c)
+        if not isinstance(special_slang, Hashable):
+            special_slang = tuple(special_slang)
+        keys = _slang3_keys(special_slang)
+        if len(keys):
+            slang |= np.isin(_slang_key(a, b, c), keys)
+        jong[idx[slang]] = False
+
+    # 음절 조합: 초성으로 쓸 수 없는 자음이면 조합하지 않고 토큰을 그대로 유지
+    cho_idx = _CHO_LOOKUP[offset[:n]]
+    valid = start & (cho_idx >= 0)
+    pos = np.flatnonzero(valid)
+    jong_idx = np.where(jong[pos], _JONG_LOOKUP[o2[pos]], 0)
+    syllables = SYLLABLE_BASE + cho_idx[pos] * 588 + _JUNG_LOOKUP[offset[pos + 1]] * 28 + jong_idx
+
+    out = codes.copy()
+    out[pos] = syllables
+    keep = np.ones(n, dtype=bool)
+    keep[pos + 1] = False
+    keep[pos[jong[pos]] + 2] = False
+    return out[keep]
+
+
+def recompose_text(
+    jaso: str,
+    special_slang: Iterable[str] = (),
+    check_slang_mid: bool = False,
+) -> str:
+    """자소 문자열을 한글 텍스트로 복원 (벡터화 경로)"""
+    if not jaso:
+        return ""
+    codes = str_to_codepoints(jaso)
+    return codepoints_to_str(recompose(codes, special_slang, check_slang_mid))
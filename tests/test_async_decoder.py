@@ -0,0 +1,130 @@
+"""
+asyncio 자소 복원기 테스트
+"""
+
+import asyncio
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import AsyncJasoJamoDecoder, JasoJamoDecoder, tokenize
+
+TEXTS = ["안녕하세요", "가요ㅋㅋㅋ네", "바다ㄱㄱ", "네ㅇㅋ", "Python과 한글!", "값을깎다"]
+
+
+def _cases():
+    rnd = random.Random(0)
+    alphabet = list("ㄱㄴㄷㅋㅇㄲㄳㅏㅓㅗㅡㅣ !") + ["<unk>"]
+    cases = [tokenize(text) for text in TEXTS]
+    cases += [[rnd.choice(alphabet) for _ in range(rnd.randint(0, 40))] for _ in range(200)]
+    cases += [tokenize(" ".join(TEXTS) * 30), "ㄱㅏ", None, (), tuple(tokenize("한글"))]
+    return cases
+
+
+@pytest.mark.parametrize("threshold", [0, 16, 10**6])
+def test_same_as_decoder(threshold):
+    """바로 복원/작업자 복원 모두 JasoJamoDecoder.detokenize와 동일"""
+    cases = _cases()
+    for mid in (False, True):
+        sync = JasoJamoDecoder(check_slang_mid=mid)
+        expected = [sync.detokenize(tokens) for tokens in cases]
+
+        async def run():
+            async with AsyncJasoJamoDecoder(
+                check_slang_mid=mid, inline_threshold=threshold
+            ) as decoder:
+                single = [await decoder.detokenize(tokens) for tokens in cases]
+                many = await decoder.detokenize_many(cases)
+            return single, many
+
+        single, many = asyncio.run(run())
+        assert single == expected
+        assert many == expected
+
+
+def test_large_input_offloaded_and_bounded():
+    """긴 입력은 작업자 스레드에서 실행되고 동시 실행 수는 max_concurrency 이하"""
+    active = 0
+    peak = 0
+    threads = set()
+    lock = threading.Lock()
+
+    class SlowDecoder(JasoJamoDecoder):
+        def detokenize(self, tokens):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+                threads.add(threading.get_ident())
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return super().detokenize(tokens)
+
+    tokens = tokenize("안녕하세요 " * 20)
+    executor = ThreadPoolExecutor(max_workers=8)
+    decoder = AsyncJasoJamoDecoder(inline_threshold=10, max_concurrency=2, executor=executor)
+    decoder._decoder = SlowDecoder()
+    results = asyncio.run(decoder.detokenize_many([tokens] * 8))
+    decoder.close()
+    # 직접 넘긴 풀은 종료하지 않음
+    assert executor.submit(lambda: 1).result() == 1
+    executor.shutdown()
+
+    assert results == [JasoJamoDecoder().detokenize(tokens)] * 8
+    assert 1 <= peak <= 2
+    assert threading.get_ident() not in threads
+
+
+def test_aexit_does_not_block_loop():
+    """async with 종료 시 진행 중인 복원을 기다리는 동안에도 이벤트 루프는 다른 작업 실행"""
+
+    class SlowDecoder(JasoJamoDecoder):
+        def detokenize(self, tokens):
+            time.sleep(0.3)
+            return super().detokenize(tokens)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.ensure_future(ticker())
+        decoder = AsyncJasoJamoDecoder(inline_threshold=0)
+        decoder._decoder = SlowDecoder()
+        async with decoder:
+            pending = asyncio.ensure_future(decoder.detokenize(["ㄱ", "ㅏ"]))
+            # 작업자 스레드에서 복원이 시작될 때까지 대기
+            await asyncio.sleep(0.05)
+            before = ticks
+        during = ticks - before
+        ticking.cancel()
+        return await pending, during
+
+    result, during = asyncio.run(run())
+    assert result == "가"
+    assert during >= 5
+
+
+def test_errors_propagate():
+    """문자열이 아닌 토큰은 동기 디코더와 같이 TypeError"""
+    decoder = AsyncJasoJamoDecoder(inline_threshold=2)
+    with pytest.raises(TypeError):
+        asyncio.run(decoder.detokenize(["ㄱ", "ㅏ", 1]))
+    with pytest.raises(TypeError):
+        asyncio.run(decoder.detokenize_many([tokenize("안녕하세요"), ["ㄱ", 1]]))
+    decoder.close()
+    with pytest.raises(ValueError):
+        AsyncJasoJamoDecoder(max_concurrency=0)
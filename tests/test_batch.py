@@ -0,0 +1,32 @@
+"""
+배치 API 테스트
+"""
+
+import sys
+import types
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import detokenize, detokenize_batch, tokenize, tokenize_batch
+
+
+def test_batch_matches_single_calls():
+    """배치 결과가 문장별 호출 결과와 동일한지 확인"""
+    sentences = ["안녕하세요", "가요ㅋㅋㅋ", "", "바다ㄱㄱ", "Hello 한글"]
+
+    token_lists = list(tokenize_batch(sentences))
+    assert token_lists == [tokenize(s) for s in sentences]
+
+    for mid in (False, True):
+        restored = list(detokenize_batch(token_lists, check_slang_mid=mid))
+        assert restored == [detokenize(t, check_slang_mid=mid) for t in token_lists]
+
+
+def test_batch_is_lazy_generator():
+    """배치 API는 제너레이터로 결과를 순차 반환"""
+    batch = tokenize_batch(iter(["한글", "자소"]))
+    assert isinstance(batch, types.GeneratorType)
+    assert next(batch) == ["ㅎ", "ㅏ", "ㄴ", "ㄱ", "ㅡ", "ㄹ"]
+    assert next(detokenize_batch(batch)) == "자소"
@@ -0,0 +1,105 @@
+"""
+멀티프로세스 일괄 처리 테스트
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, JasoJamoTokenizer, bulk
+
+LINES = [
+    "안녕하세요 반갑습니다",
+    "가요ㅋㅋㅋ",
+    "",
+    "값을깎다 바다ㄱㄱ",
+    "Hello 한글!",
+    "네ㅇㅋ",
+] * 200
+
+
+def write_corpus(path: Path, trailing_newline: bool = True) -> str:
+    text = "\n".join(LINES) + ("\n" if trailing_newline else "")
+    path.write_text(text, encoding="utf-8")
+    return text
+
+
+def test_plan_shards_on_line_boundaries(tmp_path):
+    """샤드 경계는 모두 줄 시작이고 구간이 파일 전체를 덮음"""
+    path = tmp_path / "corpus.txt"
+    write_corpus(path)
+    data = path.read_bytes()
+    shards = bulk.plan_shards(path, 7, min_shard_bytes=100)
+    assert len(shards) > 1
+    assert shards[0][0] == 0 and shards[-1][1] == len(data)
+    for (_, end), (start, _) in zip(shards, shards[1:]):
+        assert end == start and data[end - 1 : end] == b"\n"
+
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+    assert bulk.plan_shards(empty, 4) == []
+
+
+def test_tokenize_merged_matches_tokenizer(tmp_path):
+    """병합 출력은 전체 텍스트를 한 번에 분리한 결과와 동일 (워커 2개)"""
+    path = tmp_path / "corpus.txt"
+    text = write_corpus(path, trailing_newline=False)
+    output = tmp_path / "out.txt"
+    report = bulk.run_bulk([path], output, jobs=2, min_shard_bytes=100)
+    assert report.shards > 1 and report.lines == len(LINES)
+    assert sum(w.lines for w in report.workers) == len(LINES)
+    expected = JasoJamoTokenizer(on_overflow="stream").tokenize_to_str(text)
+    assert output.read_text(encoding="utf-8") == expected
+
+
+def test_detokenize_sharded_and_roundtrip(tmp_path):
+    """샤드별 출력은 순서대로 이으면 줄 단위 복원 결과와 동일"""
+    tokenizer = JasoJamoTokenizer()
+    decoder = JasoJamoDecoder()
+    path = tmp_path / "jaso.txt"
+    jaso = "\n".join(tokenizer.tokenize_to_str(line) for line in LINES) + "\n"
+    path.write_text(jaso, encoding="utf-8")
+
+    report = bulk.run_bulk(
+        [path], tmp_path / "out.txt", mode="detokenize", jobs=1, sharded=True, min_shard_bytes=100
+    )
+    assert len(report.outputs) == report.shards > 1
+    restored = "".join(Path(p).read_text(encoding="utf-8") for p in report.outputs)
+    expected = [decoder.detokenize(tokenizer.tokenize(line)) for line in LINES]
+    assert restored.split("\n")[:-1] == expected
+
+    corpus = tmp_path / "corpus.txt"
+    write_corpus(corpus)
+    report = bulk.run_bulk(
+        [corpus], tmp_path / "rt.txt", mode="roundtrip", jobs=1, min_shard_bytes=100
+    )
+    mismatches = sum(decoder.detokenize(tokenizer.tokenize(line)) != line for line in LINES)
+    assert report.mismatches == mismatches
+
+
+def test_long_lines_not_truncated(monkeypatch):
+    """분리/복원 모두 MAX_TOKENS보다 긴 줄을 자르지 않음 (process_block 공개 API)"""
+    monkeypatch.setattr(JasoJamoDecoder, "MAX_TOKENS", 8)
+    # 잘못된 UTF-8 바이트(\xff)는 그대로 보존
+    data = "안녕하세요 가요ㅋㅋㅋ\n값을깎다".encode("utf-8") + b"\xff"
+    text = data.decode("utf-8", "surrogateescape")
+    jaso = JasoJamoTokenizer().tokenize_to_str(text)
+
+    bulk.init_worker("tokenize")
+    assert bulk.process_block(data) == (jaso.encode("utf-8", "surrogateescape"), 0)
+    bulk.init_worker("detokenize")
+    assert bulk.process_block(jaso.encode("utf-8", "surrogateescape")) == (data, 0)
+    bulk.init_worker("roundtrip")
+    assert bulk.process_block(data) == (data, 0)
+
+
+def test_cli(tmp_path, capsys):
+    """명령줄 실행 및 처리량 보고"""
+    path = tmp_path / "corpus.txt"
+    write_corpus(path)
+    output = tmp_path / "out.txt"
+    assert bulk.main([str(path), "-o", str(output), "--jobs", "1"]) == 0
+    assert output.read_text(encoding="utf-8").startswith("ㅇㅏㄴㄴㅕㅇ")
+    assert "MB/s" in capsys.readouterr().err
@@ -0,0 +1,102 @@
+"""
+명령줄 도구 테스트 (jaso-jamo tokenize | detokenize)
+"""
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, JasoJamoTokenizer
+from jaso_jamo.cli import iter_line_blocks, main, run
+
+ROOT = Path(__file__).parent.parent
+
+LINES = ["안녕하세요", "가요ㅋㅋㅋ네 값을깎다", "", "Python과 한글!", "바다ㄱㄱ\r"] * 50
+
+
+def _expected_tokenize(text):
+    return JasoJamoTokenizer().tokenize_to_str(text)
+
+
+def _expected_detokenize(text, check_slang_mid=False):
+    decoder = JasoJamoDecoder(check_slang_mid=check_slang_mid)
+    return "\n".join(decoder.detokenize(list(line)) for line in text.split("\n"))
+
+
+def test_line_blocks_split_on_newlines():
+    """블록은 줄 경계에서 끝나고 이어 붙이면 원래 입력"""
+
+    class Chunked(io.RawIOBase):
+        """read1이 최대 7바이트씩 돌려주는 파이프 흉내"""
+
+        def __init__(self, data):
+            self._data = io.BytesIO(data)
+
+        def read1(self, size):
+            return self._data.read(min(size, 7))
+
+    data = "\n".join(LINES[:10]).encode("utf-8") + b"\n\xff\xfe tail"
+    blocks = list(iter_line_blocks(Chunked(data), read_size=64))
+    assert b"".join(blocks) == data
+    assert all(block.endswith(b"\n") for block in blocks[:-1])
+
+
+def test_tokenize_detokenize_files(tmp_path):
+    """파일 입력/출력 결과는 라이브러리 결과와 동일 (작은 블록, 여러 파일)"""
+    text = "\n".join(LINES) + "\n"
+    src = tmp_path / "in.txt"
+    src.write_text(text, encoding="utf-8")
+    jaso = tmp_path / "in.jaso"
+    assert main(["tokenize", str(src), "-o", str(jaso), "--read-size", "100"]) == 0
+    assert jaso.read_bytes().decode("utf-8") == _expected_tokenize(text)
+
+    restored = tmp_path / "out.txt"
+    assert main(["detokenize", str(jaso), str(jaso), "-o", str(restored)]) == 0
+    expected = _expected_detokenize(_expected_tokenize(text))
+    assert restored.read_bytes().decode("utf-8") == expected * 2
+
+    mid = tmp_path / "mid.txt"
+    assert main(["detokenize", "--check-slang-mid", str(jaso), "-o", str(mid)]) == 0
+    assert mid.read_bytes().decode("utf-8") == _expected_detokenize(
+        _expected_tokenize(text), check_slang_mid=True
+    )
+
+
+def test_stdin_and_invalid_utf8():
+    """표준 입력 처리, 잘못된 UTF-8 바이트와 개행 없는 마지막 줄 보존"""
+    data = "한글\n가요ㅋㅋㅋ".encode("utf-8") + b"\xff\n\xfe"
+    out = io.BytesIO()
+    run("tokenize", ["-"], out, stdin=io.BytesIO(data))
+    assert out.getvalue().decode("utf-8", "surrogateescape") == _expected_tokenize(
+        data.decode("utf-8", "surrogateescape")
+    )
+    restored = io.BytesIO()
+    run("detokenize", [], restored, stdin=io.BytesIO(out.getvalue()))
+    assert restored.getvalue() == data
+
+
+def test_jobs_same_output(tmp_path):
+    """--jobs 병렬 처리 결과는 단일 프로세스와 동일 (입력 순서 유지)"""
+    src = tmp_path / "in.txt"
+    src.write_text("\n".join(LINES * 4) + "\n", encoding="utf-8")
+    single = tmp_path / "single.txt"
+    parallel = tmp_path / "parallel.txt"
+    assert main(["tokenize", str(src), "-o", str(single), "--read-size", "512"]) == 0
+    assert main(["tokenize", str(src), "-o", str(parallel), "--read-size", "512", "-j", "2"]) == 0
+    assert parallel.read_bytes() == single.read_bytes()
+
+
+def test_module_entry_point():
+    """python -m jaso_jamo 파이프 실행"""
+    result = subprocess.run(
+        [sys.executable, "-m", "jaso_jamo", "tokenize"],
+        input="한글\n".encode("utf-8"),
+        stdout=subprocess.PIPE,
+        cwd=str(ROOT),
+        check=True,
+    )
+    assert result.stdout.decode("utf-8") == "ㅎㅏㄴㄱㅡㄹ\n"
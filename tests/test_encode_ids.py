@@ -0,0 +1,94 @@
+"""
+정수 ID 인코딩 테스트
+"""
+
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, JasoJamoTokenizer
+from jaso_jamo.JasoJamoTokenizer import JAMO_ID_START, JAMO_VOCAB_SIZE
+
+TEXTS = ["한글", "가요ㅋㅋㅋ", "Hello 안녕!", "바다ㄱㄱ", "😀 이모지 없음", "ㅥ 옛자모"]
+
+
+def test_id_space():
+    """고정 ID 어휘: 호환 자모 51개 + 통과 코드 포인트"""
+    tokenizer = JasoJamoTokenizer()
+    for text in TEXTS:
+        ids = tokenizer.encode(text)
+        assert isinstance(ids, array)
+        expected = []
+        for tok in tokenizer.tokenize(text):
+            code = ord(tok)
+            if JAMO_ID_START <= code < JAMO_ID_START + JAMO_VOCAB_SIZE:
+                expected.append(code - JAMO_ID_START)
+            else:
+                expected.append(code + JAMO_VOCAB_SIZE)
+        assert ids.tolist() == expected
+    assert len(tokenizer.encode("")) == 0
+    assert len(tokenizer.encode(None)) == 0
+
+
+def test_round_trip():
+    """encode → decode_ids 결과가 tokenize → detokenize와 동일"""
+    tokenizer = JasoJamoTokenizer()
+    for mid in (False, True):
+        decoder = JasoJamoDecoder(check_slang_mid=mid)
+        for text in TEXTS:
+            ids = tokenizer.encode(text)
+            expected = decoder.detokenize(tokenizer.tokenize(text))
+            assert decoder.decode_ids(ids) == expected
+            assert decoder.decode_ids(ids.tolist()) == expected
+    assert JasoJamoDecoder().decode_ids([]) == ""
+
+
+def test_code_points_near_max():
+    """U+10FFFF 근처 코드 포인트 (ID가 U+10FFFF를 넘는 경우 포함) 왕복"""
+    tokenizer = JasoJamoTokenizer()
+    decoder = JasoJamoDecoder()
+    edge = "".join(chr(code) for code in range(0x10FFC0, 0x110000))
+    for text in (edge, "\U0010ffff", "한글\U0010ffff가요ㅋㅋㅋ\U0010ffcd", "\U0010ffcc\U0010ffcd"):
+        ids = tokenizer.encode(text)
+        assert ids.tolist() == [
+            (
+                code - JAMO_ID_START
+                if JAMO_ID_START <= code < JAMO_ID_START + JAMO_VOCAB_SIZE
+                else code + JAMO_VOCAB_SIZE
+            )
+            for code in map(ord, tokenizer.tokenize(text))
+        ]
+        expected = decoder.detokenize(tokenizer.tokenize(text))
+        assert decoder.decode_ids(ids) == expected
+        assert decoder.decode_ids(ids.tolist()) == expected
+    with pytest.raises(ValueError):
+        decoder.decode_ids([0x10FFFF + JAMO_VOCAB_SIZE + 1])
+
+
+def test_id_tables_do_not_grow():
+    """처음 보는 통과 문자를 변환해도 공유 ID 테이블 크기는 그대로"""
+    from jaso_jamo.JasoJamoTokenizer import _get_id_table, _get_inverse_id_table
+
+    tokenizer = JasoJamoTokenizer()
+    decoder = JasoJamoDecoder()
+    sizes = len(_get_id_table()), len(_get_inverse_id_table())
+    text = "".join(chr(code) for code in range(0x4E00, 0x4E00 + 5000)) + " 한글 abc"
+    assert decoder.decode_ids(tokenizer.encode(text)) == decoder.detokenize(
+        tokenizer.tokenize(text)
+    )
+    assert (len(_get_id_table()), len(_get_inverse_id_table())) == sizes
+
+
+def test_numpy_buffer():
+    """numpy 배열과 복사 없이 호환"""
+    np = pytest.importorskip("numpy")
+    tokenizer = JasoJamoTokenizer()
+    decoder = JasoJamoDecoder()
+    ids = np.frombuffer(tokenizer.encode("안녕하세요"), dtype=np.uint32)
+    assert decoder.decode_ids(ids) == "안녕하세요"
+    assert decoder.decode_ids(ids.astype(np.int64)) == "안녕하세요"
@@ -0,0 +1,107 @@
+"""
+스레드 안전 무상태 엔진 테스트
+"""
+
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, JasoJamoEngine, JasoJamoTokenizer, detokenize, tokenize
+from jaso_jamo.engine import default_engine
+from jaso_jamo.fsm import compile_fsm
+from jaso_jamo.slang import SlangLexicon
+
+TEXTS = [
+    "안녕하세요",
+    "가요ㅋㅋㅋ네",
+    "바다ㄱㄱ",
+    "하ㄱㄱㄱ요",
+    "네ㅇㅋ 네ㄱㄴㄷ",
+    "Python과 한글!",
+    "값을깎다",
+]
+
+
+def _random_tokens(rnd):
+    alphabet = list("ㄱㄴㄷㅋㅇㄲㄳㅏㅓㅗㅡㅣ !") + ["<unk>"]
+    return [rnd.choice(alphabet) for _ in range(rnd.randint(0, 12))]
+
+
+def test_matches_tokenizer_and_decoder():
+    """호출 옵션별 결과가 같은 옵션의 토크나이저/디코더와 동일"""
+    engine = JasoJamoEngine()
+    tokenizer = JasoJamoTokenizer()
+    rnd = random.Random(0)
+    cases = [tokenize(text) for text in TEXTS] + [_random_tokens(rnd) for _ in range(500)]
+    for slang in (None, ["ㄱㄴㄷ", "ㅇㅋ"]):
+        for mid in (False, True):
+            if slang is None:
+                decoder = JasoJamoDecoder(check_slang_mid=mid)
+            else:
+                decoder = JasoJamoDecoder(check_slang_mid=mid, special_slang=slang)
+            for tokens in cases:
+                expected = decoder.detokenize(tokens)
+                assert engine.detokenize(tokens, mid, slang) == expected, (tokens, mid, slang)
+                assert engine.detokenize(tuple(tokens), mid, slang) == expected
+    for text in TEXTS:
+        assert engine.tokenize(text) == tokenizer.tokenize(text)
+    assert engine.detokenize("ㄱㅏ") == ""
+    assert engine.detokenize([]) == ""
+
+
+def test_per_call_options_do_not_leak():
+    """호출 인자는 엔진 상태를 바꾸지 않음"""
+    engine = JasoJamoEngine()
+    tokens = tokenize("네ㄱㄴㄷ")
+    default = engine.detokenize(tokens)
+    assert engine.detokenize(tokens, special_slang=["ㄱㄴㄷ"]) != default
+    assert engine.detokenize(tokens) == default
+    assert engine.special_slang is engine.special_slang
+
+
+def test_shared_lexicon_swap():
+    """공유 SlangLexicon 교체는 다음 호출부터 반영"""
+    lexicon = SlangLexicon([])
+    engine = JasoJamoEngine(special_slang=lexicon)
+    tokens = tokenize("네ㄱㄴㄷ")
+    before = engine.detokenize(tokens)
+    lexicon.swap(["ㄱㄴㄷ"])
+    assert engine.detokenize(tokens) == JasoJamoDecoder(special_slang=["ㄱㄴㄷ"]).detokenize(tokens)
+    assert engine.detokenize(tokens) != before
+
+
+def test_concurrent_mixed_options():
+    """여러 스레드가 서로 다른 옵션으로 엔진 하나를 공유해도 결과 동일"""
+    engine = JasoJamoEngine()
+    rnd = random.Random(1)
+    jobs = []
+    for _ in range(2000):
+        tokens = tokenize(rnd.choice(TEXTS)) if rnd.random() < 0.5 else _random_tokens(rnd)
+        mid = rnd.random() < 0.5
+        slang = rnd.choice([None, ("ㄱㄴㄷ",), ("ㅇㅋ", "ㄹㅇ")])
+        jobs.append((tokens, mid, slang))
+
+    def expected(job):
+        tokens, mid, slang = job
+        if slang is None:
+            return JasoJamoDecoder(check_slang_mid=mid).detokenize(tokens)
+        return JasoJamoDecoder(check_slang_mid=mid, special_slang=slang).detokenize(tokens)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda job: engine.detokenize(*job), jobs))
+    assert results == [expected(job) for job in jobs]
+
+
+def test_convenience_functions_share_engine():
+    """편의 함수는 공유 엔진을 사용 (호출마다 FSM을 다시 컴파일하지 않음)"""
+    tokens = tokenize("가요ㅋㅋㅋ네")
+    detokenize(tokens)
+    misses = compile_fsm.cache_info().misses
+    for mid in (False, True) * 10:
+        detokenize(tokens, check_slang_mid=mid)
+    assert compile_fsm.cache_info().misses <= misses + 1
+    assert default_engine() is default_engine()
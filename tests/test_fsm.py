@@ -0,0 +1,60 @@
+"""
+FSM 엔진 테스트 (5단계 Fallback 엔진과 결과 일치)
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, tokenize
+
+TEXTS = [
+    "한글",
+    "가요ㅋㅋㅋ",
+    "네ㅇㅋ",
+    "넵ㅇㅋ",
+    "냉캄사",
+    "바다ㄱㄱ네요",
+    "바다ㄱㄱ",
+    "바다ㄱㄱ!가요",
+    "학ㄴ교",
+    "하ㄱㄱ",
+    "하ㄱ교",
+    "각ㅁㅊ 가ㄹㅇ",
+    "Python과 한글",
+    "값을깎다",
+    "ㄳㅏ ㄱㅏㄸ",
+]
+
+
+def test_fsm_matches_stage_engine():
+    """고정 문장에서 두 엔진 결과 일치"""
+    for mid in (False, True):
+        stage = JasoJamoDecoder(check_slang_mid=mid)
+        fsm = JasoJamoDecoder(check_slang_mid=mid, use_fsm=True)
+        for text in TEXTS:
+            tokens = tokenize(text)
+            assert fsm.detokenize(tokens) == stage.detokenize(tokens), (text, mid)
+
+
+def test_fsm_random_tokens():
+    """무작위 자소 시퀀스에서 두 엔진 결과 일치"""
+    rnd = random.Random(0)
+    alphabet = list("ㄱㄴㄷㄹㅁㅅㅇㅋㄲㅆㄳㄺㄸㅏㅓㅗㅜㅡㅣㅘㅥ !a")
+    slang = ["ㄱㄴㄷ", "ㅋㅋ", "ㅇㅋ"]
+    for mid in (False, True):
+        stage = JasoJamoDecoder(check_slang_mid=mid, special_slang=slang)
+        fsm = JasoJamoDecoder(check_slang_mid=mid, special_slang=slang, use_fsm=True)
+        for _ in range(3000):
+            tokens = [rnd.choice(alphabet) for _ in range(rnd.randint(0, 12))]
+            assert fsm.detokenize(tokens) == stage.detokenize(tokens), (tokens, mid)
+
+
+def test_fsm_multi_char_tokens():
+    """여러 글자 토큰이 섞이면 5단계 엔진으로 처리"""
+    tokens = ["ㄱ", "ㅏ", "<unk>", "ㄴ", "ㅏ"]
+    fsm = JasoJamoDecoder(use_fsm=True)
+    assert fsm.detokenize(tokens) == JasoJamoDecoder().detokenize(tokens)
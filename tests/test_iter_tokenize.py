@@ -0,0 +1,55 @@
+"""
+스트리밍 자소 분리 및 길이 제한 정책 테스트
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoTokenizer, iter_tokenize
+
+TEXT = "안녕하세요 반갑습니다! Hello 한글 ㅋㅋㅋ\n" * 10
+
+
+def flatten(chunks):
+    return [tok for chunk in chunks for tok in chunk]
+
+
+def test_iter_tokenize_sources():
+    """문자열 / 텍스트 스트림 / 문자열 iterable 입력 결과 동일"""
+    expected = JasoJamoTokenizer().tokenize(TEXT)
+    assert flatten(iter_tokenize(TEXT, chunk_size=7)) == expected
+    assert flatten(iter_tokenize(io.StringIO(TEXT), chunk_size=7)) == expected
+    assert flatten(iter_tokenize(TEXT.splitlines(keepends=True), chunk_size=7)) == expected
+
+
+def test_iter_tokenize_chunk_bound():
+    """청크 크기 제한 및 길이 제한 미적용"""
+    text = "가" * 250001
+    chunks = list(iter_tokenize(text, chunk_size=1000))
+    assert all(len(chunk) <= 2000 for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == 2 * len(text)
+
+    with pytest.raises(ValueError):
+        list(iter_tokenize(text, chunk_size=0))
+    with pytest.raises(TypeError):
+        list(iter_tokenize(io.BytesIO(b"abc")))
+
+
+def test_overflow_policies():
+    """최대 길이 초과 처리 정책"""
+    text = "가나다라마"
+    assert JasoJamoTokenizer(max_length=2).tokenize(text) == ["ㄱ", "ㅏ", "ㄴ", "ㅏ"]
+    assert len(JasoJamoTokenizer(max_length=2, on_overflow="stream").tokenize(text)) == 10
+    with pytest.raises(ValueError):
+        JasoJamoTokenizer(max_length=2, on_overflow="raise").tokenize(text)
+    with pytest.raises(ValueError):
+        JasoJamoTokenizer(on_overflow="ignore")
+
+    # 기본값: 100,000자까지 자르기 (기존 동작)
+    assert len(JasoJamoTokenizer().tokenize("a" * 100005)) == 100000
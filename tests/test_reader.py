@@ -0,0 +1,54 @@
+"""
+mmap 문장 리더 테스트
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import tokenize_batch
+from jaso_jamo.reader import iter_sentence_spans, iter_sentences, sample_sentences
+
+TEXT = "안녕하세요.  반갑습니다!\r\n가요ㅋㅋㅋ?\r\n\n값을깎다...바다ㄱㄱ\n　전각 공백　\nHello 한글"
+
+
+def write(tmp_path, text: str) -> Path:
+    path = tmp_path / "corpus.txt"
+    path.write_bytes(text.encode("utf-8"))
+    return path
+
+
+def test_matches_re_split(tmp_path):
+    """기존 로더(f.read + re.split)와 같은 문장 목록"""
+    path = write(tmp_path, TEXT)
+    with open(path, "r", encoding="utf-8") as f:
+        expected = [s.strip() for s in re.split(r"[\n.!?]+", f.read()) if s.strip()]
+    assert list(iter_sentences(path)) == expected
+
+
+def test_spans_and_empty_file(tmp_path):
+    """바이트 구간은 원본 바이트를 가리키고, 빈 파일은 문장 없음"""
+    path = write(tmp_path, TEXT)
+    data = path.read_bytes()
+    spans = list(iter_sentence_spans(path))
+    assert data[spans[0][0] : spans[0][1]].decode("utf-8") == "안녕하세요"
+
+    empty = write(tmp_path, "")
+    assert list(iter_sentences(empty)) == []
+    assert sample_sentences(empty, 3) == ([], 0)
+
+
+def test_sample_and_tokenize(tmp_path):
+    """저장소 샘플링 결과는 원본 문장의 부분집합이며 토크나이저에 바로 연결"""
+    path = write(tmp_path, "\n".join(f"문장{i}" for i in range(1000)))
+    sample, total = sample_sentences(path, 10, random.Random(0))
+    assert total == 1000 and len(sample) == 10
+    assert set(sample) <= set(iter_sentences(path))
+
+    everything, total = sample_sentences(path, 0)
+    assert len(everything) == total == 1000
+    assert next(tokenize_batch(iter_sentences(path))) == ["ㅁ", "ㅜ", "ㄴ", "ㅈ", "ㅏ", "ㅇ", "0"]
@@ -0,0 +1,128 @@
+"""
+로컬 분리/복원 서버 테스트 (JSON-lines / HTTP)
+"""
+
+import io
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, tokenize
+from jaso_jamo.serve import JasoJamoService, make_http_server, serve_stdio
+
+TEXTS = ["안녕하세요", "가요ㅋㅋㅋ네", "바다ㄱㄱ", "Python과 한글!"]
+
+# 환경 변수의 프록시 설정을 무시하는 로컬 클라이언트
+_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+
+def test_service_requests():
+    """tokenize/detokenize 요청 결과는 라이브러리 결과와 동일, 잘못된 요청은 error"""
+    with JasoJamoService() as service:
+        for i, text in enumerate(TEXTS):
+            tokens = tokenize(text)
+            assert service.call({"id": i, "op": "tokenize", "text": text}) == {
+                "id": i,
+                "tokens": tokens,
+            }
+            for mid in (False, True):
+                expected = JasoJamoDecoder(check_slang_mid=mid).detokenize(tokens)
+                request = {"op": "detokenize", "tokens": tokens, "check_slang_mid": mid}
+                assert service.call(request) == {"text": expected}
+                request["tokens"] = "".join(tokens)
+                assert service.call(request) == {"text": expected}
+
+        for bad in ([1, 2], {"op": "tokenize"}, {"op": "detokenize", "tokens": [1]}, {"op": "x"}):
+            assert "error" in service.call(bad)
+        stats = service.call({"id": "s", "op": "stats"})["stats"]
+        assert stats["requests"] == len(TEXTS) * 5 + 4
+        assert stats["errors"] == 4
+    with pytest.raises(RuntimeError):
+        service.submit({"op": "tokenize", "text": "가"})
+
+
+def test_concurrent_requests_are_batched():
+    """동시에 들어온 요청은 배치로 묶여 처리"""
+    with JasoJamoService(max_batch=16, max_delay=0.05) as service:
+        futures = [
+            service.submit({"id": i, "op": "tokenize", "text": TEXTS[i % 4]}) for i in range(40)
+        ]
+        responses = [future.result(5) for future in futures]
+        stats = service.stats.snapshot()
+    assert [r["id"] for r in responses] == list(range(40))
+    assert all(r["tokens"] == tokenize(TEXTS[i % 4]) for i, r in enumerate(responses))
+    assert stats["requests"] == 40
+    assert stats["batches"] < 40
+    assert 1 < stats["max_batch_size"] <= 16
+
+
+def test_stdio_in_order():
+    """JSON-lines: 요청 순서대로 응답, 잘못된 JSON도 한 줄 응답"""
+    lines = [json.dumps({"id": i, "op": "tokenize", "text": t}) for i, t in enumerate(TEXTS)]
+    lines += ["not json", "", json.dumps({"id": "d", "op": "detokenize", "tokens": "ㅎㅏㄴㄱㅡㄹ"})]
+    stdout = io.StringIO()
+    with JasoJamoService() as service:
+        serve_stdio(service, io.StringIO("\n".join(lines) + "\n"), stdout)
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [r.get("id") for r in responses] == [0, 1, 2, 3, None, "d"]
+    assert "error" in responses[4]
+    assert responses[5]["text"] == "한글"
+
+
+@pytest.fixture
+def http_server():
+    service = JasoJamoService()
+    server = make_http_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def _post(url, payload):
+    data = json.dumps(payload).encode("utf-8") if not isinstance(payload, bytes) else payload
+    try:
+        with _OPENER.open(urllib.request.Request(url, data=data), timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_http(http_server):
+    """HTTP 엔드포인트: 분리/복원, 오류 코드, 카운터"""
+    assert _post(http_server + "/tokenize", {"text": "한글"}) == (
+        200,
+        {"tokens": ["ㅎ", "ㅏ", "ㄴ", "ㄱ", "ㅡ", "ㄹ"]},
+    )
+    assert _post(http_server + "/detokenize", {"id": 7, "tokens": "ㄱㅏㅇㅛㅋㅋㅋ"}) == (
+        200,
+        {"id": 7, "text": "가요ㅋㅋㅋ"},
+    )
+    assert _post(http_server + "/", {"op": "tokenize", "text": "가"})[0] == 200
+    assert _post(http_server + "/tokenize", {"text": 1})[0] == 400
+    assert _post(http_server + "/tokenize", b"{")[0] == 400
+    assert _post(http_server + "/nope", {})[0] == 404
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(lambda t: _post(http_server + "/tokenize", {"text": t}), TEXTS * 10)
+        )
+    assert [body["tokens"] for _, body in results] == [tokenize(t) for t in TEXTS * 10]
+
+    with _OPENER.open(http_server + "/stats", timeout=5) as response:
+        stats = json.loads(response.read())["stats"]
+    assert stats["requests"] == 44
+    assert stats["errors"] == 1
+    assert stats["latency_ms"]["p50"] > 0
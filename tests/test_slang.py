@@ -0,0 +1,152 @@
+"""
+반복 자소 슬랭 트라이 테스트
+"""
+
+import random
+import sys
+import threading
+import warnings
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, JasoJamoTokenizer, tokenize
+from jaso_jamo.slang import SlangLexicon, SlangTrie, load_slang_file
+from jaso_jamo.tables import get_jamo_tables
+
+CONSONANTS = "ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎ"
+
+
+def test_match_window_equals_join():
+    """match_window는 "".join(창) in 목록과 동일"""
+    rnd = random.Random(0)
+    entries = [
+        "".join(rnd.choice(CONSONANTS) for _ in range(rnd.randint(1, 5))) for _ in range(300)
+    ]
+    trie = SlangTrie(entries + ["", None, 3])
+    for _ in range(3000):
+        tokens = [rnd.choice(CONSONANTS) for _ in range(6)]
+        start = rnd.randint(0, 5)
+        end = rnd.randint(start, 6)
+        assert trie.match_window(tokens, start, end) == ("".join(tokens[start:end]) in entries)
+
+
+def test_any_length_matches():
+    """길이 제한 없는 항목: 모든 일치 길이 / 최장 일치"""
+    trie = SlangTrie(["ㅆㅅ", "ㅆㅅㅌㅊ", "ㅇㅋ", "ㅇㅋ"])
+    tokens = ["ㅆ", "ㅅ", "ㅌ", "ㅊ", "ㅇ", "ㅋ"]
+    assert list(trie.iter_matches(tokens, 0)) == [2, 4]
+    assert trie.longest_match(tokens, 0) == 4
+    assert trie.longest_match(tokens, 0, 3) == 2
+    assert trie.longest_match(tokens, 1) == 0
+    assert len(trie) == 3 and "ㅇㅋ" in trie and "ㅇ" not in trie
+    assert not trie.match_window(["ㅇ", None], 0, 2)
+
+
+def test_decoder_with_large_lexicon():
+    """큰 사전에서도 목록 비교와 같은 결과, 재대입 시 트라이 갱신"""
+    rnd = random.Random(1)
+    lexicon = list(
+        {"".join(rnd.choice(CONSONANTS) for _ in range(rnd.choice([2, 3]))) for _ in range(2000)}
+    )
+    decoder = JasoJamoDecoder(special_slang=lexicon)
+    for _ in range(500):
+        tail = "".join(rnd.choice(CONSONANTS) for _ in range(3))
+        tokens = tokenize("가" + tail)
+        if len(set(tail)) == 1:
+            # 동일 자음 3개 반복은 사전보다 먼저 처리
+            continue
+        if tail in lexicon:
+            expected = "가" + tail
+        elif tail[1:] in lexicon:
+            # "가" + 종성 (종성으로 쓸 수 없는 자음은 종성 없음)
+            jong = get_jamo_tables().JONG_MAP.get(tail[0], 0)
+            expected = chr(ord("가") + jong) + tail[1:]
+        else:
+            continue
+        assert decoder.detokenize(tokens) == expected, tail
+
+    decoder.SPECIAL_SLANG = ["ㄱㄴㄷ"]
+    assert decoder.detokenize(tokenize("가ㄱㄴㄷ")) == "가ㄱㄴㄷ"
+    decoder.SPECIAL_SLANG = []
+    assert decoder.detokenize(tokenize("가ㄱㄴㄷ")) == "각ㄴㄷ"
+
+
+def test_tokenizer_special_slang_deprecated():
+    """JasoJamoTokenizer의 special_slang은 사용되지 않으며 넘기면 DeprecationWarning"""
+    with pytest.warns(DeprecationWarning):
+        tokenizer = JasoJamoTokenizer(special_slang=["ㄱㄴㄷ"])
+    assert tokenizer.SPECIAL_SLANG == ["ㄱㄴㄷ"]
+    assert tokenizer.tokenize("가ㄱㄴㄷ") == tokenize("가ㄱㄴㄷ")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        JasoJamoTokenizer()
+
+
+def test_load_slang_file(tmp_path):
+    """한 줄에 한 항목 / JSON 배열 / JSON 객체"""
+    lines = tmp_path / "slang.txt"
+    lines.write_text("# 주석\nㅇㅋ\n\n  ㄹㅇ  \n", encoding="utf-8")
+    assert load_slang_file(lines) == ["ㅇㅋ", "ㄹㅇ"]
+
+    array = tmp_path / "slang.json"
+    array.write_text('["ㅇㅋ", "ㄱㅅ"]', encoding="utf-8")
+    assert load_slang_file(array) == ["ㅇㅋ", "ㄱㅅ"]
+
+    obj = tmp_path / "slang_obj.json"
+    obj.write_text('{"special_slang": ["ㅁㅊ"]}', encoding="utf-8")
+    assert load_slang_file(obj) == ["ㅁㅊ"]
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("[1, 2]", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_slang_file(bad)
+
+
+def test_lexicon_reload_without_rebuilding_decoders(tmp_path):
+    """사전 교체가 공유 디코더(캐시 포함)에 바로 반영"""
+    path = tmp_path / "slang.txt"
+    path.write_text("ㄱㄴㄷ\n", encoding="utf-8")
+    lexicon = SlangLexicon.from_file(path)
+    decoders = [
+        JasoJamoDecoder(special_slang=lexicon),
+        JasoJamoDecoder(special_slang=lexicon, use_fsm=True),
+        JasoJamoDecoder(special_slang=lexicon, cache_size=8),
+    ]
+    tokens = tokenize("가ㄱㄴㄷ")
+    assert [d.detokenize(tokens) for d in decoders] == ["가ㄱㄴㄷ"] * 3
+
+    path.write_text("ㅇㅋ\n", encoding="utf-8")
+    old = lexicon.trie
+    assert lexicon.reload() is lexicon.trie is not old
+    assert [d.detokenize(tokens) for d in decoders] == ["각ㄴㄷ"] * 3
+    assert list(lexicon) == ["ㅇㅋ"] and decoders[0].SPECIAL_SLANG is lexicon
+
+    with pytest.raises(ValueError):
+        SlangLexicon([]).reload()
+
+
+def test_lexicon_swap_during_decoding():
+    """복원 도중 사전을 교체해도 각 호출은 이전 또는 새 사전 중 하나의 결과"""
+    lexicon = SlangLexicon(["ㄱㄴㄷ"])
+    decoder = JasoJamoDecoder(special_slang=lexicon)
+    tokens = tokenize("가ㄱㄴㄷ " * 50 + "가ㄱㄴㄷ")
+    with_slang = JasoJamoDecoder(special_slang=["ㄱㄴㄷ"]).detokenize(tokens)
+    without = JasoJamoDecoder(special_slang=[]).detokenize(tokens)
+    results = []
+
+    def worker():
+        for _ in range(200):
+            results.append(decoder.detokenize(tokens))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for i in range(200):
+        lexicon.swap(["ㄱㄴㄷ"] if i % 2 else [])
+    for t in threads:
+        t.join()
+    assert set(results) <= {with_slang, without}
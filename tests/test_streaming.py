@@ -0,0 +1,65 @@
+"""
+스트리밍 복원기 테스트
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, StreamingJasoJamoDecoder, tokenize
+
+TEXTS = [
+    "안녕하세요 반갑습니다",
+    "가요ㅋㅋㅋ",
+    "바다ㄱㄱ",
+    "바다ㄱㄱ네요",
+    "네ㅇㅋ 좋아요",
+    "Python으로 개발했어요!",
+    "값을깎다 꽃이없다",
+]
+
+
+def feed_in_chunks(decoder, tokens, rnd):
+    """무작위 크기로 나누어 feed 후 flush"""
+    out = []
+    i = 0
+    while i < len(tokens):
+        size = rnd.randint(0, 4)
+        out.append(decoder.feed(tokens[i : i + size]))
+        i += size
+    out.append(decoder.flush())
+    return "".join(out)
+
+
+def test_streaming_matches_batch():
+    """조각 단위 입력 결과가 일괄 복원 결과와 동일"""
+    rnd = random.Random(0)
+    for mid in (False, True):
+        batch = JasoJamoDecoder(check_slang_mid=mid)
+        stream = StreamingJasoJamoDecoder(check_slang_mid=mid)
+        for text in TEXTS:
+            tokens = tokenize(text)
+            for _ in range(20):
+                assert feed_in_chunks(stream, tokens, rnd) == batch.detokenize(tokens)
+
+
+def test_streaming_emits_early():
+    """어절 경계가 보이면 확정된 음절을 바로 출력"""
+    stream = StreamingJasoJamoDecoder()
+    assert stream.feed(tokenize("한")) == ""
+    assert stream.feed(tokenize("글 ")) == "한글 "
+    assert stream.feed(tokenize("안녕하세요")) == "안녕하"
+    assert stream.flush() == "세요"
+    assert stream.flush() == ""
+
+
+def test_streaming_pending_is_bounded():
+    """보류 토큰 수가 스트림 길이와 무관하게 선행 탐색 창 이내"""
+    stream = StreamingJasoJamoDecoder()
+    tokens = tokenize("가나다라마바사아자차카타파하" * 50)
+    for tok in tokens:
+        stream.feed([tok])
+        assert len(stream._pending) <= 5
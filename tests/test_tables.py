@@ -0,0 +1,120 @@
+"""
+공유 자모 테이블 테스트
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, JasoJamoTokenizer
+from jaso_jamo.tables import JAMO_TABLES, get_jamo_tables
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_tables_are_shared():
+    """인스턴스가 테이블을 복사하지 않고 공유하는지 확인"""
+    t1, t2 = JasoJamoTokenizer(), JasoJamoTokenizer()
+    d1, d2 = JasoJamoDecoder(), JasoJamoDecoder(check_slang_mid=True)
+
+    assert t1.CHO is t2.CHO is JAMO_TABLES.CHO
+    assert d1.CONSONANTS is d2.CONSONANTS is JAMO_TABLES.CONSONANTS
+    assert d1.JONG_MAP is d2.JONG_MAP
+    # 인스턴스에는 __dict__ 없이 설정값 슬롯만 있음
+    assert not hasattr(t1, "__dict__") and not hasattr(d1, "__dict__")
+    assert set(JasoJamoTokenizer.__slots__) == {
+        "SPECIAL_SLANG",
+        "max_length",
+        "on_overflow",
+        "_word_cache",
+    }
+    assert set(JasoJamoDecoder.__slots__) == {
+        "_special_slang",
+        "_lexicon",
+        "_cache_trie",
+        "_check_slang_mid",
+        "use_fsm",
+        "use_numpy",
+        "_word_cache",
+    }
+    # 같은 슬랭 목록의 트라이는 디코더끼리 공유
+    assert d1._lexicon.trie is d2._lexicon.trie
+    assert JasoJamoDecoder(special_slang=["ㅇㅋ"])._lexicon.trie is (
+        JasoJamoDecoder(special_slang=("ㅇㅋ",))._lexicon.trie
+    )
+
+
+def test_table_contents():
+    """테이블 크기 및 구성"""
+    assert len(JAMO_TABLES.CHO) == 19
+    assert len(JAMO_TABLES.JUNG) == 21
+    assert len(JAMO_TABLES.JONG) == 28
+    assert JAMO_TABLES.JONG[0] == ""
+    assert "" not in JAMO_TABLES.JONG_SET
+    assert JAMO_TABLES.CONSONANTS == JAMO_TABLES.CHO_SET | JAMO_TABLES.JONG_SET
+    assert isinstance(JAMO_TABLES.CHO, tuple)
+    assert isinstance(JAMO_TABLES.CONSONANTS, frozenset)
+
+
+def test_jaso_class():
+    """호환 자모 분류 코드"""
+    from jaso_jamo.tables import (
+        JASO_CLASS,
+        JASO_CONSONANT,
+        JASO_NONE,
+        JASO_OTHER,
+        JASO_VOWEL,
+    )
+
+    for code in range(0x3100, 0x31A0):
+        char = chr(code)
+        cls = JASO_CLASS.get(char, JASO_NONE)
+        assert (cls == JASO_CONSONANT) == (char in JAMO_TABLES.CONSONANTS)
+        assert (cls == JASO_VOWEL) == (char in JAMO_TABLES.JUNG_SET)
+        assert (cls != JASO_NONE) == (0x3131 <= code <= 0x318E)
+    assert JASO_CLASS["ㅥ"] == JASO_OTHER
+    assert JASO_CLASS.get("a", JASO_NONE) == JASO_NONE
+
+
+def test_import_builds_no_tables():
+    """import jaso_jamo는 테이블을 만들지 않고 무거운 모듈을 가져오지 않음 (새 프로세스)"""
+    code = (
+        "import sys, jaso_jamo\n"
+        "from jaso_jamo import tables\n"
+        "assert tables._TABLES is None\n"
+        "heavy = {'asyncio', 'concurrent.futures', 'json', 'pathlib'} & set(sys.modules)\n"
+        "assert not heavy, heavy\n"
+        "assert jaso_jamo.detokenize(jaso_jamo.tokenize('한글')) == '한글'\n"
+        "assert tables._TABLES is not None\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=str(ROOT), check=True)
+
+
+def test_lazy_classes():
+    """JasoJamoEngine은 처음 접근할 때 가져오고, 하위 모듈을 import해도 패키지 속성은 클래스"""
+    code = (
+        "import sys, jaso_jamo\n"
+        "assert 'jaso_jamo.engine' not in sys.modules\n"
+        "import jaso_jamo.StreamingJasoJamoDecoder\n"
+        "from jaso_jamo.AsyncJasoJamoDecoder import AsyncJasoJamoDecoder\n"
+        "assert jaso_jamo.AsyncJasoJamoDecoder is AsyncJasoJamoDecoder\n"
+        "assert isinstance(jaso_jamo.StreamingJasoJamoDecoder, type)\n"
+        "jaso_jamo.detokenize(jaso_jamo.tokenize('한글'))\n"
+        "assert isinstance(jaso_jamo.JasoJamoDecoder, type)\n"
+        "from jaso_jamo.core import JasoJamoDecoder\n"
+        "assert JasoJamoDecoder is jaso_jamo.JasoJamoDecoder\n"
+        "ns = {}\n"
+        "exec('from jaso_jamo import *', ns)\n"
+        "assert ns['JasoJamoEngine'] is jaso_jamo.engine.JasoJamoEngine\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=str(ROOT), check=True)
+
+
+def test_lazy_tables_identity():
+    """지연 생성된 테이블은 하나의 객체를 공유"""
+    assert get_jamo_tables() is JAMO_TABLES
+    assert JasoJamoDecoder.CHO_MAP is JAMO_TABLES.CHO_MAP
+    assert JasoJamoTokenizer.JONG is JAMO_TABLES.JONG
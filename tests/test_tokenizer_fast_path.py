@@ -0,0 +1,56 @@
+"""
+자소 분리 고속 경로 테스트
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoTokenizer
+from jaso_jamo.tables import CHO, JONG, JUNG
+
+
+def decompose(char):
+    """기준 구현: 한글 음절 한 글자를 산술로 분해 (음절이 아니면 그대로)"""
+    code = ord(char) - 0xAC00
+    if not 0 <= code < 11172:
+        return [char]
+    jong_idx = code % 28
+    jung_idx = (code // 28) % 21
+    cho_idx = code // 28 // 21
+    jamos = [CHO[cho_idx], JUNG[jung_idx]]
+    if jong_idx > 0:
+        jamos.append(JONG[jong_idx])
+    return jamos
+
+
+def test_syllable_table_matches_decompose():
+    """전체 11,172 음절의 테이블 분해 결과가 산술 분해와 동일한지 확인"""
+    tokenizer = JasoJamoTokenizer()
+    text = "".join(chr(code) for code in range(0xAC00, 0xD7A4))
+
+    expected = []
+    for char in text:
+        expected.extend(decompose(char))
+
+    assert tokenizer.tokenize(text) == expected
+
+
+def test_mixed_text():
+    """한글/비한글 혼합 텍스트"""
+    tokenizer = JasoJamoTokenizer()
+    assert tokenizer.tokenize("값 a1ㅋ!") == ["ㄱ", "ㅏ", "ㅄ", " ", "a", "1", "ㅋ", "!"]
+    assert tokenizer.tokenize("") == []
+    assert tokenizer.tokenize(None) == []
+
+
+def test_tokenize_to_str():
+    """문자열 고속 경로와 리스트 API 일치 확인"""
+    tokenizer = JasoJamoTokenizer()
+    for text in ["한글", "Hello 안녕!", "ㅋㅋㅋ 닭값", "😀가"]:
+        jamo = tokenizer.tokenize_to_str(text)
+        assert list(jamo) == tokenizer.tokenize(text)
+    assert tokenizer.tokenize_to_str("한글") == "ㅎㅏㄴㄱㅡㄹ"
+    assert tokenizer.tokenize_to_str(None) == ""
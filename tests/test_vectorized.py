@@ -0,0 +1,95 @@
+"""
+NumPy 벡터화 자소 분리 테스트
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, JasoJamoTokenizer, vectorized  # noqa: E402
+
+TEXTS = [
+    "",
+    "한글",
+    "가요ㅋㅋㅋ",
+    "Python으로 개발했어요",
+    "값을 깎다, 읽었다!",
+    "😀 이모지\n줄바꿈\t탭",
+    "ㅥ 옛자모 ㄳ",
+]
+
+
+def test_matches_tokenizer():
+    """decompose_text 결과가 tokenize_to_str과 동일"""
+    tokenizer = JasoJamoTokenizer()
+    for text in TEXTS:
+        assert vectorized.decompose_text(text) == tokenizer.tokenize_to_str(text)
+
+
+def test_all_syllables():
+    """완성형 음절 11,172자 전체"""
+    text = "".join(chr(code) for code in range(0xAC00, 0xAC00 + 11172))
+    tokenizer = JasoJamoTokenizer(max_length=len(text))
+    assert vectorized.decompose_text(text) == tokenizer.tokenize_to_str(text)
+
+
+def test_decompose_indices():
+    """인덱스 계산은 code % 28, code // 28 산술과 동일"""
+    codes = vectorized.str_to_codepoints("각A힣")
+    is_syllable, cho, jung, jong = vectorized.decompose_indices(codes)
+    assert is_syllable.tolist() == [True, False, True]
+    assert (cho[0], jung[0], jong[0]) == (0, 0, 1)
+    assert (cho[2], jung[2], jong[2]) == (18, 20, 27)
+
+
+def test_codepoint_roundtrip():
+    """코드 포인트 배열 왕복 (서로게이트 포함)"""
+    text = "한\ud800글"
+    codes = vectorized.str_to_codepoints(text)
+    assert codes.dtype == np.dtype("<u4")
+    assert vectorized.codepoints_to_str(codes) == text
+
+
+def test_recompose_matches_stage_engine():
+    """NumPy 복원 엔진이 5단계 Fallback 엔진과 결과 일치"""
+    texts = TEXTS + ["네ㅇㅋ", "바다ㄱㄱ네요", "바다ㄱㄱ", "학ㄴ교", "각ㅁㅊ 가ㄹㅇ", "ㄳㅏ ㄱㅏㄸ"]
+    slang = tuple(JasoJamoDecoder().SPECIAL_SLANG)
+    for mid in (False, True):
+        stage = JasoJamoDecoder(check_slang_mid=mid)
+        for text in texts:
+            tokens = JasoJamoTokenizer().tokenize(text)
+            expected = stage.detokenize(tokens)
+            assert vectorized.recompose_text("".join(tokens), slang, mid) == expected, (text, mid)
+
+
+def test_recompose_random_tokens():
+    """무작위 자소 시퀀스 (사용자 슬랭 목록 포함)"""
+    rnd = random.Random(0)
+    alphabet = list("ㄱㄴㄷㄹㅁㅅㅇㅋㄲㅆㄳㄺㄸㅏㅓㅗㅜㅡㅣㅘㅥ !a")
+    for slang in (["ㄱㄴㄷ", "ㅋㅋ", "ㅇㅋ"], []):
+        for mid in (False, True):
+            stage = JasoJamoDecoder(check_slang_mid=mid, special_slang=slang)
+            for _ in range(3000):
+                tokens = [rnd.choice(alphabet) for _ in range(rnd.randint(0, 12))]
+                fast = vectorized.recompose_text("".join(tokens), tuple(slang), mid)
+                assert fast == stage.detokenize(tokens), (tokens, mid)
+
+
+def test_use_numpy_decoder():
+    """use_numpy=True 디코더: 긴 입력, 여러 글자 토큰, 정수 ID 입력"""
+    fast = JasoJamoDecoder(use_numpy=True)
+    text = "가요ㅋㅋㅋ 값을깎다 바다ㄱㄱ 네ㅇㅋ " * 50
+    tokens = JasoJamoTokenizer().tokenize(text)
+    expected = JasoJamoDecoder().detokenize(tokens)
+    assert fast.detokenize(tokens) == expected
+    assert fast.decode_ids(JasoJamoTokenizer().encode(text)) == expected
+
+    tokens = ["ㄱ", "ㅏ", "<unk>", "ㄴ", "ㅏ"] * 100
+    assert fast.detokenize(tokens) == JasoJamoDecoder().detokenize(tokens)
@@ -0,0 +1,121 @@
+"""
+어절 LRU 캐시 테스트
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jaso_jamo import JasoJamoDecoder, JasoJamoTokenizer, tokenize
+from jaso_jamo.cache import CacheInfo, LRUCache
+
+TEXTS = [
+    "ㅋㅋㅋ 감사합니다 ㅇㅋ",
+    "바다ㄱㄱ 바다ㄱㄱ",
+    "하ㄱㄱ 하ㄱㄱ",
+    "가요ㅋㅋㅋ!가요ㅋㅋㅋ",
+    "네ㅇㅋ 네ㅇㅋ",
+    "Python과 한글",
+]
+
+
+def test_lru_eviction():
+    """최대 크기를 넘으면 가장 오래 사용하지 않은 항목 제거"""
+    cache = LRUCache(2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"
+    cache.put("c", "3")
+    assert cache.get("b") is None
+    info = cache.info()
+    assert info[:5] == (1, 1, 2, 2, 1)
+    assert info.memory > 0
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_cached_matches_uncached():
+    """캐시 사용 여부와 관계없이 결과 동일 (입력 끝 어절 포함)"""
+    for mid in (False, True):
+        plain = JasoJamoDecoder(check_slang_mid=mid)
+        cached = JasoJamoDecoder(check_slang_mid=mid, cache_size=8)
+        for text in TEXTS:
+            tokens = tokenize(text)
+            assert cached.detokenize(tokens) == plain.detokenize(tokens), (text, mid)
+            assert cached.detokenize(tuple(tokens)) == plain.detokenize(tokens), (text, mid)
+
+
+def test_check_slang_mid_change_clears_cache():
+    """캐시가 채워진 디코더의 check_slang_mid를 바꾸면 새 옵션 기준으로 복원"""
+    tokens = tokenize("가요ㅋㅋㅋ네")
+    for before, after in ((False, True), (True, False)):
+        decoder = JasoJamoDecoder(check_slang_mid=before, cache_size=8)
+        decoder.detokenize(tokens)
+        decoder.detokenize(tokens[:3] + [" "] + tokens[3:])
+        assert decoder.cache_info().currsize > 0
+        decoder.check_slang_mid = after
+        assert decoder.cache_info().currsize == 0
+        fresh = JasoJamoDecoder(check_slang_mid=after)
+        assert decoder.detokenize(tokens) == fresh.detokenize(tokens)
+
+
+def test_cached_random_and_multi_char_tokens():
+    """무작위 시퀀스, 여러 글자 토큰 혼합에서도 결과 동일"""
+    rnd = random.Random(0)
+    alphabet = list("ㄱㄴㄷㅋㅇㄲㄳㄸㅏㅓㅗㅡㅣㅥ !") + ["<unk>", ""]
+    plain = JasoJamoDecoder(special_slang=["ㄱㄴㄷ", "ㅇㅋ"])
+    cached = JasoJamoDecoder(special_slang=["ㄱㄴㄷ", "ㅇㅋ"], cache_size=4)
+    for _ in range(3000):
+        tokens = [rnd.choice(alphabet) for _ in range(rnd.randint(0, 12))]
+        assert cached.detokenize(tokens) == plain.detokenize(tokens), tokens
+
+
+def test_cache_info_counts_words():
+    """반복 어절은 캐시 적중"""
+    decoder = JasoJamoDecoder(cache_size=16)
+    assert JasoJamoDecoder().cache_info() == CacheInfo(0, 0, 0, 0, 0, 0)
+    decoder.detokenize(tokenize("ㅋㅋㅋ ㅋㅋㅋ ㅋㅋㅋ"))
+    info = decoder.cache_info()
+    # 중간 어절 1종 + 입력 끝 어절 1종
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+    decoder.cache_clear()
+    assert decoder.cache_info()[:5] == (0, 0, 16, 0, 0)
+
+
+def test_non_str_tokens_still_raise():
+    """문자열이 아닌 토큰은 캐시 사용 시에도 TypeError"""
+    with pytest.raises(TypeError):
+        JasoJamoDecoder(cache_size=4).detokenize(["ㄱ", 1])
+
+
+def test_tokenizer_cache_matches_tokenize():
+    """토크나이저 어절 캐시: 결과 동일, 공백 조각 보존, 길이 제한 적용"""
+    plain = JasoJamoTokenizer()
+    cached = JasoJamoTokenizer(cache_size=4)
+    texts = TEXTS + ["  앞뒤 공백\t탭\n줄바꿈  ", "", "한" * 100, "😀 ㅥ　전각"]
+    for text in texts * 2:
+        assert cached.tokenize(text) == plain.tokenize(text), text
+    assert cached.tokenize(None) == []
+
+    limited = JasoJamoTokenizer(max_length=3, cache_size=4)
+    assert limited.tokenize("한글 자소") == JasoJamoTokenizer(max_length=3).tokenize("한글 자소")
+
+
+def test_tokenizer_cache_info():
+    """적중/실패/제거 횟수와 메모리 추정치"""
+    assert JasoJamoTokenizer().cache_info() == CacheInfo(0, 0, 0, 0, 0, 0)
+    tokenizer = JasoJamoTokenizer(cache_size=2)
+    tokenizer.tokenize("ㅋㅋㅋ ㅋㅋㅋ")
+    info = tokenizer.cache_info()
+    # "ㅋㅋㅋ" 실패 → " " 실패 → "ㅋㅋㅋ" 적중
+    assert (info.hits, info.misses, info.currsize, info.evictions) == (1, 2, 2, 0)
+    assert info.memory > 0
+    tokenizer.tokenize("감사합니다")
+    assert tokenizer.cache_info().evictions == 1
+    tokenizer.cache_clear()
+    assert tokenizer.cache_info()[:5] == (0, 0, 2, 0, 0)